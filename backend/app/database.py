@@ -1,7 +1,9 @@
 """SQLite database operations for FAA aircraft lookup."""
 
 import sqlite3
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from app.models import AircraftResponse, StatsResponse
 
@@ -34,55 +36,99 @@ ENGINE_TYPES = {
     "11": "Rotary",
 }
 
+# Lookups are cached for the life of the connection. update_faa_data.py writes
+# a fresh database file, which an already-open connection never sees, so cached
+# results cannot go stale before a restart picks the new data up.
+LOOKUP_CACHE_SIZE = 10000
+
+# The stats back /api/v1/health, so keep them briefly rather than count the
+# master table on every health check.
+STATS_CACHE_TTL = 5.0
+
+# Upper bound for SQLite's memory-mapped I/O. The FAA database is a few tens
+# of MB, so it is read straight from the OS page cache, which every worker
+# process shares, instead of being copied through SQLite's own page cache.
+MMAP_SIZE = 256 * 1024 * 1024
+
+_LOOKUP_SQL = """
+    SELECT
+        m.n_number,
+        m.mfr_mdl_code,
+        m.type_aircraft,
+        m.type_engine,
+        COALESCE(a.no_eng, m.no_eng) as no_eng,
+        COALESCE(a.no_seats, m.no_seats) as no_seats,
+        m.year_mfr,
+        a.mfr AS manufacturer,
+        a.model,
+        a.series
+    FROM master m
+    LEFT JOIN acftref a ON m.mfr_mdl_code = a.code
+"""
+
+
+def _row_to_aircraft(row: sqlite3.Row) -> AircraftResponse:
+    """Build an AircraftResponse from a row selected by _LOOKUP_SQL."""
+    return AircraftResponse(
+        tail_number=f"N{row['n_number']}",
+        manufacturer=row["manufacturer"] or "Unknown",
+        model=row["model"] or "Unknown",
+        series=row["series"] or None,
+        aircraft_type=AIRCRAFT_TYPES.get(str(row["type_aircraft"]), "Unknown"),
+        engine_type=ENGINE_TYPES.get(str(row["type_engine"]), "Unknown"),
+        num_engines=int(row["no_eng"]) if row["no_eng"] else None,
+        num_seats=int(row["no_seats"]) if row["no_seats"] else None,
+        year_mfr=int(row["year_mfr"]) if row["year_mfr"] else None,
+    )
+
 
 class Database:
     def __init__(self, db_path: str):
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        self.conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        self._lookup_cache: "OrderedDict[str, Optional[AircraftResponse]]" = OrderedDict()
+        self._stats_cache: Optional[Tuple[float, StatsResponse]] = None
 
     def close(self):
         self.conn.close()
 
     def lookup(self, n_number: str) -> Optional[AircraftResponse]:
         """Lookup aircraft by N-number (without 'N' prefix)."""
-        cursor = self.conn.execute(
-            """
-            SELECT
-                m.n_number,
-                m.mfr_mdl_code,
-                m.type_aircraft,
-                m.type_engine,
-                COALESCE(a.no_eng, m.no_eng) as no_eng,
-                COALESCE(a.no_seats, m.no_seats) as no_seats,
-                m.year_mfr,
-                a.mfr AS manufacturer,
-                a.model,
-                a.series
-            FROM master m
-            LEFT JOIN acftref a ON m.mfr_mdl_code = a.code
-            WHERE m.n_number = ?
-        """,
-            (n_number,),
-        )
+        if n_number in self._lookup_cache:
+            self._lookup_cache.move_to_end(n_number)
+            return self._lookup_cache[n_number]
 
+        cursor = self.conn.execute(_LOOKUP_SQL + "WHERE m.n_number = ?", (n_number,))
         row = cursor.fetchone()
-        if not row:
-            return None
-
-        return AircraftResponse(
-            tail_number=f"N{row['n_number']}",
-            manufacturer=row["manufacturer"] or "Unknown",
-            model=row["model"] or "Unknown",
-            series=row["series"] or None,
-            aircraft_type=AIRCRAFT_TYPES.get(str(row["type_aircraft"]), "Unknown"),
-            engine_type=ENGINE_TYPES.get(str(row["type_engine"]), "Unknown"),
-            num_engines=int(row["no_eng"]) if row["no_eng"] else None,
-            num_seats=int(row["no_seats"]) if row["no_seats"] else None,
-            year_mfr=int(row["year_mfr"]) if row["year_mfr"] else None,
-        )
+        aircraft = _row_to_aircraft(row) if row else None
+
+        self._lookup_cache[n_number] = aircraft
+        if len(self._lookup_cache) > LOOKUP_CACHE_SIZE:
+            self._lookup_cache.popitem(last=False)
+        return aircraft
+
+    def bulk_lookup(self, n_numbers: List[str]) -> Dict[str, AircraftResponse]:
+        """
+        Lookup several aircraft by N-number (without 'N' prefix) in one query.
+
+        Returns a dict keyed by the N-numbers that were found.
+        """
+        unique = list(dict.fromkeys(n_numbers))
+        if not unique:
+            return {}
+
+        placeholders = ", ".join("?" * len(unique))
+        cursor = self.conn.execute(_LOOKUP_SQL + f"WHERE m.n_number IN ({placeholders})", unique)
+
+        return {row["n_number"]: _row_to_aircraft(row) for row in cursor.fetchall()}
 
     def get_stats(self) -> StatsResponse:
-        """Get database statistics."""
+        """Get database statistics, cached for STATS_CACHE_TTL seconds."""
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache[0] < STATS_CACHE_TTL:
+            return self._stats_cache[1]
+
         cursor = self.conn.execute("SELECT COUNT(*) as cnt FROM master")
         count = cursor.fetchone()["cnt"]
 
@@ -90,4 +136,6 @@ class Database:
         row = cursor.fetchone()
         last_updated = row["value"] if row else None
 
-        return StatsResponse(record_count=count, last_updated=last_updated)
+        stats = StatsResponse(record_count=count, last_updated=last_updated)
+        self._stats_cache = (now, stats)
+        return stats
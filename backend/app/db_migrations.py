@@ -1,436 +1,541 @@
 """Database migrations and schema verification.
 
-This module ensures the database schema is always up-to-date by checking
-for missing tables, columns, and indexes on startup.
+This module ensures the database schema is always up-to-date on startup.
+Migrations are an ordered list of idempotent DDL steps (``IF NOT EXISTS``
+everywhere), so no catalog probing is needed before applying them. The
+highest applied version is recorded in ``schema_migrations``; later startups
+only need a single version lookup to see that nothing is pending.
 """
 
+import asyncio
+import copy
 import logging
-from typing import List
+import re
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import asyncpg
 
 logger = logging.getLogger(__name__)
 
+# Ordered (version, description, DDL) migration steps. Every statement must be
+# safe to re-run, since a database created from infrastructure/init.sql starts
+# without any recorded version. Append new steps with the next version number.
+_MIGRATIONS: List[Tuple[int, str, str]] = [
+    (
+        1,
+        "Created expense_budget_links table with indexes",
+        """
+        CREATE TABLE IF NOT EXISTS expense_budget_links (
+            id SERIAL PRIMARY KEY,
+            expense_id INTEGER REFERENCES expenses(id) ON DELETE CASCADE,
+            budget_card_id INTEGER REFERENCES budget_cards(id) ON DELETE CASCADE,
+            amount DECIMAL(10,2) NOT NULL,
+            created_at TIMESTAMPTZ DEFAULT NOW(),
+            UNIQUE(expense_id, budget_card_id)
+        );
+
+        COMMENT ON TABLE expense_budget_links IS
+            'Links expenses to budget cards for tracking actual spending against budgets';
+        """,
+    ),
+    (
+        1,
+        "Added tail_number column to flights table",
+        """
+        ALTER TABLE flights ADD COLUMN IF NOT EXISTS tail_number VARCHAR(20);
+        COMMENT ON COLUMN flights.tail_number IS 'Tail number stored directly from CSV for simulator sessions';
+        """,
+    ),
+    (
+        1,
+        "Added fuel_price_per_gallon and fuel_burn_rate columns to aircraft table",
+        """
+        ALTER TABLE aircraft ADD COLUMN IF NOT EXISTS fuel_price_per_gallon NUMERIC(10,2);
+        ALTER TABLE aircraft ADD COLUMN IF NOT EXISTS fuel_burn_rate NUMERIC(10,2);
+        """,
+    ),
+    (
+        1,
+        "Added data_source and faa_last_checked columns to aircraft",
+        """
+        ALTER TABLE aircraft
+        ADD COLUMN IF NOT EXISTS data_source VARCHAR(20) DEFAULT 'manual';
+
+        ALTER TABLE aircraft
+        ADD COLUMN IF NOT EXISTS faa_last_checked TIMESTAMPTZ;
+
+        COMMENT ON COLUMN aircraft.data_source IS
+            'Source of aircraft data: faa, foreflight, or manual';
+        COMMENT ON COLUMN aircraft.faa_last_checked IS
+            'Last time FAA data was checked/refreshed';
+        """,
+    ),
+    (
+        1,
+        "Added enable_faa_lookup column to user_settings",
+        """
+        ALTER TABLE user_settings
+        ADD COLUMN IF NOT EXISTS enable_faa_lookup BOOLEAN DEFAULT true;
+
+        COMMENT ON COLUMN user_settings.enable_faa_lookup IS
+            'Enable/disable FAA aircraft lookup during imports. '
+            'If disabled, only ForeFlight data will be used.';
+        """,
+    ),
+    (
+        1,
+        "Added aircraft_id and hourly_rate_type to budget_cards",
+        """
+        ALTER TABLE budget_cards
+        ADD COLUMN IF NOT EXISTS aircraft_id INTEGER REFERENCES aircraft(id) ON DELETE SET NULL;
+
+        ALTER TABLE budget_cards
+        ADD COLUMN IF NOT EXISTS hourly_rate_type VARCHAR(10) DEFAULT 'wet';
+
+        COMMENT ON COLUMN budget_cards.aircraft_id IS
+            'Optional link to aircraft for auto-calculating training costs';
+        COMMENT ON COLUMN budget_cards.hourly_rate_type IS
+            'Which rate to use: wet or dry (when aircraft_id is set)';
+        """,
+    ),
+    (
+        1,
+        "Added training configuration columns to user_settings",
+        """
+        ALTER TABLE user_settings
+        ADD COLUMN IF NOT EXISTS training_pace_mode VARCHAR(20) DEFAULT 'manual';
+
+        ALTER TABLE user_settings
+        ADD COLUMN IF NOT EXISTS training_hours_per_week NUMERIC(10,2) DEFAULT 2.0;
+
+        ALTER TABLE user_settings
+        ADD COLUMN IF NOT EXISTS default_training_aircraft_id INTEGER REFERENCES aircraft(id) ON DELETE SET NULL;
+
+        ALTER TABLE user_settings
+        ADD COLUMN IF NOT EXISTS ground_instruction_rate NUMERIC(10,2);
+
+        ALTER TABLE user_settings
+        ADD COLUMN IF NOT EXISTS budget_buffer_percentage INTEGER DEFAULT 10;
+
+        COMMENT ON COLUMN user_settings.training_pace_mode IS
+            'How to calculate training pace: auto (from flight history) or manual (user-specified)';
+        COMMENT ON COLUMN user_settings.training_hours_per_week IS
+            'Expected training hours per week (used when training_pace_mode is manual)';
+        COMMENT ON COLUMN user_settings.default_training_aircraft_id IS
+            'Default aircraft for training cost calculations';
+        COMMENT ON COLUMN user_settings.ground_instruction_rate IS
+            'Hourly rate for ground instruction';
+        COMMENT ON COLUMN user_settings.budget_buffer_percentage IS
+            'Buffer percentage to add to budget calculations (e.g., 10 for 10% buffer)';
+        """,
+    ),
+    (
+        1,
+        "Added budget_categories column to user_settings",
+        """
+        ALTER TABLE user_settings ADD COLUMN IF NOT EXISTS budget_categories JSONB;
+        COMMENT ON COLUMN user_settings.budget_categories IS
+            'Custom budget categories defined by the user';
+        """,
+    ),
+    (
+        1,
+        "Added distance column to flights table",
+        """
+        ALTER TABLE flights ADD COLUMN IF NOT EXISTS distance NUMERIC(10,2);
+        COMMENT ON COLUMN flights.distance IS
+            'Total distance flown in nautical miles (from ForeFlight Distance field)';
+        """,
+    ),
+    (
+        1,
+        "Added unique constraint on flights.import_hash",
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT FROM pg_constraint
+                WHERE conname = 'flights_import_hash_key'
+                AND conrelid = 'flights'::regclass
+            ) THEN
+                ALTER TABLE flights ADD CONSTRAINT flights_import_hash_key UNIQUE (import_hash);
+            END IF;
+        END $$;
+        """,
+    ),
+    (
+        3,
+        "Created aircraft_flight_totals table maintained by a flights trigger",
+        """
+        CREATE TABLE IF NOT EXISTS aircraft_flight_totals (
+            aircraft_id INTEGER PRIMARY KEY REFERENCES aircraft(id) ON DELETE CASCADE,
+            total_time NUMERIC(10,2) NOT NULL DEFAULT 0,
+            simulated_flight_time NUMERIC(10,2) NOT NULL DEFAULT 0
+        );
+
+        COMMENT ON TABLE aircraft_flight_totals IS
+            'Per-aircraft sums of flights.total_time and simulated_flight_time, kept current by trigger';
+
+        CREATE OR REPLACE FUNCTION update_aircraft_flight_totals() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.aircraft_id IS NOT NULL THEN
+                UPDATE aircraft_flight_totals
+                SET total_time = total_time - COALESCE(OLD.total_time, 0),
+                    simulated_flight_time = simulated_flight_time - COALESCE(OLD.simulated_flight_time, 0)
+                WHERE aircraft_id = OLD.aircraft_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.aircraft_id IS NOT NULL THEN
+                INSERT INTO aircraft_flight_totals (aircraft_id, total_time, simulated_flight_time)
+                VALUES (NEW.aircraft_id, COALESCE(NEW.total_time, 0), COALESCE(NEW.simulated_flight_time, 0))
+                ON CONFLICT (aircraft_id) DO UPDATE
+                SET total_time = aircraft_flight_totals.total_time + EXCLUDED.total_time,
+                    simulated_flight_time = aircraft_flight_totals.simulated_flight_time
+                        + EXCLUDED.simulated_flight_time;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE OR REPLACE TRIGGER flights_aircraft_totals
+            AFTER INSERT OR UPDATE OF aircraft_id, total_time, simulated_flight_time OR DELETE ON flights
+            FOR EACH ROW EXECUTE FUNCTION update_aircraft_flight_totals();
+
+        -- Recompute from scratch so re-running this step always leaves exact totals
+        INSERT INTO aircraft_flight_totals (aircraft_id, total_time, simulated_flight_time)
+        SELECT aircraft_id, COALESCE(SUM(total_time), 0), COALESCE(SUM(simulated_flight_time), 0)
+        FROM flights
+        WHERE aircraft_id IS NOT NULL
+        GROUP BY aircraft_id
+        ON CONFLICT (aircraft_id) DO UPDATE
+        SET total_time = EXCLUDED.total_time, simulated_flight_time = EXCLUDED.simulated_flight_time;
+        """,
+    ),
+    (
+        4,
+        "Made flight landing counts and flags NOT NULL",
+        """
+        UPDATE flights
+        SET day_takeoffs = COALESCE(day_takeoffs, 0),
+            day_landings_full_stop = COALESCE(day_landings_full_stop, 0),
+            night_takeoffs = COALESCE(night_takeoffs, 0),
+            night_landings_full_stop = COALESCE(night_landings_full_stop, 0),
+            all_landings = COALESCE(all_landings, 0),
+            holds = COALESCE(holds, 0),
+            is_flight_review = COALESCE(is_flight_review, false),
+            is_ipc = COALESCE(is_ipc, false),
+            is_checkride = COALESCE(is_checkride, false),
+            is_simulator_session = COALESCE(is_simulator_session, false)
+        WHERE day_takeoffs IS NULL OR day_landings_full_stop IS NULL
+            OR night_takeoffs IS NULL OR night_landings_full_stop IS NULL
+            OR all_landings IS NULL OR holds IS NULL
+            OR is_flight_review IS NULL OR is_ipc IS NULL
+            OR is_checkride IS NULL OR is_simulator_session IS NULL;
+
+        ALTER TABLE flights
+            ALTER COLUMN day_takeoffs SET NOT NULL,
+            ALTER COLUMN day_landings_full_stop SET NOT NULL,
+            ALTER COLUMN night_takeoffs SET NOT NULL,
+            ALTER COLUMN night_landings_full_stop SET NOT NULL,
+            ALTER COLUMN all_landings SET NOT NULL,
+            ALTER COLUMN holds SET NOT NULL,
+            ALTER COLUMN is_flight_review SET NOT NULL,
+            ALTER COLUMN is_ipc SET NOT NULL,
+            ALTER COLUMN is_checkride SET NOT NULL,
+            ALTER COLUMN is_simulator_session SET NOT NULL;
+        """,
+    ),
+]
+
+# Index builds use CONCURRENTLY so populated tables stay writable while they
+# run. Postgres rejects CONCURRENTLY inside a transaction block, which includes
+# a multi-statement batch, so each index is sent on its own once the DDL
+# transaction above has committed.
+_INDEX_MIGRATIONS: List[Tuple[int, str, str]] = [
+    (
+        1,
+        "Created index idx_expense_budget_links_expense on expense_budget_links",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expense_budget_links_expense ON expense_budget_links(expense_id)",
+    ),
+    (
+        1,
+        "Created index idx_expense_budget_links_budget_card on expense_budget_links",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expense_budget_links_budget_card "
+        "ON expense_budget_links(budget_card_id)",
+    ),
+    (
+        1,
+        "Created index idx_budget_cards_when_date on budget_cards",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_budget_cards_when_date ON budget_cards(when_date DESC)",
+    ),
+    (
+        1,
+        "Created index idx_budget_cards_category on budget_cards",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_budget_cards_category ON budget_cards(category)",
+    ),
+    (
+        1,
+        "Created index idx_budget_cards_aircraft on budget_cards",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_budget_cards_aircraft ON budget_cards(aircraft_id)",
+    ),
+    (
+        2,
+        "Created covering index idx_flights_aircraft_times on flights",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_flights_aircraft_times "
+        "ON flights(aircraft_id) INCLUDE (total_time, simulated_flight_time)",
+    ),
+    (
+        5,
+        "Created index idx_aircraft_tail_number_upper on aircraft",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_aircraft_tail_number_upper "
+        "ON aircraft(UPPER(tail_number)) INCLUDE (id)",
+    ),
+    (
+        6,
+        "Created covering index idx_expense_budget_links_card_amount on expense_budget_links",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expense_budget_links_card_amount "
+        "ON expense_budget_links(budget_card_id) INCLUDE (amount)",
+    ),
+    (
+        6,
+        "Dropped index idx_expense_budget_links_budget_card, replaced by idx_expense_budget_links_card_amount",
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_expense_budget_links_budget_card",
+    ),
+    (
+        7,
+        "Dropped index idx_flights_aircraft_times, superseded by aircraft_flight_totals",
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_flights_aircraft_times",
+    ),
+]
+
+CURRENT_SCHEMA_VERSION = max(version for version, _, _ in _MIGRATIONS + _INDEX_MIGRATIONS)
+
+_SCHEMA_VERSION_SQL = "SELECT COALESCE(MAX(version), 0) FROM schema_migrations"
+
+_CREATE_SCHEMA_MIGRATIONS_SQL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        applied_at TIMESTAMPTZ DEFAULT NOW()
+    )
+"""
+
+# Every table, column, index and constraint in the public schema, as one array
+# of "<kind> <name>" strings. Taken before and after a migration pass so the log
+# shows which objects the idempotent DDL actually created.
+_SCHEMA_OBJECTS_SQL = """
+    SELECT array_agg(name) FROM (
+        SELECT 'table ' || table_name AS name
+        FROM information_schema.tables WHERE table_schema = 'public'
+        UNION ALL
+        SELECT 'column ' || table_name || '.' || column_name
+        FROM information_schema.columns WHERE table_schema = 'public'
+        UNION ALL
+        SELECT 'index ' || indexname
+        FROM pg_indexes WHERE schemaname = 'public'
+        UNION ALL
+        SELECT 'constraint ' || conname
+        FROM pg_constraint WHERE connamespace = 'public'::regnamespace
+    ) AS objects
+"""
+
+_RECORD_SCHEMA_VERSION_SQL = "INSERT INTO schema_migrations (version) VALUES ($1) ON CONFLICT (version) DO NOTHING"
+
+# Status readouts are cached per (function, db) for this many seconds. The
+# schema only changes when verify_and_migrate_schema applies something, which
+# clears the cache.
+_STATUS_CACHE_TTL = 30.0
+_status_cache: Dict[Tuple[str, int], Tuple[float, dict]] = {}
+
 
 async def verify_and_migrate_schema(db) -> List[str]:
     """
     Verify database schema and apply any missing migrations.
 
-    Returns a list of migration messages that were applied.
+    Borrows one pooled connection for the whole pass. Returns a list of
+    migration messages that were applied.
     """
-    migrations_applied = []
-
     async with db.acquire() as conn:
-        # Check if expense_budget_links table exists
-        result = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables
-                WHERE table_schema = 'public'
-                AND table_name = 'expense_budget_links'
-            )
-            """
-        )
-
-        if not result:
-            logger.warning("expense_budget_links table missing - creating it")
-            await conn.execute(
-                """
-                CREATE TABLE expense_budget_links (
-                    id SERIAL PRIMARY KEY,
-                    expense_id INTEGER REFERENCES expenses(id) ON DELETE CASCADE,
-                    budget_card_id INTEGER REFERENCES budget_cards(id) ON DELETE CASCADE,
-                    amount DECIMAL(10,2) NOT NULL,
-                    created_at TIMESTAMPTZ DEFAULT NOW(),
-                    UNIQUE(expense_id, budget_card_id)
-                );
-
-                CREATE INDEX idx_expense_budget_links_expense ON expense_budget_links(expense_id);
-                CREATE INDEX idx_expense_budget_links_budget_card ON expense_budget_links(budget_card_id);
-
-                COMMENT ON TABLE expense_budget_links IS
-                    'Links expenses to budget cards for tracking actual spending against budgets';
-                """
-            )
-            migrations_applied.append("Created expense_budget_links table with indexes")
-
-        # Check if flights.tail_number column exists
-        result = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = 'flights'
-                AND column_name = 'tail_number'
-            )
-            """
-        )
-
-        if not result:
-            logger.warning("flights.tail_number column missing - adding it")
-            await conn.execute(
-                """
-                ALTER TABLE flights ADD COLUMN tail_number VARCHAR(20);
-                COMMENT ON COLUMN flights.tail_number IS 'Tail number stored directly from CSV for simulator sessions';
-                """
-            )
-            migrations_applied.append("Added tail_number column to flights table")
-
-        # Check if aircraft fuel columns exist
-        fuel_price_exists = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = 'aircraft'
-                AND column_name = 'fuel_price_per_gallon'
-            )
-            """
-        )
-
-        fuel_burn_exists = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = 'aircraft'
-                AND column_name = 'fuel_burn_rate'
-            )
-            """
-        )
-
-        if not fuel_price_exists or not fuel_burn_exists:
-            logger.warning("aircraft fuel columns missing - adding them")
-            if not fuel_price_exists:
-                await conn.execute("ALTER TABLE aircraft ADD COLUMN fuel_price_per_gallon NUMERIC(10,2);")
-            if not fuel_burn_exists:
-                await conn.execute("ALTER TABLE aircraft ADD COLUMN fuel_burn_rate NUMERIC(10,2);")
-            migrations_applied.append("Added fuel_price_per_gallon and fuel_burn_rate columns to aircraft table")
-
-        # Verify critical indexes exist
-        indexes_to_check = [
-            (
-                "idx_expense_budget_links_expense",
-                "expense_budget_links",
-                "CREATE INDEX idx_expense_budget_links_expense ON expense_budget_links(expense_id)",
-            ),
-            (
-                "idx_expense_budget_links_budget_card",
-                "expense_budget_links",
-                "CREATE INDEX idx_expense_budget_links_budget_card ON expense_budget_links(budget_card_id)",
-            ),
-            (
-                "idx_budget_cards_when_date",
-                "budget_cards",
-                "CREATE INDEX idx_budget_cards_when_date ON budget_cards(when_date DESC)",
-            ),
-            (
-                "idx_budget_cards_category",
-                "budget_cards",
-                "CREATE INDEX idx_budget_cards_category ON budget_cards(category)",
-            ),
-        ]
-
-        for index_name, table_name, create_sql in indexes_to_check:
-            result = await conn.fetchval(
-                """
-                SELECT EXISTS (
-                    SELECT FROM pg_indexes
-                    WHERE schemaname = 'public'
-                    AND tablename = $1
-                    AND indexname = $2
-                )
-                """,
-                table_name,
-                index_name,
-            )
-
-            if not result:
-                logger.warning(f"Index {index_name} missing - creating it")
-                await conn.execute(create_sql)
-                migrations_applied.append(f"Created index {index_name} on {table_name}")
-
-        # Check if aircraft.data_source column exists
-        data_source_exists = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = 'aircraft'
-                AND column_name = 'data_source'
-            )
-            """
-        )
-
-        if not data_source_exists:
-            logger.warning("aircraft.data_source column missing - adding it")
-            await conn.execute(
-                """
-                ALTER TABLE aircraft
-                ADD COLUMN data_source VARCHAR(20) DEFAULT 'manual';
-
-                ALTER TABLE aircraft
-                ADD COLUMN faa_last_checked TIMESTAMPTZ;
-
-                COMMENT ON COLUMN aircraft.data_source IS
-                    'Source of aircraft data: faa, foreflight, or manual';
-                COMMENT ON COLUMN aircraft.faa_last_checked IS
-                    'Last time FAA data was checked/refreshed';
-                """
-            )
-            migrations_applied.append("Added data_source and faa_last_checked columns to aircraft")
-
-        # Check if user_settings.enable_faa_lookup column exists
-        enable_faa_lookup_exists = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = 'user_settings'
-                AND column_name = 'enable_faa_lookup'
-            )
-            """
-        )
-
-        if not enable_faa_lookup_exists:
-            logger.warning("user_settings.enable_faa_lookup column missing - adding it")
-            await conn.execute(
-                """
-                ALTER TABLE user_settings
-                ADD COLUMN enable_faa_lookup BOOLEAN DEFAULT true;
-
-                COMMENT ON COLUMN user_settings.enable_faa_lookup IS
-                    'Enable/disable FAA aircraft lookup during imports. '
-                    'If disabled, only ForeFlight data will be used.';
-                """
-            )
-            migrations_applied.append("Added enable_faa_lookup column to user_settings")
-
-        # Check if budget_cards.aircraft_id column exists
-        aircraft_id_exists = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = 'budget_cards'
-                AND column_name = 'aircraft_id'
-            )
-            """
-        )
-
-        if not aircraft_id_exists:
-            logger.warning("budget_cards.aircraft_id column missing - adding it")
-            await conn.execute(
-                """
-                ALTER TABLE budget_cards
-                ADD COLUMN aircraft_id INTEGER REFERENCES aircraft(id) ON DELETE SET NULL;
-
-                ALTER TABLE budget_cards
-                ADD COLUMN hourly_rate_type VARCHAR(10) DEFAULT 'wet';
-
-                CREATE INDEX idx_budget_cards_aircraft ON budget_cards(aircraft_id);
-
-                COMMENT ON COLUMN budget_cards.aircraft_id IS
-                    'Optional link to aircraft for auto-calculating training costs';
-                COMMENT ON COLUMN budget_cards.hourly_rate_type IS
-                    'Which rate to use: wet or dry (when aircraft_id is set)';
-                """
-            )
-            migrations_applied.append("Added aircraft_id and hourly_rate_type to budget_cards")
-
-        # Check if user_settings training configuration columns exist
-        training_pace_mode_exists = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = 'user_settings'
-                AND column_name = 'training_pace_mode'
-            )
-            """
-        )
-
-        if not training_pace_mode_exists:
-            logger.warning("user_settings training configuration columns missing - adding them")
-            await conn.execute(
-                """
-                ALTER TABLE user_settings
-                ADD COLUMN training_pace_mode VARCHAR(20) DEFAULT 'manual';
-
-                ALTER TABLE user_settings
-                ADD COLUMN training_hours_per_week NUMERIC(10,2) DEFAULT 2.0;
-
-                ALTER TABLE user_settings
-                ADD COLUMN default_training_aircraft_id INTEGER REFERENCES aircraft(id) ON DELETE SET NULL;
-
-                ALTER TABLE user_settings
-                ADD COLUMN ground_instruction_rate NUMERIC(10,2);
-
-                ALTER TABLE user_settings
-                ADD COLUMN budget_buffer_percentage INTEGER DEFAULT 10;
-
-                COMMENT ON COLUMN user_settings.training_pace_mode IS
-                    'How to calculate training pace: auto (from flight history) or manual (user-specified)';
-                COMMENT ON COLUMN user_settings.training_hours_per_week IS
-                    'Expected training hours per week (used when training_pace_mode is manual)';
-                COMMENT ON COLUMN user_settings.default_training_aircraft_id IS
-                    'Default aircraft for training cost calculations';
-                COMMENT ON COLUMN user_settings.ground_instruction_rate IS
-                    'Hourly rate for ground instruction';
-                COMMENT ON COLUMN user_settings.budget_buffer_percentage IS
-                    'Buffer percentage to add to budget calculations (e.g., 10 for 10% buffer)';
-                """
-            )
-            migrations_applied.append("Added training configuration columns to user_settings")
-
-        # Check if user_settings.budget_categories column exists
-        result = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = 'user_settings'
-                AND column_name = 'budget_categories'
-            )
-            """
-        )
-
-        if not result:
-            logger.warning("user_settings.budget_categories column missing - adding it")
-            await conn.execute(
-                """
-                ALTER TABLE user_settings ADD COLUMN budget_categories JSONB;
-                COMMENT ON COLUMN user_settings.budget_categories IS
-                    'Custom budget categories defined by the user';
-                """
-            )
-            migrations_applied.append("Added budget_categories column to user_settings")
-
-        # Check if flights.distance column exists
-        result = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = 'flights'
-                AND column_name = 'distance'
-            )
-            """
-        )
-
-        if not result:
-            logger.warning("flights.distance column missing - adding it")
-            await conn.execute(
-                """
-                ALTER TABLE flights ADD COLUMN distance NUMERIC(10,2);
-                COMMENT ON COLUMN flights.distance IS
-                    'Total distance flown in nautical miles (from ForeFlight Distance field)';
-                """
-            )
-            migrations_applied.append("Added distance column to flights table")
-
-        # Check if flights.import_hash has unique constraint
-        result = await conn.fetchval(
-            """
-            SELECT EXISTS (
-                SELECT FROM pg_constraint
-                WHERE conname = 'flights_import_hash_key'
-                AND conrelid = 'flights'::regclass
-            )
-            """
-        )
-
-        if not result:
-            logger.warning("flights.import_hash unique constraint missing - adding it")
-            await conn.execute(
-                """
-                ALTER TABLE flights ADD CONSTRAINT flights_import_hash_key UNIQUE (import_hash);
-                """
-            )
-            migrations_applied.append("Added unique constraint on flights.import_hash")
-
-    if migrations_applied:
-        logger.info(f"Applied {len(migrations_applied)} migrations:")
-        for msg in migrations_applied:
-            logger.info(f"  - {msg}")
+        return await apply_migrations(conn)
+
+
+async def apply_migrations(conn) -> List[str]:
+    """
+    Apply any pending migrations on an already-open asyncpg connection.
+
+    Lets callers that hold a dedicated connection (e.g. a one-off migration
+    job) run the pass without going through a pool. Returns a list of
+    migration messages that were applied.
+    """
+    version = await _get_schema_version(conn)
+    pending = [(sql, message) for step, message, sql in _MIGRATIONS if step > version]
+    pending_indexes = [(sql, message) for step, message, sql in _INDEX_MIGRATIONS if step > version]
+    if not pending and not pending_indexes:
+        logger.info(f"Database schema is up-to-date (version {version})")
+        return []
+
+    before = await _snapshot_schema(conn)
+
+    # All other DDL goes to the server as one multi-statement batch inside
+    # a transaction, so a failure leaves the schema untouched.
+    statements = [sql for sql, _ in pending] + [_CREATE_SCHEMA_MIGRATIONS_SQL]
+    async with conn.transaction():
+        await conn.execute(";\n".join(sql.strip().rstrip(";") for sql in statements))
+
+    # A failed or cancelled concurrent build leaves an INVALID index behind, which
+    # IF NOT EXISTS would keep forever. Drop it so the build below starts over.
+    invalid_indexes = {row["relname"] for row in await conn.fetch(_INVALID_INDEXES_SQL)} if pending_indexes else set()
+    for sql, _ in pending_indexes:
+        created_index = _CREATE_INDEX_NAME.match(sql)
+        if created_index and created_index.group(1) in invalid_indexes:
+            await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {_quote_ident(created_index.group(1))}")
+        await conn.execute(sql)
+
+    # Recorded last so an interrupted index build is retried next startup.
+    await conn.execute(_RECORD_SCHEMA_VERSION_SQL, CURRENT_SCHEMA_VERSION)
+
+    created = sorted((await _snapshot_schema(conn)) - before)
+
+    migrations_applied = [message for _, message in pending + pending_indexes]
+    _status_cache.clear()
+    logger.info(f"Applied {len(migrations_applied)} migrations (now at version {CURRENT_SCHEMA_VERSION}):")
+    for msg in migrations_applied:
+        logger.info(f"  - {msg}")
+    if created:
+        logger.info(f"Created {len(created)} schema objects: {', '.join(created)}")
     else:
-        logger.info("Database schema is up-to-date")
+        logger.info("All migrated objects already existed")
 
     return migrations_applied
 
 
-async def get_schema_status(db) -> dict:
+async def _snapshot_schema(conn) -> set:
+    """Return the set of "<kind> <name>" strings for every object in the public schema."""
+    return set(await conn.fetchval(_SCHEMA_OBJECTS_SQL) or ())
+
+
+async def get_schema_version(db) -> int:
+    """Return the schema version recorded in the database (0 if none)."""
+    async with db.acquire() as conn:
+        return await _get_schema_version(conn)
+
+
+async def _get_schema_version(conn) -> int:
+    """Return the recorded schema version, or 0 if none has been recorded yet."""
+    try:
+        return await conn.fetchval(_SCHEMA_VERSION_SQL)
+    except asyncpg.UndefinedTableError:
+        return 0
+
+
+# Schema status readouts. The SQL is kept as module constants so every call
+# sends byte-identical text and hits asyncpg's per-connection statement cache.
+
+_STATUS_TABLES = ("aircraft", "flights", "expenses", "budget_cards", "expense_budget_links", "budgets", "reminders")
+
+_STATUS_COLUMNS = (
+    ("flights", "tail_number"),
+    ("aircraft", "fuel_price_per_gallon"),
+    ("aircraft", "fuel_burn_rate"),
+)
+
+_STATUS_INDEXES = (
+    "idx_expense_budget_links_expense",
+    "idx_expense_budget_links_card_amount",
+    "idx_budget_cards_when_date",
+    "idx_budget_cards_category",
+)
+
+_DETAILED_STATUS_TABLES = (
+    "flights",
+    "user_aircraft",
+    "expenses",
+    "budget_cards",
+    "expense_budget_links",
+    "import_history",
+    "user_settings",
+    "user_sessions",
+)
+
+_DETAILED_STATUS_INDEXES = ("idx_expense_budget_links_expense", "idx_expense_budget_links_card_amount")
+
+
+def _quote_ident(name: str) -> str:
+    """Quote a hardcoded SQL identifier, refusing anything but a plain lowercase name."""
+    if not re.fullmatch(r"[a-z_][a-z0-9_]*", name):
+        raise ValueError(f"Unsafe SQL identifier: {name!r}")
+    return f'"{name}"'
+
+
+# Exact counts for every status table in one statement, built once at import.
+# Identifiers come from the hardcoded _STATUS_TABLES and are validated and quoted.
+_EXACT_ROW_COUNTS_SQL = "SELECT " + ", ".join(
+    f"(SELECT COUNT(*) FROM {_quote_ident(table)}) AS {_quote_ident(table)}" for table in _STATUS_TABLES  # nosec B608
+)
+
+_ROW_ESTIMATES_SQL = """
+    SELECT relname, GREATEST(reltuples, 0)::bigint AS estimate
+    FROM pg_class
+    WHERE relkind = 'r'
+    AND relnamespace = 'public'::regnamespace
+    AND relname = ANY($1::text[])
+"""
+
+_TABLE_NAMES_SQL = """
+    SELECT array_agg(table_name::text)
+    FROM information_schema.tables
+    WHERE table_schema = 'public'
+    AND table_name = ANY($1::text[])
+"""
+
+_COLUMN_NAMES_SQL = """
+    SELECT array_agg(table_name || '.' || column_name)
+    FROM information_schema.columns
+    WHERE table_schema = 'public'
+    AND table_name = ANY($1::text[])
+"""
+
+# Indexes left INVALID by a failed or cancelled concurrent build are never used by the
+# planner, so they count as missing.
+_INDEX_NAMES_SQL = """
+    SELECT array_agg(c.relname::text)
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE c.relnamespace = 'public'::regnamespace
+    AND i.indisvalid
+"""
+
+_INVALID_INDEXES_SQL = """
+    SELECT c.relname
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE c.relnamespace = 'public'::regnamespace
+    AND NOT i.indisvalid
+"""
+
+_CREATE_INDEX_NAME = re.compile(r"CREATE INDEX CONCURRENTLY IF NOT EXISTS (\w+)")
+
+
+async def get_schema_status(db, exact_counts: bool = False) -> dict:
     """
     Get the current status of the database schema.
 
-    Returns a dict with table counts, column checks, and index status.
+    Returns a dict with table row counts, column checks, and index status.
+    Row counts are planner estimates unless exact_counts is set, which scans
+    every table.
     """
-    status: dict = {
-        "tables": {},
-        "missing_columns": [],
-        "missing_indexes": [],
-    }
+    cache_name = "schema_status_exact" if exact_counts else "schema_status"
+    cached = _get_cached_status(cache_name, db)
+    if cached is not None:
+        return cached
 
-    async with db.acquire() as conn:
-        # Check table counts
-        tables_to_check = [
-            "aircraft",
-            "flights",
-            "expenses",
-            "budget_cards",
-            "expense_budget_links",
-            "budgets",
-            "reminders",
-        ]
-
-        for table in tables_to_check:
-            count = await conn.fetchval(f"SELECT COUNT(*) FROM {table}")  # nosec B608 - table from hardcoded allowlist
-            status["tables"][table] = count
-
-        # Check for missing columns
-        columns_to_check = [
-            ("flights", "tail_number"),
-            ("aircraft", "fuel_price_per_gallon"),
-            ("aircraft", "fuel_burn_rate"),
-        ]
-
-        for table, column in columns_to_check:
-            exists = await conn.fetchval(
-                """
-                SELECT EXISTS (
-                    SELECT FROM information_schema.columns
-                    WHERE table_schema = 'public'
-                    AND table_name = $1
-                    AND column_name = $2
-                )
-                """,
-                table,
-                column,
-            )
-            if not exists:
-                status["missing_columns"].append(f"{table}.{column}")
-
-        # Check for missing indexes
-        indexes_to_check = [
-            "idx_expense_budget_links_expense",
-            "idx_expense_budget_links_budget_card",
-            "idx_budget_cards_when_date",
-            "idx_budget_cards_category",
-        ]
-
-        for index_name in indexes_to_check:
-            exists = await conn.fetchval(
-                """
-                SELECT EXISTS (
-                    SELECT FROM pg_indexes
-                    WHERE schemaname = 'public'
-                    AND indexname = $1
-                )
-                """,
-                index_name,
-            )
-            if not exists:
-                status["missing_indexes"].append(index_name)
-
-    return status
+    tables, missing_columns, missing_indexes = await asyncio.gather(
+        _count_rows(db) if exact_counts else _estimate_row_counts(db, _STATUS_TABLES),
+        _find_missing_columns(db, _STATUS_COLUMNS),
+        _find_missing_indexes(db, _STATUS_INDEXES),
+    )
+
+    status = {"tables": tables, "missing_columns": missing_columns, "missing_indexes": missing_indexes}
+    return _store_status(cache_name, db, status)
 
 
 async def get_detailed_schema_status(db) -> dict:
@@ -439,53 +544,77 @@ async def get_detailed_schema_status(db) -> dict:
 
     Returns a dictionary with information about missing tables, columns, and indexes.
     """
-    status: dict = {"missing_tables": [], "missing_columns": [], "missing_indexes": []}
+    cached = _get_cached_status("detailed_schema_status", db)
+    if cached is not None:
+        return cached
+
+    missing_tables, missing_indexes = await asyncio.gather(
+        _find_missing_tables(db, _DETAILED_STATUS_TABLES),
+        _find_missing_indexes(db, _DETAILED_STATUS_INDEXES),
+    )
+
+    status = {"missing_tables": missing_tables, "missing_columns": [], "missing_indexes": missing_indexes}
+    return _store_status("detailed_schema_status", db, status)
+
+
+def _get_cached_status(name: str, db: Any) -> Optional[dict]:
+    """Return a copy of a cached status readout if it is still fresh."""
+    entry = _status_cache.get((name, id(db)))
+    if entry is None or time.monotonic() - entry[0] >= _STATUS_CACHE_TTL:
+        return None
+    return copy.deepcopy(entry[1])
+
+
+def _store_status(name: str, db: Any, status: dict) -> dict:
+    """Cache a status readout and return a copy the caller may mutate."""
+    _status_cache[(name, id(db))] = (time.monotonic(), status)
+    return copy.deepcopy(status)
+
+
+# The status probes below each hold their own pooled connection so that
+# asyncio.gather can run them side by side instead of queueing on one.
+
+
+async def _estimate_row_counts(db, tables: Sequence[str]) -> Dict[str, int]:
+    """
+    Estimate the rows in each table from the planner statistics in pg_class.
+
+    This avoids a sequential scan per table; the figures are as fresh as the
+    last VACUUM/ANALYZE, which is plenty for a status readout.
+    """
+    async with db.acquire() as conn:
+        rows = await conn.fetch(_ROW_ESTIMATES_SQL, list(tables))
+    estimates = {row["relname"]: row["estimate"] for row in rows}
+    return {table: estimates.get(table, 0) for table in tables}
+
+
+async def _count_rows(db) -> Dict[str, int]:
+    """Count the rows in every status table exactly, in a single round-trip."""
+    async with db.acquire() as conn:
+        row = await conn.fetchrow(_EXACT_ROW_COUNTS_SQL)
+    return dict(row)
+
+
+async def _find_missing_tables(db, tables: Sequence[str]) -> List[str]:
+    """Return the tables that do not exist in the public schema."""
+    async with db.acquire() as conn:
+        existing = await conn.fetchval(_TABLE_NAMES_SQL, list(tables))
+    existing_names = set(existing or ())
+    return [table_name for table_name in tables if table_name not in existing_names]
+
+
+async def _find_missing_columns(db, columns: Sequence[Tuple[str, str]]) -> List[str]:
+    """Return the (table, column) pairs that do not exist, formatted as "table.column"."""
+    wanted = [f"{table}.{column}" for table, column in columns]
+    async with db.acquire() as conn:
+        existing = await conn.fetchval(_COLUMN_NAMES_SQL, sorted({table for table, _ in columns}))
+    existing_names = set(existing or ())
+    return [name for name in wanted if name not in existing_names]
+
 
+async def _find_missing_indexes(db, indexes: Sequence[str]) -> List[str]:
+    """Return the indexes that do not exist, or are invalid, in the public schema."""
     async with db.acquire() as conn:
-        # Check critical tables
-        tables_to_check = [
-            "flights",
-            "user_aircraft",
-            "expenses",
-            "budget_cards",
-            "expense_budget_links",
-            "import_history",
-            "user_settings",
-            "user_sessions",
-        ]
-
-        for table_name in tables_to_check:
-            exists = await conn.fetchval(
-                """
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables
-                    WHERE table_schema = 'public'
-                    AND table_name = $1
-                )
-                """,
-                table_name,
-            )
-            if not exists:
-                status["missing_tables"].append(table_name)
-
-        # Check critical indexes
-        indexes_to_check = [
-            "idx_expense_budget_links_expense",
-            "idx_expense_budget_links_budget_card",
-        ]
-
-        for index_name in indexes_to_check:
-            exists = await conn.fetchval(
-                """
-                SELECT EXISTS (
-                    SELECT FROM pg_indexes
-                    WHERE schemaname = 'public'
-                    AND indexname = $1
-                )
-                """,
-                index_name,
-            )
-            if not exists:
-                status["missing_indexes"].append(index_name)
-
-    return status
+        existing = await conn.fetchval(_INDEX_NAMES_SQL)
+    existing_names = set(existing or ())
+    return [index_name for index_name in indexes if index_name not in existing_names]
@@ -1,8 +1,13 @@
 """TrueHour: Aviation Expense Tracking and Flight Management API"""
 
+import asyncio
+import hashlib
 import os
-from contextlib import asynccontextmanager
-from typing import List, Optional
+import re
+import signal
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -10,7 +15,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from app.database import Database
-from app.db_migrations import verify_and_migrate_schema
+from app.db_migrations import CURRENT_SCHEMA_VERSION, get_schema_version, verify_and_migrate_schema
 from app.models import BulkRequest, BulkResponse, BulkResult, HealthResponse, StatsResponse
 from app.postgres_database import postgres_db
 from app.routers import (
@@ -24,52 +29,163 @@ from app.routers import (
     import_history,
     user_data,
 )
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from pydantic import ValidationError
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 # Determine FAA database path - try local path first, fall back to Docker path
 _local_db_path = os.path.join(os.path.dirname(__file__), "../data/aircraft.db")
 _default_db_path = _local_db_path if os.path.exists(_local_db_path) else "/app/data/aircraft.db"
 DB_PATH = os.getenv("DB_PATH", _default_db_path)
 STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+# When true, startup only compares the recorded schema version and leaves
+# applying migrations to `python -m app.migrate` (e.g. a pre-deploy job).
+SKIP_SCHEMA_CHECK = os.getenv("SKIP_SCHEMA_CHECK", "false").lower() == "true"
+# Set by docker-compose.dev.yml alongside uvicorn --reload. The UI page is then
+# re-read on every request, since the reloader only watches Python files.
+RELOAD = os.getenv("RELOAD", "false").lower() == "true"
 
 db: Optional[Database] = None
-
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    global db
-
-    # Initialize Postgres connection
+# Whether the FAA database file was present at startup; health checks report
+# this instead of stat'ing the file on every probe.
+DB_EXISTS = False
+# Set once PostgreSQL and the FAA database are open. Until then API requests
+# are answered with 503 so load balancers can hold traffic during cold starts.
+READY = asyncio.Event()
+STARTUP_ERROR: Optional[Exception] = None
+# Reachable while starting up, so orchestrators can poll them
+_UNGATED_PATHS = ("/api/v1/health",)
+# PostgreSQL may still be starting when the API boots. Connecting is retried with
+# doubling delays (2s, 4s, 8s, 16s); after the last attempt the process exits so
+# the container restart policy takes over.
+_POSTGRES_INIT_ATTEMPTS = 5
+_POSTGRES_INIT_BACKOFF = 2.0
+
+
+async def _init_postgres() -> None:
+    """Open the PostgreSQL pool and bring the schema up to date."""
     await postgres_db.connect()
     print("✅ PostgreSQL connection pool initialized")
 
     # Verify and migrate database schema
-    migrations = await verify_and_migrate_schema(postgres_db)
-    if migrations:
-        print(f"✅ Applied {len(migrations)} database migration(s)")
+    if SKIP_SCHEMA_CHECK:
+        schema_version = await get_schema_version(postgres_db)
+        if schema_version < CURRENT_SCHEMA_VERSION:
+            print(
+                f"⚠️  Database schema is at version {schema_version}, expected {CURRENT_SCHEMA_VERSION}"
+                " - run: python -m app.migrate"
+            )
+        else:
+            print("✅ Database schema is up-to-date")
     else:
-        print("✅ Database schema is up-to-date")
+        migrations = await verify_and_migrate_schema(postgres_db)
+        if migrations:
+            print(f"✅ Applied {len(migrations)} database migration(s)")
+        else:
+            print("✅ Database schema is up-to-date")
+
+
+async def _init_postgres_with_retry() -> None:
+    """Run _init_postgres, retrying with backoff while the database is unreachable."""
+    for attempt in range(1, _POSTGRES_INIT_ATTEMPTS + 1):
+        try:
+            await _init_postgres()
+            return
+        except Exception as e:
+            if attempt == _POSTGRES_INIT_ATTEMPTS:
+                raise
+            delay = _POSTGRES_INIT_BACKOFF * 2 ** (attempt - 1)
+            print(f"⚠️  PostgreSQL startup attempt {attempt} failed: {e} - retrying in {delay:g}s")
+            await postgres_db.close()
+            await asyncio.sleep(delay)
+
+
+async def _open_faa_database() -> Optional[Database]:
+    """Open the FAA SQLite database off the event loop, or return None if it is missing."""
+    global DB_EXISTS
 
     # Phase 0: Allow startup without FAA database
-    if os.path.exists(DB_PATH):
-        db = Database(DB_PATH)
-        print(f"✅ FAA database loaded from {DB_PATH}")
-    else:
+    DB_EXISTS = os.path.exists(DB_PATH)
+    if not DB_EXISTS:
         print(f"⚠️  FAA database not found at {DB_PATH} - aircraft lookup disabled")
         print("   Run: python backend/scripts/update_faa_data.py to build it")
+        return None
+
+    faa_db = await asyncio.to_thread(Database, DB_PATH)
+    print(f"✅ FAA database loaded from {DB_PATH}")
+    return faa_db
+
+
+async def _startup() -> None:
+    """Open both databases in the background and mark the app ready."""
+    global db, STARTUP_ERROR
+
+    # PostgreSQL and the FAA database are independent, so open them side by side.
+    # The OpenAPI schema is generated alongside so the first /docs visit doesn't pay for it.
+    results = await asyncio.gather(
+        _init_postgres_with_retry(), _open_faa_database(), asyncio.to_thread(app.openapi), return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        if isinstance(results[1], Database):
+            results[1].close()
+        STARTUP_ERROR = errors[0]
+        print(f"❌ Startup failed: {STARTUP_ERROR} - shutting down")
+        # Exit instead of idling on 503s, so the container is restarted
+        os.kill(os.getpid(), signal.SIGTERM)
+        return
+
+    db = results[1]
+
+    READY.set()
+    print("✅ Ready to serve requests")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global STARTUP_ERROR
+
+    # Start accepting connections right away; /readyz reports when startup is done
+    READY.clear()
+    STARTUP_ERROR = None
+    startup = asyncio.create_task(_startup())
 
     yield
 
     # Cleanup
+    if not startup.done():
+        startup.cancel()
+        with suppress(asyncio.CancelledError):
+            await startup
     await postgres_db.close()
     print("✅ PostgreSQL connection pool closed")
     if db:
         db.close()
 
 
+class ReadinessMiddleware:
+    """Answer API requests with 503 until startup has finished."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] == "http"
+            and not READY.is_set()
+            and scope["path"].startswith("/api/")
+            and scope["path"] not in _UNGATED_PATHS
+        ):
+            response = JSONResponse({"detail": "Service is starting"}, status_code=503, headers={"Retry-After": "1"})
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
 app = FastAPI(
     title="TrueHour",
     description="Aviation Expense Tracking and Flight Management API",
@@ -79,6 +195,8 @@ app = FastAPI(
     redoc_url=None,
 )
 
+# Added before CORS so that its 503s still carry CORS headers
+app.add_middleware(ReadinessMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -105,154 +223,129 @@ app.include_router(import_history.router)
 app.include_router(user_data.router)
 
 
+# Deletes the separators people type inside tail numbers
+_TAIL_SEPARATORS = str.maketrans("", "", "- ")
+
+# A normalized N-number (prefix stripped): 1-5 characters, a leading non-zero
+# digit, and at most two trailing letters other than I and O
+_N_NUMBER = re.compile(r"(?=[0-9A-Z]{1,5}$)[1-9](?:[0-9]{0,4}|[0-9]{0,3}[A-HJ-NP-Z]{1,2})")
+
+
+@lru_cache(maxsize=4096)
 def normalize_tail(tail: str) -> str:
     """Normalize N-number: uppercase, strip N prefix and dashes."""
     t = tail.upper().strip()
     if t.startswith("N"):
         t = t[1:]
-    return t.replace("-", "").replace(" ", "")
+    return t.translate(_TAIL_SEPARATORS)
 
 
-@app.get("/", include_in_schema=False)
-async def root():
-    """Serve the UI."""
-    return FileResponse(os.path.join(STATIC_DIR, "index.html"))
+@lru_cache(maxsize=1)
+def _index_page() -> Tuple[bytes, str]:
+    """Read the UI page and compute its ETag."""
+    with open(os.path.join(STATIC_DIR, "index.html"), "rb") as f:
+        content = f.read()
+    return content, f'"{hashlib.sha256(content).hexdigest()[:32]}"'
 
 
-@app.get("/docs", include_in_schema=False)
-async def custom_swagger_ui_html():
-    """Custom Swagger UI with footer."""
-    footer_html = """
-    <style>
-        .api-footer {
-            background: #f8f9fa;
-            border-top: 1px solid #e5e7eb;
-            padding: 2rem 0;
-            margin-top: 4rem;
-            font-size: 0.9rem;
-            color: #6b7280;
-        }
+@app.get("/", include_in_schema=False)
+async def root(request: Request):
+    """Serve the UI."""
+    if RELOAD:
+        _index_page.cache_clear()
+    content, etag = _index_page()
+
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="text/html", headers=headers)
+
+
+# Footer appended to the Swagger UI and ReDoc pages
+DOCS_FOOTER_HTML = """<style>
+    .api-footer {
+        background: #f8f9fa;
+        border-top: 1px solid #e5e7eb;
+        padding: 2rem 0;
+        margin-top: 4rem;
+        font-size: 0.9rem;
+        color: #6b7280;
+    }
+    .api-footer-container {
+        max-width: 1400px;
+        margin: 0 auto;
+        padding: 0 20px;
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        flex-wrap: wrap;
+        gap: 1rem;
+    }
+    .api-footer-right {
+        display: flex;
+        gap: 1.5rem;
+    }
+    .api-footer a {
+        color: #2563eb;
+        text-decoration: none;
+    }
+    .api-footer a:hover {
+        text-decoration: underline;
+    }
+    @media (max-width: 768px) {
         .api-footer-container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 0 20px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: 1rem;
-        }
-        .api-footer-right {
-            display: flex;
-            gap: 1.5rem;
-        }
-        .api-footer a {
-            color: #2563eb;
-            text-decoration: none;
-        }
-        .api-footer a:hover {
-            text-decoration: underline;
+            flex-direction: column;
+            text-align: center;
         }
-        @media (max-width: 768px) {
-            .api-footer-container {
-                flex-direction: column;
-                text-align: center;
-            }
-        }
-    </style>
-    <div class="api-footer">
-        <div class="api-footer-container">
-            <div class="api-footer-left">
-                <span>© <span id="currentYear"></span> FliteAxis. All Rights Reserved.</span>
-            </div>
-            <div class="api-footer-right">
-                <a href="https://fliteaxis.com/privacy" target="_blank" rel="noopener noreferrer">Privacy Policy</a>
-                <a href="https://fliteaxis.com/terms" target="_blank" rel="noopener noreferrer">Terms of Service</a>
-            </div>
+    }
+</style>
+<div class="api-footer">
+    <div class="api-footer-container">
+        <div class="api-footer-left">
+            <span>© <span id="currentYear"></span> FliteAxis. All Rights Reserved.</span>
+        </div>
+        <div class="api-footer-right">
+            <a href="https://fliteaxis.com/privacy" target="_blank" rel="noopener noreferrer">Privacy Policy</a>
+            <a href="https://fliteaxis.com/terms" target="_blank" rel="noopener noreferrer">Terms of Service</a>
         </div>
     </div>
-    <script>
-        document.getElementById('currentYear').textContent = new Date().getFullYear();
-    </script>
-    """
+</div>
+<script>
+    document.getElementById('currentYear').textContent = new Date().getFullYear();
+</script>
+"""
+
+
+def _with_footer(page: HTMLResponse) -> str:
+    """Insert the docs footer before the closing body tag of a rendered docs page."""
+    return page.body.decode("utf-8").replace("</body>", f"{DOCS_FOOTER_HTML}</body>")
 
-    swagger_html = get_swagger_ui_html(
+
+# The docs pages are static, so they are rendered once at import
+SWAGGER_UI_HTML = _with_footer(
+    get_swagger_ui_html(
+        openapi_url=app.openapi_url,
+        title=app.title + " - API Documentation",
+    )
+)
+REDOC_HTML = _with_footer(
+    get_redoc_html(
         openapi_url=app.openapi_url,
         title=app.title + " - API Documentation",
     )
+)
 
-    html_content = swagger_html.body.decode("utf-8")
-    html_with_footer = html_content.replace("</body>", f"{footer_html}</body>")
 
-    return HTMLResponse(content=html_with_footer)
+@app.get("/docs", include_in_schema=False)
+async def custom_swagger_ui_html():
+    """Custom Swagger UI with footer."""
+    return HTMLResponse(content=SWAGGER_UI_HTML)
 
 
 @app.get("/redoc", include_in_schema=False)
 async def custom_redoc_html():
     """Custom ReDoc with footer."""
-    footer_html = """
-    <style>
-        .api-footer {
-            background: #f8f9fa;
-            border-top: 1px solid #e5e7eb;
-            padding: 2rem 0;
-            margin-top: 4rem;
-            font-size: 0.9rem;
-            color: #6b7280;
-        }
-        .api-footer-container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 0 20px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: 1rem;
-        }
-        .api-footer-right {
-            display: flex;
-            gap: 1.5rem;
-        }
-        .api-footer a {
-            color: #2563eb;
-            text-decoration: none;
-        }
-        .api-footer a:hover {
-            text-decoration: underline;
-        }
-        @media (max-width: 768px) {
-            .api-footer-container {
-                flex-direction: column;
-                text-align: center;
-            }
-        }
-    </style>
-    <div class="api-footer">
-        <div class="api-footer-container">
-            <div class="api-footer-left">
-                <span>© <span id="currentYear"></span> FliteAxis. All Rights Reserved.</span>
-            </div>
-            <div class="api-footer-right">
-                <a href="https://fliteaxis.com/privacy" target="_blank" rel="noopener noreferrer">Privacy Policy</a>
-                <a href="https://fliteaxis.com/terms" target="_blank" rel="noopener noreferrer">Terms of Service</a>
-            </div>
-        </div>
-    </div>
-    <script>
-        document.getElementById('currentYear').textContent = new Date().getFullYear();
-    </script>
-    """
-
-    redoc_html = get_redoc_html(
-        openapi_url=app.openapi_url,
-        title=app.title + " - API Documentation",
-    )
-
-    html_content = redoc_html.body.decode("utf-8")
-    html_with_footer = html_content.replace("</body>", f"{footer_html}</body>")
-
-    return HTMLResponse(content=html_with_footer)
+    return HTMLResponse(content=REDOC_HTML)
 
 
 @app.get("/api/v1/aircraft/{tail}")
@@ -305,40 +398,53 @@ async def get_aircraft(tail: str):
         raise HTTPException(status_code=500, detail="FAA lookup service error")
 
 
-@app.post("/api/v1/aircraft/bulk", response_model=BulkResponse)
-async def bulk_lookup(request: BulkRequest):
+# The body is declared here because bulk_lookup parses it itself
+_BULK_REQUEST_BODY = {
+    "requestBody": {"required": True, "content": {"application/json": {"schema": BulkRequest.model_json_schema()}}}
+}
+
+
+@app.post(
+    "/api/v1/aircraft/bulk",
+    response_model=BulkResponse,
+    response_model_exclude_none=True,
+    openapi_extra=_BULK_REQUEST_BODY,
+)
+async def bulk_lookup(raw_request: Request):
     """Lookup multiple aircraft by N-number. Maximum 50 per request."""
+    # Parse and validate in one pass in pydantic-core, without an intermediate dict
+    body = await raw_request.body()
+    try:
+        request = BulkRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        raise RequestValidationError(errors, body=body) from e
+
     if db is None:
         raise HTTPException(503, "FAA database not available. Run update_faa_data.py to build it.")
 
     if len(request.tail_numbers) > 50:
         raise HTTPException(400, "Maximum 50 tail numbers per request")
 
+    normalized_tails = [normalize_tail(tail) for tail in request.tail_numbers]
+    # Malformed N-numbers can't be in the registry, so they never reach the query
+    aircraft_by_tail = db.bulk_lookup(
+        [normalized for normalized in normalized_tails if _N_NUMBER.fullmatch(normalized)]
+    )
+
     results: List[BulkResult] = []
     found = 0
 
-    for tail in request.tail_numbers:
-        normalized = normalize_tail(tail)
-        if not normalized:
+    for tail, normalized in zip(request.tail_numbers, normalized_tails):
+        if not _N_NUMBER.fullmatch(normalized):
             results.append(BulkResult(tail_number=tail.upper(), error="Invalid tail number"))
             continue
 
-        aircraft = db.lookup(normalized)
+        aircraft = aircraft_by_tail.get(normalized)
         if aircraft:
             found += 1
-            results.append(
-                BulkResult(
-                    tail_number=aircraft.tail_number,
-                    manufacturer=aircraft.manufacturer,
-                    model=aircraft.model,
-                    series=aircraft.series,
-                    aircraft_type=aircraft.aircraft_type,
-                    engine_type=aircraft.engine_type,
-                    num_engines=aircraft.num_engines,
-                    num_seats=aircraft.num_seats,
-                    year_mfr=aircraft.year_mfr,
-                )
-            )
+            # The fields were validated when the AircraftResponse was built
+            results.append(BulkResult.model_construct(**dict(aircraft)))
         else:
             results.append(BulkResult(tail_number=f"N{normalized}", error="Not found"))
 
@@ -348,18 +454,31 @@ async def bulk_lookup(request: BulkRequest):
 @app.get("/api/v1/health", response_model=HealthResponse)
 async def health():
     """Health check with database status."""
+    if STARTUP_ERROR is not None:
+        raise HTTPException(503, "Startup failed")
+    if not READY.is_set():
+        return HealthResponse(status="starting", database_exists=False, record_count=0, last_updated=None)
+
     if db is None:
         return HealthResponse(status="degraded", database_exists=False, record_count=0, last_updated=None)
 
     stats = db.get_stats()
     return HealthResponse(
         status="healthy" if stats.record_count > 0 else "degraded",
-        database_exists=os.path.exists(DB_PATH),
+        database_exists=DB_EXISTS,
         record_count=stats.record_count,
         last_updated=stats.last_updated,
     )
 
 
+@app.get("/readyz", include_in_schema=False)
+async def readyz():
+    """Readiness probe: 200 once PostgreSQL and the FAA database are open."""
+    if not READY.is_set():
+        raise HTTPException(503, "Not ready")
+    return {"status": "ready"}
+
+
 @app.get("/api/v1/stats", response_model=StatsResponse)
 async def stats():
     """Database statistics."""
@@ -378,6 +497,7 @@ async def delete_all_data():
             await conn.execute("DELETE FROM expenses")
             await conn.execute("DELETE FROM flights")
             await conn.execute("DELETE FROM budget_cards")
+            postgres_db.invalidate_summaries()
             await conn.execute("DELETE FROM aircraft")
             await conn.execute("DELETE FROM import_history")
             await conn.execute("DELETE FROM user_sessions")
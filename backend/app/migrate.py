@@ -0,0 +1,42 @@
+"""Apply database migrations as a one-off job.
+
+Run from the backend directory before rolling out new API containers:
+
+    python -m app.migrate
+
+Uses a single dedicated connection to DATABASE_URL rather than a pool. Pair
+with SKIP_SCHEMA_CHECK=true on the API so workers only check the version.
+"""
+
+import asyncio
+import logging
+import sys
+
+import asyncpg
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.db_migrations import apply_migrations  # noqa: E402
+from app.postgres_database import postgres_db  # noqa: E402
+
+
+async def main() -> int:
+    conn = await asyncpg.connect(postgres_db.database_url)
+    try:
+        migrations = await apply_migrations(conn)
+    finally:
+        await conn.close()
+
+    if migrations:
+        print(f"✅ Applied {len(migrations)} database migration(s)")
+        for msg in migrations:
+            print(f"   - {msg}")
+    else:
+        print("✅ Database schema is up-to-date")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(main()))
@@ -1,10 +1,82 @@
 """Pydantic models for TrueHour FAA lookup API responses."""
 
+import os
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional
-
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, List, Literal, Mapping, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+# Opt-in: build responses from database rows with model_construct, skipping
+# validation of values asyncpg has already typed.
+SKIP_RESPONSE_VALIDATION = os.getenv("TRUEHOUR_SKIP_RESPONSE_VALIDATION", "false").lower() == "true"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def from_row(model: Type[ModelT], row: Mapping[str, Any]) -> ModelT:
+    """
+    Build a response model from a trusted database row.
+
+    Validates the row unless SKIP_RESPONSE_VALIDATION is set. Either way the
+    result is a model instance, which FastAPI does not validate again.
+    """
+    if SKIP_RESPONSE_VALIDATION:
+        return model.model_construct(**row)
+    return model.model_validate(row)
+
+
+# OpenAPI examples, kept out of the class bodies
+
+_AIRCRAFT_EXAMPLE = {
+    "tail_number": "N172SP",
+    "manufacturer": "CESSNA",
+    "model": "172S",
+    "series": "SKYHAWK SP",
+    "aircraft_type": "Fixed Wing Single-Engine",
+    "engine_type": "Reciprocating",
+    "num_engines": 1,
+    "num_seats": 4,
+    "year_mfr": 2001,
+}
+
+_BULK_REQUEST_EXAMPLE = {"tail_numbers": ["N172SP", "N12345", "N67890"]}
+
+_BULK_RESPONSE_EXAMPLE = {
+    "total": 3,
+    "found": 2,
+    "results": [
+        {
+            "tail_number": "N172SP",
+            "manufacturer": "CESSNA",
+            "model": "172S",
+            "aircraft_type": "Fixed Wing Single-Engine",
+            "engine_type": "Reciprocating",
+        },
+        {"tail_number": "N99999", "error": "Not found"},
+    ],
+}
+
+_BUDGET_CARD_EXAMPLE = {
+    "id": 1,
+    "name": "CIAS IFR Training",
+    "category": "Training",
+    "frequency": "monthly",
+    "when_date": "2026-01-01",
+    "budgeted_amount": 2760.00,
+    "actual_amount": 245.00,
+    "remaining_amount": 2515.00,
+    "notes": "2x | 2 hrs / week + Ground * 4 weeks",
+    "associated_hours": 12.0,
+    "aircraft_id": 1,
+    "aircraft_tail": "N5274S",
+    "aircraft_make": "CESSNA",
+    "aircraft_model": "R182",
+    "hourly_rate_type": "wet",
+    "status": "active",
+    "created_at": "2025-12-14T00:00:00Z",
+    "updated_at": "2025-12-14T00:00:00Z",
+}
 
 
 class AircraftResponse(BaseModel):
@@ -20,29 +92,16 @@ class AircraftResponse(BaseModel):
     num_seats: Optional[int] = None
     year_mfr: Optional[int] = None
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "tail_number": "N172SP",
-                "manufacturer": "CESSNA",
-                "model": "172S",
-                "series": "SKYHAWK SP",
-                "aircraft_type": "Fixed Wing Single-Engine",
-                "engine_type": "Reciprocating",
-                "num_engines": 1,
-                "num_seats": 4,
-                "year_mfr": 2001,
-            }
-        }
-    }
+    model_config = ConfigDict(json_schema_extra={"example": _AIRCRAFT_EXAMPLE})
 
 
 class BulkRequest(BaseModel):
     """Bulk lookup request."""
 
-    tail_numbers: List[str] = Field(..., max_length=50)
+    # Items are normalized later, so leave room for dashes and spaces
+    tail_numbers: List[Annotated[str, Field(max_length=16)]] = Field(..., max_length=50)
 
-    model_config = {"json_schema_extra": {"example": {"tail_numbers": ["N172SP", "N12345", "N67890"]}}}
+    model_config = ConfigDict(json_schema_extra={"example": _BULK_REQUEST_EXAMPLE})
 
 
 class BulkResult(BaseModel):
@@ -67,24 +126,7 @@ class BulkResponse(BaseModel):
     found: int
     results: List[BulkResult]
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "total": 3,
-                "found": 2,
-                "results": [
-                    {
-                        "tail_number": "N172SP",
-                        "manufacturer": "CESSNA",
-                        "model": "172S",
-                        "aircraft_type": "Fixed Wing Single-Engine",
-                        "engine_type": "Reciprocating",
-                    },
-                    {"tail_number": "N99999", "error": "Not found"},
-                ],
-            }
-        }
-    }
+    model_config = ConfigDict(json_schema_extra={"example": _BULK_RESPONSE_EXAMPLE})
 
 
 class HealthResponse(BaseModel):
@@ -105,47 +147,55 @@ class StatsResponse(BaseModel):
 
 # Budget Models
 
+BudgetType = Literal["monthly", "annual", "goal"]
+BudgetCardFrequency = Literal["once", "monthly", "annual"]
+# "inactive" is what the budget card forms offer alongside active/completed
+BudgetCardStatus = Literal["active", "inactive", "completed", "cancelled"]
+HourlyRateType = Literal["wet", "dry"]
+
 
 class BudgetBase(BaseModel):
     """Base budget fields."""
 
-    name: str = Field(..., description="Budget name (e.g., '2025 Annual Flying Budget')")
-    budget_type: str = Field(..., description="Budget type: monthly, annual, or goal")
+    name: str = Field(..., max_length=200, description="Budget name (e.g., '2025 Annual Flying Budget')")
+    budget_type: BudgetType = Field(..., description="Budget type: monthly, annual, or goal")
     amount: Decimal = Field(..., gt=0, description="Total budget amount")
     start_date: Optional[date] = Field(None, description="Budget period start date")
     end_date: Optional[date] = Field(None, description="Budget period end date")
     categories: Optional[List[str]] = Field(None, description="Expense categories to track (empty = all)")
-    notes: Optional[str] = None
+    notes: Optional[str] = Field(None, max_length=2000)
     is_active: bool = True
 
 
-class BudgetCreate(BudgetBase):
-    """Create budget request."""
-
-    pass
+# Create requests take exactly the base fields, so they share its validator
+BudgetCreate = BudgetBase
 
 
 class BudgetUpdate(BaseModel):
     """Update budget request (all fields optional)."""
 
-    name: Optional[str] = None
-    budget_type: Optional[str] = None
+    name: Optional[str] = Field(None, max_length=200)
+    budget_type: Optional[BudgetType] = None
     amount: Optional[Decimal] = Field(None, gt=0)
     start_date: Optional[date] = None
     end_date: Optional[date] = None
     categories: Optional[List[str]] = None
-    notes: Optional[str] = None
+    notes: Optional[str] = Field(None, max_length=2000)
     is_active: Optional[bool] = None
 
 
 class BudgetResponse(BudgetBase):
     """Budget response."""
 
+    # Stored rows predate the request-side Literal and length limits, so echo them as-is
+    name: str
+    budget_type: str
+    notes: Optional[str] = None
     id: int
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BudgetEntryBase(BaseModel):
@@ -153,23 +203,21 @@ class BudgetEntryBase(BaseModel):
 
     month: date = Field(..., description="First day of month (e.g., 2025-01-01)")
     allocated_amount: Decimal = Field(..., gt=0, description="Allocated amount for this month")
-    notes: Optional[str] = None
+    notes: Optional[str] = Field(None, max_length=2000)
 
 
-class BudgetEntryCreate(BudgetEntryBase):
-    """Create budget entry request."""
-
-    pass
+BudgetEntryCreate = BudgetEntryBase
 
 
 class BudgetEntryResponse(BudgetEntryBase):
     """Budget entry response."""
 
+    notes: Optional[str] = None
     id: int
     budget_id: int
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BudgetStatusResponse(BaseModel):
@@ -186,7 +234,7 @@ class BudgetStatusResponse(BaseModel):
     percentage_used: float
     is_over_budget: bool
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Budget Card Models (new outcome-based system)
@@ -195,76 +243,63 @@ class BudgetStatusResponse(BaseModel):
 class BudgetCardBase(BaseModel):
     """Base budget card fields."""
 
-    name: str = Field(..., description="Budget item name (e.g., 'Blue Sky Flight Club', 'CIAS IFR Training')")
+    name: str = Field(
+        ..., max_length=200, description="Budget item name (e.g., 'Blue Sky Flight Club', 'CIAS IFR Training')"
+    )
     category: str = Field(..., description="Category: Administrative, Training, Family, etc.")
-    frequency: str = Field(..., description="Frequency: once, monthly, annual")
+    frequency: BudgetCardFrequency = Field(..., description="Frequency: once, monthly, annual")
     when_date: date = Field(..., description="The date this budget applies to (use first of month for monthly)")
     budgeted_amount: Decimal = Field(..., gt=0, description="Budgeted amount")
-    notes: Optional[str] = Field(None, description="Additional notes (flight details, hours breakdown, etc.)")
+    notes: Optional[str] = Field(
+        None, max_length=2000, description="Additional notes (flight details, hours breakdown, etc.)"
+    )
     associated_hours: Optional[Decimal] = Field(None, description="Training hours associated with this budget item")
     aircraft_id: Optional[int] = Field(None, description="Optional aircraft link for auto-calculating costs")
-    hourly_rate_type: str = Field(default="wet", description="Which rate to use: wet or dry")
-    status: str = Field(default="active", description="Status: active, completed, cancelled")
-
+    hourly_rate_type: HourlyRateType = Field(default="wet", description="Which rate to use: wet or dry")
+    status: BudgetCardStatus = Field(default="active", description="Status: active, inactive, completed, cancelled")
 
-class BudgetCardCreate(BudgetCardBase):
-    """Create budget card request."""
 
-    pass
+BudgetCardCreate = BudgetCardBase
 
 
 class BudgetCardUpdate(BaseModel):
     """Update budget card request (all fields optional)."""
 
-    name: Optional[str] = None
+    name: Optional[str] = Field(None, max_length=200)
     category: Optional[str] = None
-    frequency: Optional[str] = None
+    frequency: Optional[BudgetCardFrequency] = None
     when_date: Optional[date] = None
     budgeted_amount: Optional[Decimal] = Field(None, gt=0)
-    notes: Optional[str] = None
+    notes: Optional[str] = Field(None, max_length=2000)
     associated_hours: Optional[Decimal] = None
     aircraft_id: Optional[int] = None
-    hourly_rate_type: Optional[str] = None
-    status: Optional[str] = None
+    hourly_rate_type: Optional[HourlyRateType] = None
+    status: Optional[BudgetCardStatus] = None
 
 
 class BudgetCardResponse(BudgetCardBase):
     """Budget card response."""
 
+    # Stored rows predate the request-side Literals and length limits, so echo them as-is
+    name: str
+    frequency: str
+    notes: Optional[str] = Field(None, description="Additional notes (flight details, hours breakdown, etc.)")
+    hourly_rate_type: str = "wet"
+    status: str = "active"
     id: int
     actual_amount: Decimal = Field(description="Auto-calculated sum of linked expenses")
-    remaining_amount: Decimal = Field(description="Calculated: budgeted_amount - actual_amount")
     aircraft_tail: Optional[str] = Field(None, description="Aircraft tail number (if linked)")
     aircraft_make: Optional[str] = Field(None, description="Aircraft make (if linked)")
     aircraft_model: Optional[str] = Field(None, description="Aircraft model (if linked)")
     created_at: datetime
     updated_at: datetime
 
-    model_config = {
-        "from_attributes": True,
-        "json_schema_extra": {
-            "example": {
-                "id": 1,
-                "name": "CIAS IFR Training",
-                "category": "Training",
-                "frequency": "monthly",
-                "when_date": "2026-01-01",
-                "budgeted_amount": 2760.00,
-                "actual_amount": 245.00,
-                "remaining_amount": 2515.00,
-                "notes": "2x | 2 hrs / week + Ground * 4 weeks",
-                "associated_hours": 12.0,
-                "aircraft_id": 1,
-                "aircraft_tail": "N5274S",
-                "aircraft_make": "CESSNA",
-                "aircraft_model": "R182",
-                "hourly_rate_type": "wet",
-                "status": "active",
-                "created_at": "2025-12-14T00:00:00Z",
-                "updated_at": "2025-12-14T00:00:00Z",
-            }
-        },
-    }
+    model_config = ConfigDict(from_attributes=True, json_schema_extra={"example": _BUDGET_CARD_EXAMPLE})
+
+    @computed_field(description="Calculated: budgeted_amount - actual_amount")
+    @property
+    def remaining_amount(self) -> Decimal:
+        return self.budgeted_amount - self.actual_amount
 
 
 class ExpenseBudgetLinkBase(BaseModel):
@@ -275,10 +310,7 @@ class ExpenseBudgetLinkBase(BaseModel):
     amount: Decimal = Field(..., gt=0, description="Amount to allocate to this budget card")
 
 
-class ExpenseBudgetLinkCreate(ExpenseBudgetLinkBase):
-    """Create expense-budget link request."""
-
-    pass
+ExpenseBudgetLinkCreate = ExpenseBudgetLinkBase
 
 
 class ExpenseBudgetLinkResponse(ExpenseBudgetLinkBase):
@@ -287,19 +319,28 @@ class ExpenseBudgetLinkResponse(ExpenseBudgetLinkBase):
     id: int
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Budget Card Aggregations
 
 
-class MonthlyBudgetSummary(BaseModel):
-    """Monthly budget summary."""
+class MonthlyBudgetSummarySlim(BaseModel):
+    """Monthly budget totals without the per-card detail."""
 
     month: date = Field(description="First day of month")
     total_budgeted: Decimal
     total_actual: Decimal
-    total_remaining: Decimal
+
+    @computed_field
+    @property
+    def total_remaining(self) -> Decimal:
+        return self.total_budgeted - self.total_actual
+
+
+class MonthlyBudgetSummary(MonthlyBudgetSummarySlim):
+    """Monthly budget summary."""
+
     cards: List[BudgetCardResponse]
 
 
@@ -309,16 +350,30 @@ class CategoryBudgetSummary(BaseModel):
     category: str
     total_budgeted: Decimal
     total_actual: Decimal
-    total_remaining: Decimal
     card_count: int
 
+    @computed_field
+    @property
+    def total_remaining(self) -> Decimal:
+        return self.total_budgeted - self.total_actual
 
-class AnnualBudgetSummary(BaseModel):
-    """Annual budget summary."""
+
+class AnnualBudgetSummarySlim(BaseModel):
+    """Annual budget totals without the per-card detail."""
 
     year: int
     total_budgeted: Decimal
     total_actual: Decimal
-    total_remaining: Decimal
-    by_month: List[MonthlyBudgetSummary]
+    by_month: List[MonthlyBudgetSummarySlim]
     by_category: List[CategoryBudgetSummary]
+
+    @computed_field
+    @property
+    def total_remaining(self) -> Decimal:
+        return self.total_budgeted - self.total_actual
+
+
+class AnnualBudgetSummary(AnnualBudgetSummarySlim):
+    """Annual budget summary."""
+
+    by_month: List[MonthlyBudgetSummary]
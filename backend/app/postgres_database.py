@@ -1,28 +1,316 @@
 """PostgreSQL database operations for user data."""
 
+import asyncio
+import copy
 import json
+import logging
 import os
+import time
+from collections import defaultdict
 from contextlib import asynccontextmanager
 from datetime import date
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 import asyncpg
 
+logger = logging.getLogger(__name__)
+
+# Flight columns converted to strings for the API
+_FLIGHT_TIME_FIELDS = ("time_out", "time_off", "time_on", "time_in")
+_FLIGHT_TIMESTAMP_FIELDS = ("created_at", "updated_at")
+
+# get_expenses reads from one of these; the budget card link is only joined when asked for.
+# The UNIQUE (expense_id, budget_card_id) index on expense_budget_links serves that join.
+_EXPENSE_LIST_COLUMNS = """
+    e.id, e.aircraft_id, e.category, e.subcategory, e.description,
+    e.amount, e.date, e.is_recurring, e.recurrence_interval,
+    e.recurrence_end_date, e.vendor, e.is_tax_deductible, e.tax_category,
+    e.created_at, e.updated_at"""
+_EXPENSES_SELECT_BASE = f"SELECT {_EXPENSE_LIST_COLUMNS} FROM expenses e WHERE 1=1"  # nosec B608 - constant
+_EXPENSES_SELECT_WITH_LINK = f"""
+    SELECT {_EXPENSE_LIST_COLUMNS}, ebl.budget_card_id
+    FROM expenses e
+    LEFT JOIN expense_budget_links ebl ON e.id = ebl.expense_id
+    WHERE 1=1"""  # nosec B608 - constant
+
+# budgets.categories is a JSONB array of strings. It is read and written as text[] so
+# asyncpg converts it to and from a Python list itself, with no json round trip.
+_BUDGET_COLUMNS = """
+    id, name, budget_type, amount, start_date, end_date,
+    CASE jsonb_typeof(categories)
+        WHEN 'array' THEN ARRAY(SELECT jsonb_array_elements_text(categories))
+    END AS categories,
+    notes, is_active, created_at, updated_at"""
+
+_BUDGET_ENTRY_COLUMNS = "id, budget_id, month, allocated_amount, notes, created_at"
+_EXPENSE_BUDGET_LINK_COLUMNS = "id, expense_id, budget_card_id, amount, created_at"
+
+# budget_cards also has a stored actual_amount column that is never kept up to date.
+# It is left out here so the computed sum of linked expenses is the only one returned.
+_BUDGET_CARD_COLUMNS = """
+    bc.id, bc.name, bc.category, bc.frequency, bc.when_date, bc.budgeted_amount,
+    bc.notes, bc.associated_hours, bc.aircraft_id, bc.hourly_rate_type, bc.status,
+    bc.created_at, bc.updated_at,
+    a.tail_number as aircraft_tail,
+    a.make as aircraft_make,
+    a.model as aircraft_model"""
+_BUDGET_CARD_SELECT = f"""
+    SELECT {_BUDGET_CARD_COLUMNS}, COALESCE(SUM(ebl.amount), 0) as actual_amount
+    FROM budget_cards bc
+    LEFT JOIN expense_budget_links ebl ON bc.id = ebl.budget_card_id
+    LEFT JOIN aircraft a ON bc.aircraft_id = a.id"""  # nosec B608 - constant
+# A single card sums its links in a subquery instead of grouping the joined rows
+_BUDGET_CARD_BY_ID = f"""
+    SELECT
+        {_BUDGET_CARD_COLUMNS},
+        COALESCE((SELECT SUM(amount) FROM expense_budget_links WHERE budget_card_id = bc.id), 0) as actual_amount
+    FROM budget_cards bc
+    LEFT JOIN aircraft a ON bc.aircraft_id = a.id
+    WHERE bc.id = $1"""  # nosec B608 - constant
+
+# Flight, expense and budget card summaries are cached per arguments for this many seconds.
+# Every write to flights, expenses, budget cards or their links calls invalidate_summaries(),
+# which drops them. Summaries read from the replica are not cached (see _store_summary).
+_SUMMARY_CACHE_TTL = 300.0
+
+# Columns update_flight may set; anything else in the update data is ignored
+_FLIGHT_UPDATE_COLUMNS = frozenset(
+    (
+        "aircraft_id",
+        "date",
+        "departure_airport",
+        "arrival_airport",
+        "route",
+        "time_out",
+        "time_off",
+        "time_on",
+        "time_in",
+        "total_time",
+        "pic_time",
+        "sic_time",
+        "night_time",
+        "solo_time",
+        "cross_country_time",
+        "actual_instrument_time",
+        "simulated_instrument_time",
+        "simulated_flight_time",
+        "dual_given_time",
+        "dual_received_time",
+        "ground_training_time",
+        "complex_time",
+        "high_performance_time",
+        "hobbs_start",
+        "hobbs_end",
+        "tach_start",
+        "tach_end",
+        "day_takeoffs",
+        "day_landings_full_stop",
+        "night_takeoffs",
+        "night_landings_full_stop",
+        "all_landings",
+        "holds",
+        "approaches",
+        "instructor_name",
+        "instructor_comments",
+        "pilot_comments",
+        "is_flight_review",
+        "is_ipc",
+        "is_checkride",
+        "is_simulator_session",
+        "fuel_gallons",
+        "fuel_cost",
+        "landing_fees",
+        "instructor_cost",
+        "rental_cost",
+        "other_costs",
+        "distance",
+    )
+)
+
+
+# Columns update_aircraft / update_expense may set
+_AIRCRAFT_UPDATE_COLUMNS = frozenset(
+    (
+        "tail_number",
+        "type_code",
+        "year",
+        "make",
+        "model",
+        "gear_type",
+        "engine_type",
+        "aircraft_class",
+        "is_complex",
+        "is_taa",
+        "is_high_performance",
+        "is_simulator",
+        "category",
+        "hourly_rate_wet",
+        "hourly_rate_dry",
+        "fuel_burn_rate",
+        "fuel_price_per_gallon",
+        "notes",
+        "is_active",
+    )
+)
+_EXPENSE_UPDATE_COLUMNS = frozenset(
+    (
+        "aircraft_id",
+        "category",
+        "subcategory",
+        "description",
+        "amount",
+        "date",
+        "is_recurring",
+        "recurrence_interval",
+        "recurrence_end_date",
+        "vendor",
+        "is_tax_deductible",
+        "tax_category",
+    )
+)
+
+# update_budget_card sets these when present, including explicit None values
+_BUDGET_CARD_UPDATE_COLUMNS = frozenset(
+    (
+        "name",
+        "category",
+        "frequency",
+        "when_date",
+        "budgeted_amount",
+        "notes",
+        "associated_hours",
+        "aircraft_id",
+        "hourly_rate_type",
+        "status",
+    )
+)
+
+_BUDGET_UPDATE_COLUMNS = frozenset(
+    ("name", "budget_type", "amount", "start_date", "end_date", "categories", "notes", "is_active")
+)
+
+# Columns whose parameter is converted on the way in; any other column binds as ${n}
+_UPDATE_PLACEHOLDERS = {"categories": "to_jsonb(${}::text[])"}
+
+
+@lru_cache(maxsize=512)
+def _update_sql(table: str, columns: Tuple[str, ...], returning: str = "*") -> str:
+    """UPDATE statement setting the given columns as $1..$n, with the row id as the last parameter."""
+    set_clauses = ", ".join(
+        f"{column} = {_UPDATE_PLACEHOLDERS.get(column, '${}').format(position)}"
+        for position, column in enumerate(columns, start=1)
+    )
+    return f"""
+        UPDATE {table}
+        SET {set_clauses}, updated_at = NOW()
+        WHERE id = ${len(columns) + 1}
+        RETURNING {returning}
+    """  # nosec B608 - table and returning are literals, columns come from the *_UPDATE_COLUMNS allow-lists
+
+
+def _update_columns(data: Dict[str, Any], allowed: frozenset) -> Tuple[str, ...]:
+    """
+    Columns to set from update data.
+
+    None values are skipped so they leave the stored value unchanged. The result
+    is sorted so each set of columns always maps to the same cached statement.
+    """
+    return tuple(sorted(column for column in data.keys() & allowed if data[column] is not None))
+
+
+# get_budget_cards filters; {} is replaced with the filter's parameter number
+_BUDGET_CARD_FILTERS = {
+    "status": "bc.status = ${}",
+    "category": "bc.category = ${}",
+    "month": "DATE_TRUNC('month', bc.when_date) = DATE_TRUNC('month', ${}::date)",
+    "year": "EXTRACT(YEAR FROM bc.when_date) = ${}",
+}
+
+
+@lru_cache(maxsize=None)
+def _budget_cards_sql(filters: Tuple[str, ...]) -> str:
+    """get_budget_cards query for the given filters, bound as $1..$n in order."""
+    conditions = "".join(
+        f" AND {_BUDGET_CARD_FILTERS[name].format(position)}" for position, name in enumerate(filters, start=1)
+    )
+    return (
+        f"{_BUDGET_CARD_SELECT} WHERE 1=1{conditions}"
+        " GROUP BY bc.id, a.id, a.tail_number, a.make, a.model ORDER BY bc.when_date DESC, bc.id"
+    )
+
+
+def _serialize_flight(row: Any) -> Dict[str, Any]:
+    """Convert a flights row to a dict with ISO dates and string times."""
+    flight = dict(row)
+    if flight.get("date"):
+        flight["date"] = flight["date"].isoformat()
+    for field in _FLIGHT_TIME_FIELDS:
+        if flight.get(field):
+            flight[field] = str(flight[field])
+    for field in _FLIGHT_TIMESTAMP_FIELDS:
+        if flight.get(field):
+            flight[field] = flight[field].isoformat()
+    return flight
+
+
+async def _reset_connection(conn: asyncpg.Connection) -> None:
+    """
+    Pool release hook that skips asyncpg's default reset query.
+
+    asyncpg still rolls back any open transaction on release. The default query
+    (advisory unlock, CLOSE ALL, UNLISTEN, RESET ALL) would cost a round trip per
+    acquire to undo session state this module never sets.
+    """
+
 
 class PostgresDatabase:
     """Async PostgreSQL database connection pool manager."""
 
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
+        self.read_pool: Optional[asyncpg.Pool] = None
         self.database_url = os.getenv("DATABASE_URL", "postgresql://truehour:truehour@db:5432/truehour")
+        # Optional read replica for the summary queries; unset means they run on the primary
+        self.replica_url = os.getenv("DATABASE_URL_REPLICA") or None
+        self.pool_min_size = int(os.getenv("DB_POOL_MIN", "2"))
+        self.pool_max_size = int(os.getenv("DB_POOL_MAX", "10"))
+        self._summary_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._summary_generation = 0
+
+    async def _create_pool(self, dsn: str, **server_settings: str) -> asyncpg.Pool:
+        # asyncpg prepares each query once per connection and reuses it from this cache.
+        # The optional filters and partial UPDATEs below produce more distinct statements
+        # than the default 100 slots, so size it to keep them all prepared. Idle
+        # connections are kept open rather than closed after five minutes, which would
+        # throw that cache away and make the next request reconnect and re-prepare.
+        # command_timeout stays generous: schema migrations (including concurrent
+        # index builds) and CSV imports run on the primary pool. JIT compilation only
+        # adds latency to the short CRUD and summary queries issued here.
+        return await asyncpg.create_pool(
+            dsn,
+            min_size=self.pool_min_size,
+            max_size=self.pool_max_size,
+            command_timeout=60,
+            statement_cache_size=1024,
+            max_cached_statement_lifetime=0,
+            max_inactive_connection_lifetime=0,
+            reset=_reset_connection,
+            server_settings={"jit": "off", **server_settings},
+        )
 
     async def connect(self):
-        """Create connection pool."""
+        """Create connection pools."""
         if not self.pool:
-            self.pool = await asyncpg.create_pool(self.database_url, min_size=2, max_size=10, command_timeout=60)
+            self.pool = await self._create_pool(self.database_url)
+        if self.replica_url and not self.read_pool:
+            self.read_pool = await self._create_pool(self.replica_url, default_transaction_read_only="on")
 
     async def close(self):
-        """Close connection pool."""
+        """Close connection pools."""
+        if self.read_pool:
+            await self.read_pool.close()
+            self.read_pool = None
         if self.pool:
             await self.pool.close()
             self.pool = None
@@ -35,50 +323,77 @@ class PostgresDatabase:
         async with self.pool.acquire() as conn:
             yield conn
 
+    @asynccontextmanager
+    async def acquire_read(self):
+        """
+        Get a read-only connection for reporting queries.
+
+        Uses the replica pool when DATABASE_URL_REPLICA is set, otherwise the
+        primary pool. Replicas can lag behind writes, so only use this for
+        summaries that tolerate slightly stale data.
+        """
+        if not self.replica_url:
+            async with self.acquire() as conn:
+                yield conn
+            return
+        if not self.read_pool:
+            await self.connect()
+        async with self.read_pool.acquire() as conn:
+            yield conn
+
+    def invalidate_summaries(self) -> None:
+        """Drop cached summaries; call after writing to flights, expenses, budget cards or links."""
+        self._summary_generation += 1
+        self._summary_cache.clear()
+
+    def _cached_summary(self, key: Tuple[Any, ...]) -> Any:
+        """Return a copy of a cached summary if it is still fresh, else None."""
+        entry = self._summary_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= _SUMMARY_CACHE_TTL:
+            return None
+        return copy.deepcopy(entry[1])
+
+    def _store_summary(self, key: Tuple[Any, ...], generation: int, summary: Any, from_replica: bool = False) -> Any:
+        """
+        Cache a summary and return a copy the caller may mutate.
+
+        Skipped if a write invalidated the cache while the summary was being computed,
+        or if it was read from the replica, which may not have applied the latest write
+        yet. Caching that would keep serving the stale result after the invalidation.
+        """
+        if generation == self._summary_generation and not from_replica:
+            self._summary_cache[key] = (time.monotonic(), summary)
+        return copy.deepcopy(summary)
+
     # Aircraft CRUD Operations
 
     async def get_user_aircraft(self, is_active: Optional[bool] = None) -> List[Dict[str, Any]]:
-        """Get list of user aircraft with total flight hours."""
+        """
+        Get list of user aircraft with total flight hours.
+
+        Hours come from aircraft_flight_totals, which a trigger on flights keeps
+        current, so listing aircraft doesn't aggregate the logbook.
+        """
+        query = """
+            SELECT
+                a.id, a.tail_number, a.type_code, a.year, a.make, a.model,
+                a.gear_type, a.engine_type, a.aircraft_class, a.is_complex,
+                a.is_taa, a.is_high_performance, a.is_simulator, a.category,
+                a.hourly_rate_wet, a.hourly_rate_dry, a.notes, a.is_active,
+                a.created_at, a.updated_at, a.fuel_price_per_gallon, a.fuel_burn_rate,
+                a.data_source, a.faa_last_checked,
+                CAST(COALESCE(
+                    CASE WHEN a.is_simulator THEN t.simulated_flight_time ELSE t.total_time END,
+                    0
+                ) AS NUMERIC(10,2)) as total_time
+            FROM aircraft a
+            LEFT JOIN aircraft_flight_totals t ON t.aircraft_id = a.id
+        """
         async with self.acquire() as conn:
             if is_active is None:
-                query = """
-                    SELECT
-                        a.id, a.tail_number, a.type_code, a.year, a.make, a.model,
-                        a.gear_type, a.engine_type, a.aircraft_class, a.is_complex,
-                        a.is_taa, a.is_high_performance, a.is_simulator, a.category,
-                        a.hourly_rate_wet, a.hourly_rate_dry, a.notes, a.is_active,
-                        a.created_at, a.updated_at, a.fuel_price_per_gallon, a.fuel_burn_rate,
-                        a.data_source, a.faa_last_checked,
-                        CAST(COALESCE(
-                            SUM(CASE WHEN a.is_simulator THEN f.simulated_flight_time ELSE f.total_time END),
-                            0
-                        ) AS NUMERIC(10,2)) as total_time
-                    FROM aircraft a
-                    LEFT JOIN flights f ON f.aircraft_id = a.id
-                    GROUP BY a.id
-                    ORDER BY a.tail_number
-                """
-                rows = await conn.fetch(query)
+                rows = await conn.fetch(query + " ORDER BY a.tail_number")
             else:
-                query = """
-                    SELECT
-                        a.id, a.tail_number, a.type_code, a.year, a.make, a.model,
-                        a.gear_type, a.engine_type, a.aircraft_class, a.is_complex,
-                        a.is_taa, a.is_high_performance, a.is_simulator, a.category,
-                        a.hourly_rate_wet, a.hourly_rate_dry, a.notes, a.is_active,
-                        a.created_at, a.updated_at, a.fuel_price_per_gallon, a.fuel_burn_rate,
-                        a.data_source, a.faa_last_checked,
-                        CAST(COALESCE(
-                            SUM(CASE WHEN a.is_simulator THEN f.simulated_flight_time ELSE f.total_time END),
-                            0
-                        ) AS NUMERIC(10,2)) as total_time
-                    FROM aircraft a
-                    LEFT JOIN flights f ON f.aircraft_id = a.id
-                    WHERE a.is_active = $1
-                    GROUP BY a.id
-                    ORDER BY a.tail_number
-                """
-                rows = await conn.fetch(query, is_active)
+                rows = await conn.fetch(query + " WHERE a.is_active = $1 ORDER BY a.tail_number", is_active)
             return [dict(row) for row in rows]
 
     async def get_aircraft_by_id(self, aircraft_id: int) -> Optional[Dict[str, Any]]:
@@ -88,11 +403,21 @@ class PostgresDatabase:
             return dict(row) if row else None
 
     async def get_aircraft_by_tail(self, tail_number: str) -> Optional[Dict[str, Any]]:
-        """Get aircraft by tail number."""
+        """Get aircraft by tail number, ignoring case."""
         async with self.acquire() as conn:
-            row = await conn.fetchrow("SELECT * FROM aircraft WHERE tail_number = $1", tail_number.upper())
+            row = await conn.fetchrow("SELECT * FROM aircraft WHERE UPPER(tail_number) = UPPER($1)", tail_number)
             return dict(row) if row else None
 
+    async def aircraft_exists(self, aircraft_id: int) -> bool:
+        """Check whether an aircraft exists, reading only the primary key index."""
+        async with self.acquire() as conn:
+            return await conn.fetchval("SELECT EXISTS (SELECT 1 FROM aircraft WHERE id = $1)", aircraft_id)
+
+    async def get_aircraft_id_by_tail(self, tail_number: str) -> Optional[int]:
+        """Get the ID of the aircraft with this tail number, ignoring case, reading only the tail number index."""
+        async with self.acquire() as conn:
+            return await conn.fetchval("SELECT id FROM aircraft WHERE UPPER(tail_number) = UPPER($1)", tail_number)
+
     @staticmethod
     def normalize_aircraft_make(make: Optional[str]) -> Optional[str]:
         """Normalize aircraft manufacturer names."""
@@ -192,54 +517,13 @@ class PostgresDatabase:
         if "model" in data and data["model"]:
             data["model"] = self.normalize_aircraft_model(data["model"])
 
+        columns = _update_columns(data, _AIRCRAFT_UPDATE_COLUMNS)
+        if not columns:
+            return await self.get_aircraft_by_id(aircraft_id)
+
         async with self.acquire() as conn:
             row = await conn.fetchrow(
-                """
-                UPDATE aircraft
-                SET
-                    tail_number = COALESCE($2, tail_number),
-                    type_code = COALESCE($3, type_code),
-                    year = COALESCE($4, year),
-                    make = COALESCE($5, make),
-                    model = COALESCE($6, model),
-                    gear_type = COALESCE($7, gear_type),
-                    engine_type = COALESCE($8, engine_type),
-                    aircraft_class = COALESCE($9, aircraft_class),
-                    is_complex = COALESCE($10, is_complex),
-                    is_taa = COALESCE($11, is_taa),
-                    is_high_performance = COALESCE($12, is_high_performance),
-                    is_simulator = COALESCE($13, is_simulator),
-                    category = COALESCE($14, category),
-                    hourly_rate_wet = COALESCE($15, hourly_rate_wet),
-                    hourly_rate_dry = COALESCE($16, hourly_rate_dry),
-                    fuel_burn_rate = COALESCE($17, fuel_burn_rate),
-                    fuel_price_per_gallon = COALESCE($18, fuel_price_per_gallon),
-                    notes = COALESCE($19, notes),
-                    is_active = COALESCE($20, is_active),
-                    updated_at = NOW()
-                WHERE id = $1
-                RETURNING *
-            """,
-                aircraft_id,
-                data.get("tail_number"),
-                data.get("type_code"),
-                data.get("year"),
-                data.get("make"),
-                data.get("model"),
-                data.get("gear_type"),
-                data.get("engine_type"),
-                data.get("aircraft_class"),
-                data.get("is_complex"),
-                data.get("is_taa"),
-                data.get("is_high_performance"),
-                data.get("is_simulator"),
-                data.get("category"),
-                data.get("hourly_rate_wet"),
-                data.get("hourly_rate_dry"),
-                data.get("fuel_burn_rate"),
-                data.get("fuel_price_per_gallon"),
-                data.get("notes"),
-                data.get("is_active"),
+                _update_sql("aircraft", columns), *(data[column] for column in columns), aircraft_id
             )
             return dict(row) if row else None
 
@@ -259,20 +543,15 @@ class PostgresDatabase:
         end_date: Optional[date] = None,
         limit: int = 100,
         offset: int = 0,
+        include_budget_link: bool = False,
     ) -> List[Dict[str, Any]]:
-        """Get list of expenses with filters."""
+        """
+        Get list of expenses with filters.
+
+        Rows only carry budget_card_id when include_budget_link is set.
+        """
         async with self.acquire() as conn:
-            query = """
-                SELECT
-                    e.id, e.aircraft_id, e.category, e.subcategory, e.description,
-                    e.amount, e.date, e.is_recurring, e.recurrence_interval,
-                    e.recurrence_end_date, e.vendor, e.is_tax_deductible, e.tax_category,
-                    e.created_at, e.updated_at,
-                    ebl.budget_card_id
-                FROM expenses e
-                LEFT JOIN expense_budget_links ebl ON e.id = ebl.expense_id
-                WHERE 1=1
-            """
+            query = _EXPENSES_SELECT_WITH_LINK if include_budget_link else _EXPENSES_SELECT_BASE
             params = []
             param_count = 0
 
@@ -308,10 +587,7 @@ class PostgresDatabase:
 
             rows = await conn.fetch(query, *params)
             result = [dict(row) for row in rows]
-            if result:
-                print(f"[DEBUG] get_expenses returning {len(result)} expenses")
-                print(f"[DEBUG] First expense keys: {list(result[0].keys())}")
-                print(f"[DEBUG] First expense budget_card_id: {result[0].get('budget_card_id')}")
+            logger.debug("get_expenses returning %d expenses", len(result))
             return result
 
     async def get_expense_by_id(self, expense_id: int) -> Optional[Dict[str, Any]]:
@@ -335,102 +611,106 @@ class PostgresDatabase:
 
     async def create_expense(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new expense."""
-        async with self.acquire() as conn:
-            # Extract budget_card_id for separate handling
-            budget_card_id = data.get("budget_card_id")
+        expenses = await self.create_expenses_bulk([data])
+        return expenses[0]
 
-            # Insert expense without budget_card_id
-            row = await conn.fetchrow(
-                """
-                INSERT INTO expenses (
-                    aircraft_id, category, subcategory, description, amount, date,
-                    is_recurring, recurrence_interval, recurrence_end_date,
-                    vendor, is_tax_deductible, tax_category
-                )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                RETURNING *
-            """,
-                data.get("aircraft_id"),
-                data["category"],
-                data.get("subcategory"),
-                data.get("description"),
-                data["amount"],
-                data["date"],
-                data.get("is_recurring", False),
-                data.get("recurrence_interval"),
-                data.get("recurrence_end_date"),
-                data.get("vendor"),
-                data.get("is_tax_deductible", False),
-                data.get("tax_category"),
-            )
+    async def create_expenses_bulk(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create expenses and their budget card links in one statement.
 
-            expense = dict(row)
+        Returns the created expenses in input order, each with its budget_card_id.
+        """
+        if not items:
+            return []
 
-            # If budget_card_id provided, create link
-            if budget_card_id:
-                await conn.execute(
-                    """
+        async with self.acquire() as conn:
+            # Ids are drawn up front so each link can be joined to its expense
+            rows = await conn.fetch(
+                """
+                WITH input AS (
+                    SELECT nextval(pg_get_serial_sequence('expenses', 'id')) AS id, t.*
+                    FROM unnest(
+                        $1::integer[], $2::text[], $3::text[], $4::text[], $5::numeric[], $6::date[],
+                        $7::boolean[], $8::text[], $9::date[], $10::text[], $11::boolean[], $12::text[],
+                        $13::integer[]
+                    ) WITH ORDINALITY AS t(
+                        aircraft_id, category, subcategory, description, amount, date,
+                        is_recurring, recurrence_interval, recurrence_end_date,
+                        vendor, is_tax_deductible, tax_category, budget_card_id, ord
+                    )
+                ),
+                inserted AS (
+                    INSERT INTO expenses (
+                        id, aircraft_id, category, subcategory, description, amount, date,
+                        is_recurring, recurrence_interval, recurrence_end_date,
+                        vendor, is_tax_deductible, tax_category
+                    )
+                    SELECT
+                        id, aircraft_id, category, subcategory, description, amount, date,
+                        is_recurring, recurrence_interval, recurrence_end_date,
+                        vendor, is_tax_deductible, tax_category
+                    FROM input
+                    RETURNING *
+                ),
+                links AS (
                     INSERT INTO expense_budget_links (expense_id, budget_card_id, amount)
-                    VALUES ($1, $2, $3)
-                    """,
-                    expense["id"],
-                    budget_card_id,
-                    expense["amount"],
+                    SELECT id, budget_card_id, amount
+                    FROM input
+                    WHERE budget_card_id IS NOT NULL
                 )
-                expense["budget_card_id"] = budget_card_id
-
-            return expense
+                SELECT inserted.*, input.budget_card_id
+                FROM inserted
+                JOIN input USING (id)
+                ORDER BY input.ord
+            """,
+                [item.get("aircraft_id") for item in items],
+                [item["category"] for item in items],
+                [item.get("subcategory") for item in items],
+                [item.get("description") for item in items],
+                [item["amount"] for item in items],
+                [item["date"] for item in items],
+                [item.get("is_recurring", False) for item in items],
+                [item.get("recurrence_interval") for item in items],
+                [item.get("recurrence_end_date") for item in items],
+                [item.get("vendor") for item in items],
+                [item.get("is_tax_deductible", False) for item in items],
+                [item.get("tax_category") for item in items],
+                [item.get("budget_card_id") or None for item in items],
+            )
+        self.invalidate_summaries()
+        return [dict(row) for row in rows]
 
     async def update_expense(self, expense_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update expense."""
+        columns = _update_columns(data, _EXPENSE_UPDATE_COLUMNS)
+        if not columns:
+            return await self.get_expense_by_id(expense_id)
+
         async with self.acquire() as conn:
             row = await conn.fetchrow(
-                """
-                UPDATE expenses
-                SET
-                    aircraft_id = COALESCE($2, aircraft_id),
-                    category = COALESCE($3, category),
-                    subcategory = COALESCE($4, subcategory),
-                    description = COALESCE($5, description),
-                    amount = COALESCE($6, amount),
-                    date = COALESCE($7, date),
-                    is_recurring = COALESCE($8, is_recurring),
-                    recurrence_interval = COALESCE($9, recurrence_interval),
-                    recurrence_end_date = COALESCE($10, recurrence_end_date),
-                    vendor = COALESCE($11, vendor),
-                    is_tax_deductible = COALESCE($12, is_tax_deductible),
-                    tax_category = COALESCE($13, tax_category),
-                    updated_at = NOW()
-                WHERE id = $1
-                RETURNING *
-            """,
-                expense_id,
-                data.get("aircraft_id"),
-                data.get("category"),
-                data.get("subcategory"),
-                data.get("description"),
-                data.get("amount"),
-                data.get("date"),
-                data.get("is_recurring"),
-                data.get("recurrence_interval"),
-                data.get("recurrence_end_date"),
-                data.get("vendor"),
-                data.get("is_tax_deductible"),
-                data.get("tax_category"),
+                _update_sql("expenses", columns), *(data[column] for column in columns), expense_id
             )
-            return dict(row) if row else None
+        self.invalidate_summaries()
+        return dict(row) if row else None
 
     async def delete_expense(self, expense_id: int) -> bool:
         """Delete expense."""
         async with self.acquire() as conn:
             result = await conn.execute("DELETE FROM expenses WHERE id = $1", expense_id)
-            return result == "DELETE 1"
+        self.invalidate_summaries()
+        return result == "DELETE 1"
 
     async def get_expense_summary(
         self, start_date: Optional[date] = None, end_date: Optional[date] = None, group_by: str = "category"
     ) -> List[Dict[str, Any]]:
         """Get expense summary grouped by category or subcategory."""
-        async with self.acquire() as conn:
+        key = ("expense_summary", start_date, end_date, group_by)
+        cached = self._cached_summary(key)
+        if cached is not None:
+            return cached
+
+        generation = self._summary_generation
+        async with self.acquire_read() as conn:
             # group_field is validated to be either 'category' or 'subcategory'
             group_field = "category" if group_by == "category" else "subcategory"
             query = f"""
@@ -460,7 +740,7 @@ class PostgresDatabase:
             query += f" GROUP BY {group_field} ORDER BY total_amount DESC"
 
             rows = await conn.fetch(query, *params)
-            return [dict(row) for row in rows]
+        return self._store_summary(key, generation, [dict(row) for row in rows], from_replica=bool(self.replica_url))
 
     # Flight/Logbook Operations
 
@@ -508,38 +788,7 @@ class PostgresDatabase:
             params.append(offset)
 
             rows = await conn.fetch(query, *params)
-            # Convert to dict and handle date/time serialization
-            result = []
-            for row in rows:
-                flight = dict(row)
-                # Convert date to ISO string
-                if flight.get("date"):
-                    flight["date"] = flight["date"].isoformat()
-                # Convert time fields to string
-                for field in ["time_out", "time_off", "time_on", "time_in"]:
-                    if flight.get(field):
-                        flight[field] = str(flight[field])
-                # Convert timestamps
-                for field in ["created_at", "updated_at"]:
-                    if flight.get(field):
-                        flight[field] = flight[field].isoformat()
-                # Handle NULL integer fields with defaults
-                for field in [
-                    "day_takeoffs",
-                    "day_landings_full_stop",
-                    "night_takeoffs",
-                    "night_landings_full_stop",
-                    "all_landings",
-                    "holds",
-                ]:
-                    if flight.get(field) is None:
-                        flight[field] = 0
-                # Handle NULL boolean fields with defaults
-                for field in ["is_flight_review", "is_ipc", "is_checkride", "is_simulator_session"]:
-                    if flight.get(field) is None:
-                        flight[field] = False
-                result.append(flight)
-            return result
+            return [_serialize_flight(row) for row in rows]
 
     async def get_flight_by_id(self, flight_id: int) -> Optional[Dict[str, Any]]:
         """Get single flight by ID."""
@@ -552,36 +801,37 @@ class PostgresDatabase:
             """,
                 flight_id,
             )
-            if row:
-                flight = dict(row)
-                # Convert date to ISO string
-                if flight.get("date"):
-                    flight["date"] = flight["date"].isoformat()
-                # Convert time fields to string
-                for field in ["time_out", "time_off", "time_on", "time_in"]:
-                    if flight.get(field):
-                        flight[field] = str(flight[field])
-                # Convert timestamps
-                for field in ["created_at", "updated_at"]:
-                    if flight.get(field):
-                        flight[field] = flight[field].isoformat()
-                # Handle NULL integer fields with defaults
-                for field in [
-                    "day_takeoffs",
-                    "day_landings_full_stop",
-                    "night_takeoffs",
-                    "night_landings_full_stop",
-                    "all_landings",
-                    "holds",
-                ]:
-                    if flight.get(field) is None:
-                        flight[field] = 0
-                # Handle NULL boolean fields with defaults
-                for field in ["is_flight_review", "is_ipc", "is_checkride", "is_simulator_session"]:
-                    if flight.get(field) is None:
-                        flight[field] = False
-                return flight
-            return None
+            return _serialize_flight(row) if row else None
+
+    async def iter_flights(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        prefetch: int = 500,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Stream flights, newest first, without loading them all into memory.
+
+        Rows come from a server-side cursor, prefetch at a time. The pooled
+        connection is held until the iterator is exhausted or closed.
+        """
+        query = "SELECT * FROM flights WHERE 1=1"
+        params: List[Any] = []
+
+        if start_date:
+            params.append(start_date)
+            query += f" AND date >= ${len(params)}"
+
+        if end_date:
+            params.append(end_date)
+            query += f" AND date <= ${len(params)}"
+
+        query += " ORDER BY date DESC, time_out DESC"
+
+        async with self.acquire() as conn:
+            async with conn.transaction(readonly=True):
+                async for row in conn.cursor(query, *params, prefetch=prefetch):
+                    yield _serialize_flight(row)
 
     async def create_flight(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new flight."""
@@ -662,71 +912,30 @@ class PostgresDatabase:
                 data.get("rental_cost"),
                 data.get("other_costs"),
             )
-            flight = dict(row)
-            # Convert date to ISO string
-            if flight.get("date"):
-                flight["date"] = flight["date"].isoformat()
-            # Convert time fields to string
-            for field in ["time_out", "time_off", "time_on", "time_in"]:
-                if flight.get(field):
-                    flight[field] = str(flight[field])
-            # Convert timestamps
-            for field in ["created_at", "updated_at"]:
-                if flight.get(field):
-                    flight[field] = flight[field].isoformat()
-            return flight
+        self.invalidate_summaries()
+        return _serialize_flight(row)
 
     async def update_flight(self, flight_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update flight."""
-        async with self.acquire() as conn:
-            # Build dynamic UPDATE query
-            set_clauses = []
-            params = []
-            param_count = 0
-
-            # Convert approaches dict to JSON if present
-            if "approaches" in data and data["approaches"] is not None:
-                data["approaches"] = json.dumps(data["approaches"])
-
-            for key, value in data.items():
-                param_count += 1
-                set_clauses.append(f"{key} = ${param_count}")
-                params.append(value)
-
-            if not set_clauses:
-                return await self.get_flight_by_id(flight_id)
+        # Convert approaches dict to JSON if present
+        if "approaches" in data and data["approaches"] is not None:
+            data["approaches"] = json.dumps(data["approaches"])
 
-            param_count += 1
-            query = f"""
-                UPDATE flights
-                SET {', '.join(set_clauses)}, updated_at = NOW()
-                WHERE id = ${param_count}
-                RETURNING *
-            """  # nosec B608 - column names derived from Pydantic model fields, not user input
-            params.append(flight_id)
+        columns = _update_columns(data, _FLIGHT_UPDATE_COLUMNS)
+        if not columns:
+            return await self.get_flight_by_id(flight_id)
 
-            row = await conn.fetchrow(query, *params)
-            if row:
-                flight = dict(row)
-                # Convert date to ISO string
-                if flight.get("date"):
-                    flight["date"] = flight["date"].isoformat()
-                # Convert time fields to string
-                for field in ["time_out", "time_off", "time_on", "time_in"]:
-                    if flight.get(field):
-                        flight[field] = str(flight[field])
-                # Convert timestamps
-                for field in ["created_at", "updated_at"]:
-                    if flight.get(field):
-                        flight[field] = flight[field].isoformat()
-                return flight
-            return None
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(_update_sql("flights", columns), *(data[column] for column in columns), flight_id)
+        self.invalidate_summaries()
+        return _serialize_flight(row) if row else None
 
     async def delete_flight(self, flight_id: int) -> bool:
         """Delete flight."""
         async with self.acquire() as conn:
             result = await conn.execute("DELETE FROM flights WHERE id = $1", flight_id)
-            return result == "DELETE 1"
+        self.invalidate_summaries()
+        return result == "DELETE 1"
 
     async def get_flight_summary(
         self,
@@ -734,7 +943,13 @@ class PostgresDatabase:
         end_date: Optional[date] = None,
     ) -> Dict[str, Any]:
         """Get flight summary statistics."""
-        async with self.acquire() as conn:
+        key = ("flight_summary", start_date, end_date)
+        cached = self._cached_summary(key)
+        if cached is not None:
+            return cached
+
+        generation = self._summary_generation
+        async with self.acquire_read() as conn:
             query = """
                 SELECT
                     COUNT(*) as total_flights,
@@ -766,7 +981,7 @@ class PostgresDatabase:
                 query += f" AND date <= ${len(params)}"
 
             row = await conn.fetchrow(query, *params)
-            return dict(row) if row else {}
+        return self._store_summary(key, generation, dict(row) if row else {}, from_replica=bool(self.replica_url))
 
     # User Settings Operations
 
@@ -782,94 +997,61 @@ class PostgresDatabase:
         """Get list of budgets."""
         async with self.acquire() as conn:
             if is_active is None:
-                rows = await conn.fetch("SELECT * FROM budgets ORDER BY is_active DESC, created_at DESC")
+                rows = await conn.fetch(
+                    f"SELECT {_BUDGET_COLUMNS} FROM budgets ORDER BY is_active DESC, created_at DESC"  # nosec B608
+                )
             else:
                 rows = await conn.fetch(
-                    "SELECT * FROM budgets WHERE is_active = $1 ORDER BY created_at DESC", is_active
+                    f"""
+                    SELECT {_BUDGET_COLUMNS}
+                    FROM budgets
+                    WHERE is_active = $1
+                    ORDER BY created_at DESC
+                """,  # nosec B608 - _BUDGET_COLUMNS is a constant
+                    is_active,
                 )
-            # Parse categories JSON field
-            result = []
-            for row in rows:
-                budget = dict(row)
-                if budget.get("categories"):
-                    budget["categories"] = json.loads(budget["categories"])
-                result.append(budget)
-            return result
+            return [dict(row) for row in rows]
 
     async def get_budget_by_id(self, budget_id: int) -> Optional[Dict[str, Any]]:
         """Get single budget by ID."""
         async with self.acquire() as conn:
-            row = await conn.fetchrow("SELECT * FROM budgets WHERE id = $1", budget_id)
-            if row:
-                budget = dict(row)
-                if budget.get("categories"):
-                    budget["categories"] = json.loads(budget["categories"])
-                return budget
-            return None
+            row = await conn.fetchrow(f"SELECT {_BUDGET_COLUMNS} FROM budgets WHERE id = $1", budget_id)  # nosec B608
+            return dict(row) if row else None
 
     async def create_budget(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new budget."""
         async with self.acquire() as conn:
-            categories_json = json.dumps(data.get("categories")) if data.get("categories") else None
             row = await conn.fetchrow(
-                """
+                f"""
                 INSERT INTO budgets (
                     name, budget_type, amount, start_date, end_date,
                     categories, notes, is_active
                 )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                RETURNING *
-            """,
+                VALUES ($1, $2, $3, $4, $5, to_jsonb($6::text[]), $7, $8)
+                RETURNING {_BUDGET_COLUMNS}
+            """,  # nosec B608 - _BUDGET_COLUMNS is a constant
                 data["name"],
                 data["budget_type"],
                 data["amount"],
                 data.get("start_date"),
                 data.get("end_date"),
-                categories_json,
+                data.get("categories") or None,
                 data.get("notes"),
                 data.get("is_active", True),
             )
-            budget = dict(row)
-            if budget.get("categories"):
-                budget["categories"] = json.loads(budget["categories"])
-            return budget
+            return dict(row)
 
     async def update_budget(self, budget_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update budget."""
+        columns = _update_columns(data, _BUDGET_UPDATE_COLUMNS)
+        if not columns:
+            return await self.get_budget_by_id(budget_id)
+
         async with self.acquire() as conn:
-            categories_json = json.dumps(data.get("categories")) if "categories" in data else None
             row = await conn.fetchrow(
-                """
-                UPDATE budgets
-                SET
-                    name = COALESCE($2, name),
-                    budget_type = COALESCE($3, budget_type),
-                    amount = COALESCE($4, amount),
-                    start_date = COALESCE($5, start_date),
-                    end_date = COALESCE($6, end_date),
-                    categories = COALESCE($7, categories),
-                    notes = COALESCE($8, notes),
-                    is_active = COALESCE($9, is_active),
-                    updated_at = NOW()
-                WHERE id = $1
-                RETURNING *
-            """,
-                budget_id,
-                data.get("name"),
-                data.get("budget_type"),
-                data.get("amount"),
-                data.get("start_date"),
-                data.get("end_date"),
-                categories_json,
-                data.get("notes"),
-                data.get("is_active"),
+                _update_sql("budgets", columns, _BUDGET_COLUMNS), *(data[column] for column in columns), budget_id
             )
-            if row:
-                budget = dict(row)
-                if budget.get("categories"):
-                    budget["categories"] = json.loads(budget["categories"])
-                return budget
-            return None
+            return dict(row) if row else None
 
     async def delete_budget(self, budget_id: int) -> bool:
         """Delete budget (cascade deletes entries)."""
@@ -882,14 +1064,24 @@ class PostgresDatabase:
     async def get_budget_entries(self, budget_id: int) -> List[Dict[str, Any]]:
         """Get all entries for a budget."""
         async with self.acquire() as conn:
-            rows = await conn.fetch("SELECT * FROM budget_entries WHERE budget_id = $1 ORDER BY month DESC", budget_id)
+            rows = await conn.fetch(
+                f"""
+                SELECT {_BUDGET_ENTRY_COLUMNS}
+                FROM budget_entries
+                WHERE budget_id = $1
+                ORDER BY month DESC
+            """,  # nosec B608 - _BUDGET_ENTRY_COLUMNS is a constant
+                budget_id,
+            )
             return [dict(row) for row in rows]
 
     async def get_budget_entry(self, budget_id: int, month: date) -> Optional[Dict[str, Any]]:
         """Get single budget entry by budget ID and month."""
         async with self.acquire() as conn:
             row = await conn.fetchrow(
-                "SELECT * FROM budget_entries WHERE budget_id = $1 AND month = $2", budget_id, month
+                f"SELECT {_BUDGET_ENTRY_COLUMNS} FROM budget_entries WHERE budget_id = $1 AND month = $2",  # nosec B608
+                budget_id,
+                month,
             )
             return dict(row) if row else None
 
@@ -897,15 +1089,15 @@ class PostgresDatabase:
         """Create or update budget entry (upsert)."""
         async with self.acquire() as conn:
             row = await conn.fetchrow(
-                """
+                f"""
                 INSERT INTO budget_entries (budget_id, month, allocated_amount, notes)
                 VALUES ($1, $2, $3, $4)
                 ON CONFLICT (budget_id, month)
                 DO UPDATE SET
                     allocated_amount = EXCLUDED.allocated_amount,
                     notes = EXCLUDED.notes
-                RETURNING *
-            """,
+                RETURNING {_BUDGET_ENTRY_COLUMNS}
+            """,  # nosec B608
                 budget_id,
                 data["month"],
                 data["allocated_amount"],
@@ -922,72 +1114,29 @@ class PostgresDatabase:
     # Budget Card Operations
 
     async def get_budget_cards(
-        self, status: Optional[str] = None, category: Optional[str] = None, month: Optional[date] = None
+        self,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        month: Optional[date] = None,
+        year: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get list of budget cards with optional filtering."""
+        values = {"status": status, "category": category, "month": month, "year": year}
+        filters = tuple(name for name in _BUDGET_CARD_FILTERS if values[name])
         async with self.acquire() as conn:
-            query = """
-                SELECT
-                    bc.*,
-                    COALESCE(SUM(ebl.amount), 0) as actual_amount,
-                    bc.budgeted_amount - COALESCE(SUM(ebl.amount), 0) as remaining_amount,
-                    a.tail_number as aircraft_tail,
-                    a.make as aircraft_make,
-                    a.model as aircraft_model
-                FROM budget_cards bc
-                LEFT JOIN expense_budget_links ebl ON bc.id = ebl.budget_card_id
-                LEFT JOIN aircraft a ON bc.aircraft_id = a.id
-                WHERE 1=1
-            """
-            params = []
-            param_count = 1
-
-            if status:
-                query += f" AND bc.status = ${param_count}"
-                params.append(status)
-                param_count += 1
-
-            if category:
-                query += f" AND bc.category = ${param_count}"
-                params.append(category)
-                param_count += 1
-
-            if month:
-                query += f" AND DATE_TRUNC('month', bc.when_date) = DATE_TRUNC('month', ${param_count}::date)"
-                params.append(month)
-                param_count += 1
-
-            query += " GROUP BY bc.id, a.id, a.tail_number, a.make, a.model ORDER BY bc.when_date DESC, bc.id"
-
-            rows = await conn.fetch(query, *params)
+            rows = await conn.fetch(_budget_cards_sql(filters), *(values[name] for name in filters))
             return [dict(row) for row in rows]
 
     async def get_budget_card(self, card_id: int) -> Optional[Dict[str, Any]]:
         """Get single budget card by ID."""
         async with self.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                SELECT
-                    bc.*,
-                    COALESCE(SUM(ebl.amount), 0) as actual_amount,
-                    bc.budgeted_amount - COALESCE(SUM(ebl.amount), 0) as remaining_amount,
-                    a.tail_number as aircraft_tail,
-                    a.make as aircraft_make,
-                    a.model as aircraft_model
-                FROM budget_cards bc
-                LEFT JOIN expense_budget_links ebl ON bc.id = ebl.budget_card_id
-                LEFT JOIN aircraft a ON bc.aircraft_id = a.id
-                WHERE bc.id = $1
-                GROUP BY bc.id, a.id, a.tail_number, a.make, a.model
-            """,
-                card_id,
-            )
+            row = await conn.fetchrow(_BUDGET_CARD_BY_ID, card_id)
             return dict(row) if row else None
 
     async def create_budget_card(self, data: Dict[str, Any]) -> int:
         """Create new budget card and return its ID."""
         async with self.acquire() as conn:
-            row = await conn.fetchrow(
+            card_id = await conn.fetchval(
                 """
                 INSERT INTO budget_cards (
                     name, category, frequency, when_date, budgeted_amount,
@@ -1007,66 +1156,43 @@ class PostgresDatabase:
                 data.get("hourly_rate_type", "wet"),
                 data.get("status", "active"),
             )
-            return row["id"]
+        self.invalidate_summaries()
+        return card_id
 
     async def update_budget_card(self, card_id: int, data: Dict[str, Any]) -> bool:
         """Update budget card."""
-        if not data:
+        columns = tuple(sorted(data.keys() & _BUDGET_CARD_UPDATE_COLUMNS))
+        if not columns:
             return False
 
         async with self.acquire() as conn:
-            # Build dynamic UPDATE query
-            set_clauses = []
-            params = []
-            param_count = 1
-
-            for field in [
-                "name",
-                "category",
-                "frequency",
-                "when_date",
-                "budgeted_amount",
-                "notes",
-                "associated_hours",
-                "aircraft_id",
-                "hourly_rate_type",
-                "status",
-            ]:
-                if field in data:
-                    set_clauses.append(f"{field} = ${param_count}")
-                    params.append(data[field])
-                    param_count += 1
-
-            if not set_clauses:
-                return False
-
-            set_clauses.append("updated_at = NOW()")
-            params.append(card_id)
-
-            query = f"""
-                UPDATE budget_cards
-                SET {", ".join(set_clauses)}
-                WHERE id = ${param_count}
-            """  # nosec B608 - field names from hardcoded allowlist, not user input
-
-            result = await conn.execute(query, *params)
-            return result == "UPDATE 1"
+            result = await conn.execute(
+                _update_sql("budget_cards", columns, "id"), *(data[column] for column in columns), card_id
+            )
+        self.invalidate_summaries()
+        return result == "UPDATE 1"
 
     async def delete_budget_card(self, card_id: int) -> bool:
         """Delete budget card."""
         async with self.acquire() as conn:
             result = await conn.execute("DELETE FROM budget_cards WHERE id = $1", card_id)
-            return result == "DELETE 1"
+        self.invalidate_summaries()
+        return result == "DELETE 1"
 
     async def get_monthly_budget_summary(self, year: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get monthly budget summary."""
+        key = ("monthly_budget_summary", year)
+        cached = self._cached_summary(key)
+        if cached is not None:
+            return cached
+
+        generation = self._summary_generation
         async with self.acquire() as conn:
             query = """
                 SELECT
                     DATE_TRUNC('month', bc.when_date)::date as month,
                     SUM(bc.budgeted_amount) as total_budgeted,
-                    SUM(COALESCE(ebl_sum.actual, 0)) as total_actual,
-                    SUM(bc.budgeted_amount - COALESCE(ebl_sum.actual, 0)) as total_remaining
+                    SUM(COALESCE(ebl_sum.actual, 0)) as total_actual
                 FROM budget_cards bc
                 LEFT JOIN (
                     SELECT budget_card_id, SUM(amount) as actual
@@ -1083,17 +1209,22 @@ class PostgresDatabase:
             query += " GROUP BY DATE_TRUNC('month', bc.when_date) ORDER BY month"
 
             rows = await conn.fetch(query, *params)
-            return [dict(row) for row in rows]
+        return self._store_summary(key, generation, [dict(row) for row in rows])
 
     async def get_category_budget_summary(self, year: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get budget summary by category."""
+        key = ("category_budget_summary", year)
+        cached = self._cached_summary(key)
+        if cached is not None:
+            return cached
+
+        generation = self._summary_generation
         async with self.acquire() as conn:
             query = """
                 SELECT
                     bc.category,
                     SUM(bc.budgeted_amount) as total_budgeted,
                     SUM(COALESCE(ebl_sum.actual, 0)) as total_actual,
-                    SUM(bc.budgeted_amount - COALESCE(ebl_sum.actual, 0)) as total_remaining,
                     COUNT(bc.id) as card_count
                 FROM budget_cards bc
                 LEFT JOIN (
@@ -1111,26 +1242,36 @@ class PostgresDatabase:
             query += " GROUP BY bc.category ORDER BY total_budgeted DESC"
 
             rows = await conn.fetch(query, *params)
-            return [dict(row) for row in rows]
+        return self._store_summary(key, generation, [dict(row) for row in rows])
+
+    async def get_annual_budget_summary(self, year: int, include_cards: bool = True) -> Dict[str, Any]:
+        """
+        Get complete annual budget summary.
 
-    async def get_annual_budget_summary(self, year: int) -> Dict[str, Any]:
-        """Get complete annual budget summary."""
-        monthly = await self.get_monthly_budget_summary(year)
-        by_category = await self.get_category_budget_summary(year)
+        With include_cards=False only the aggregate queries run and the months
+        carry no "cards" list.
+        """
+        # The queries are independent, so each runs on its own pool connection
+        queries = [self.get_monthly_budget_summary(year), self.get_category_budget_summary(year)]
+        if include_cards:
+            queries.append(self.get_budget_cards(year=year))
+        monthly, by_category, *cards = await asyncio.gather(*queries)
 
         total_budgeted = sum(m["total_budgeted"] for m in monthly)
         total_actual = sum(m["total_actual"] for m in monthly)
 
-        # Get cards for each month
-        for month_summary in monthly:
-            cards = await self.get_budget_cards(month=month_summary["month"])
-            month_summary["cards"] = cards
+        # Bucket the year's cards by month
+        if include_cards:
+            cards_by_month = defaultdict(list)
+            for card in cards[0]:
+                cards_by_month[card["when_date"].replace(day=1)].append(card)
+            for month_summary in monthly:
+                month_summary["cards"] = cards_by_month[month_summary["month"]]
 
         return {
             "year": year,
             "total_budgeted": total_budgeted,
             "total_actual": total_actual,
-            "total_remaining": total_budgeted - total_actual,
             "by_month": monthly,
             "by_category": by_category,
         }
@@ -1140,7 +1281,7 @@ class PostgresDatabase:
     async def create_expense_budget_link(self, data: Dict[str, Any]) -> int:
         """Create expense-budget card link and return its ID."""
         async with self.acquire() as conn:
-            row = await conn.fetchrow(
+            link_id = await conn.fetchval(
                 """
                 INSERT INTO expense_budget_links (expense_id, budget_card_id, amount)
                 VALUES ($1, $2, $3)
@@ -1150,13 +1291,14 @@ class PostgresDatabase:
                 data["budget_card_id"],
                 data["amount"],
             )
-            return row["id"]
+        self.invalidate_summaries()
+        return link_id
 
     async def get_expense_budget_link(self, link_id: int) -> Optional[Dict[str, Any]]:
         """Get expense-budget link by ID."""
         async with self.acquire() as conn:
             row = await conn.fetchrow(
-                "SELECT * FROM expense_budget_links WHERE id = $1",
+                f"SELECT {_EXPENSE_BUDGET_LINK_COLUMNS} FROM expense_budget_links WHERE id = $1",  # nosec B608
                 link_id,
             )
             return dict(row) if row else None
@@ -1169,7 +1311,8 @@ class PostgresDatabase:
                 expense_id,
                 budget_card_id,
             )
-            return result == "DELETE 1"
+        self.invalidate_summaries()
+        return result == "DELETE 1"
 
 
 # Global database instance
@@ -111,8 +111,7 @@ async def get_aircraft(aircraft_id: int):
 async def create_aircraft(aircraft: UserAircraftCreate):
     """Add aircraft to user's list."""
     # Check if tail number already exists
-    existing = await postgres_db.get_aircraft_by_tail(aircraft.tail_number)
-    if existing:
+    if await postgres_db.get_aircraft_id_by_tail(aircraft.tail_number) is not None:
         raise HTTPException(status_code=409, detail=f"Aircraft {aircraft.tail_number} already exists")
 
     try:
@@ -126,14 +125,13 @@ async def create_aircraft(aircraft: UserAircraftCreate):
 async def update_aircraft(aircraft_id: int, aircraft: UserAircraftUpdate):
     """Update aircraft details."""
     # Check if aircraft exists
-    existing = await postgres_db.get_aircraft_by_id(aircraft_id)
-    if not existing:
+    if not await postgres_db.aircraft_exists(aircraft_id):
         raise HTTPException(status_code=404, detail="Aircraft not found")
 
     # If updating tail number, check for conflicts
     if aircraft.tail_number:
-        conflict = await postgres_db.get_aircraft_by_tail(aircraft.tail_number)
-        if conflict and conflict["id"] != aircraft_id:
+        conflict_id = await postgres_db.get_aircraft_id_by_tail(aircraft.tail_number)
+        if conflict_id is not None and conflict_id != aircraft_id:
             raise HTTPException(status_code=409, detail=f"Aircraft {aircraft.tail_number} already exists")
 
     try:
@@ -2,16 +2,19 @@
 
 from datetime import date as date_type
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from app.models import (
     AnnualBudgetSummary,
+    AnnualBudgetSummarySlim,
     BudgetCardCreate,
     BudgetCardResponse,
     BudgetCardUpdate,
     CategoryBudgetSummary,
     ExpenseBudgetLinkResponse,
     MonthlyBudgetSummary,
+    MonthlyBudgetSummarySlim,
+    from_row,
 )
 from app.postgres_database import postgres_db
 from fastapi import APIRouter, HTTPException, Query
@@ -19,6 +22,26 @@ from fastapi import APIRouter, HTTPException, Query
 router = APIRouter(prefix="/api/user/budget-cards", tags=["Budget Cards"])
 
 
+def _annual_summary_from_row(summary: dict) -> AnnualBudgetSummary:
+    """Build an AnnualBudgetSummary, including its nested months and cards, from database rows."""
+    by_month = [
+        from_row(
+            MonthlyBudgetSummary,
+            {**month, "cards": [from_row(BudgetCardResponse, card) for card in month["cards"]]},
+        )
+        for month in summary["by_month"]
+    ]
+    by_category = [from_row(CategoryBudgetSummary, row) for row in summary["by_category"]]
+    return from_row(AnnualBudgetSummary, {**summary, "by_month": by_month, "by_category": by_category})
+
+
+def _annual_totals_from_row(summary: dict) -> AnnualBudgetSummarySlim:
+    """Build an AnnualBudgetSummarySlim (totals only, no cards) from database rows."""
+    by_month = [from_row(MonthlyBudgetSummarySlim, month) for month in summary["by_month"]]
+    by_category = [from_row(CategoryBudgetSummary, row) for row in summary["by_category"]]
+    return from_row(AnnualBudgetSummarySlim, {**summary, "by_month": by_month, "by_category": by_category})
+
+
 @router.get("/", response_model=List[BudgetCardResponse])
 async def list_budget_cards(
     status: Optional[str] = Query(None, description="Filter by status (active, completed, cancelled)"),
@@ -28,7 +51,7 @@ async def list_budget_cards(
     """List all budget cards with optional filtering."""
     try:
         cards = await postgres_db.get_budget_cards(status=status, category=category, month=month)
-        return cards
+        return [from_row(BudgetCardResponse, card) for card in cards]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -40,7 +63,7 @@ async def get_budget_card(card_id: int):
         card = await postgres_db.get_budget_card(card_id)
         if not card:
             raise HTTPException(status_code=404, detail="Budget card not found")
-        return card
+        return from_row(BudgetCardResponse, card)
     except HTTPException:
         raise
     except Exception as e:
@@ -53,7 +76,7 @@ async def create_budget_card(card: BudgetCardCreate):
     try:
         card_id = await postgres_db.create_budget_card(card.model_dump())
         created_card = await postgres_db.get_budget_card(card_id)
-        return created_card
+        return from_row(BudgetCardResponse, created_card)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -70,7 +93,7 @@ async def update_budget_card(card_id: int, card: BudgetCardUpdate):
         # Update
         await postgres_db.update_budget_card(card_id, card.model_dump(exclude_unset=True))
         updated_card = await postgres_db.get_budget_card(card_id)
-        return updated_card
+        return from_row(BudgetCardResponse, updated_card)
     except HTTPException:
         raise
     except Exception as e:
@@ -119,7 +142,7 @@ async def duplicate_budget_card(card_id: int):
         # Create the duplicate
         new_card_id = await postgres_db.create_budget_card(duplicate_data)
         duplicated_card = await postgres_db.get_budget_card(new_card_id)
-        return duplicated_card
+        return from_row(BudgetCardResponse, duplicated_card)
     except HTTPException:
         raise
     except Exception as e:
@@ -145,17 +168,22 @@ async def get_category_summary(
     """Get budget summary by category."""
     try:
         summary = await postgres_db.get_category_budget_summary(year)
-        return summary
+        return [from_row(CategoryBudgetSummary, row) for row in summary]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/summary/annual", response_model=AnnualBudgetSummary)
-async def get_annual_summary(year: int = Query(..., description="Year to summarize")):
-    """Get complete annual budget summary."""
+@router.get("/summary/annual", response_model=Union[AnnualBudgetSummary, AnnualBudgetSummarySlim])
+async def get_annual_summary(
+    year: int = Query(..., description="Year to summarize"),
+    detail: bool = Query(True, description="Include the budget cards for each month"),
+):
+    """Get complete annual budget summary, or only its totals with detail=false."""
     try:
-        summary = await postgres_db.get_annual_budget_summary(year)
-        return summary
+        summary = await postgres_db.get_annual_budget_summary(year, include_cards=detail)
+        if not detail:
+            return _annual_totals_from_row(summary)
+        return _annual_summary_from_row(summary)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
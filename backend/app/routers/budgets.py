@@ -10,6 +10,7 @@ from app.models import (
     BudgetResponse,
     BudgetStatusResponse,
     BudgetUpdate,
+    from_row,
 )
 from app.postgres_database import postgres_db
 from app.services import budget_service
@@ -24,7 +25,7 @@ async def list_budgets(
 ):
     """List all budgets."""
     budgets = await postgres_db.get_budgets(is_active=is_active)
-    return budgets
+    return [from_row(BudgetResponse, budget) for budget in budgets]
 
 
 @router.get("/{budget_id}", response_model=BudgetResponse)
@@ -33,7 +34,7 @@ async def get_budget(budget_id: int):
     budget = await postgres_db.get_budget_by_id(budget_id)
     if not budget:
         raise HTTPException(status_code=404, detail="Budget not found")
-    return budget
+    return from_row(BudgetResponse, budget)
 
 
 @router.post("", response_model=BudgetResponse, status_code=201)
@@ -49,7 +50,7 @@ async def create_budget(budget: BudgetCreate):
 
     try:
         created = await postgres_db.create_budget(budget.model_dump())
-        return created
+        return from_row(BudgetResponse, created)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -76,7 +77,7 @@ async def update_budget(budget_id: int, budget: BudgetUpdate):
         updated = await postgres_db.update_budget(budget_id, update_data)
         if not updated:
             raise HTTPException(status_code=404, detail="Budget not found")
-        return updated
+        return from_row(BudgetResponse, updated)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -102,7 +103,7 @@ async def list_budget_entries(budget_id: int):
         raise HTTPException(status_code=404, detail="Budget not found")
 
     entries = await postgres_db.get_budget_entries(budget_id)
-    return entries
+    return [from_row(BudgetEntryResponse, entry) for entry in entries]
 
 
 @router.post("/{budget_id}/entries", response_model=BudgetEntryResponse, status_code=201)
@@ -119,7 +120,7 @@ async def create_or_update_budget_entry(budget_id: int, entry: BudgetEntryCreate
 
     try:
         created = await postgres_db.create_or_update_budget_entry(budget_id, entry.model_dump())
-        return created
+        return from_row(BudgetEntryResponse, created)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -5,7 +5,7 @@ import io
 from datetime import date as date_type
 from datetime import datetime
 from decimal import Decimal
-from typing import Annotated, List, Optional
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 
 from app.postgres_database import postgres_db
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
@@ -95,7 +95,13 @@ async def list_expenses(
 ):
     """List expenses with optional filters."""
     expenses = await postgres_db.get_expenses(
-        aircraft_id=aircraft_id, category=category, start_date=start_date, end_date=end_date, limit=limit, offset=offset
+        aircraft_id=aircraft_id,
+        category=category,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        offset=offset,
+        include_budget_link=True,
     )
     if expenses:
         print(f"[ROUTER] Got {len(expenses)} expenses from DB")
@@ -132,8 +138,7 @@ async def create_expense(expense: ExpenseCreate):
     """Create new expense."""
     # If aircraft_id is provided, verify it exists
     if expense.aircraft_id:
-        aircraft = await postgres_db.get_aircraft_by_id(expense.aircraft_id)
-        if not aircraft:
+        if not await postgres_db.aircraft_exists(expense.aircraft_id):
             raise HTTPException(status_code=404, detail=f"Aircraft with ID {expense.aircraft_id} not found")
 
     try:
@@ -153,8 +158,7 @@ async def update_expense(expense_id: int, expense: ExpenseUpdate):
 
     # If updating aircraft_id, verify it exists
     if expense.aircraft_id:
-        aircraft = await postgres_db.get_aircraft_by_id(expense.aircraft_id)
-        if not aircraft:
+        if not await postgres_db.aircraft_exists(expense.aircraft_id):
             raise HTTPException(status_code=404, detail=f"Aircraft with ID {expense.aircraft_id} not found")
 
     try:
@@ -213,6 +217,9 @@ async def import_expenses(file: UploadFile = File(...)):
         imported = 0
         skipped = 0
         errors = []
+        # Valid rows are inserted together after parsing
+        pending: List[Tuple[int, Dict[str, Any]]] = []
+        known_card_ids = set()
 
         for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
             try:
@@ -247,12 +254,14 @@ async def import_expenses(file: UploadFile = File(...)):
                 if row.get("budget_card_id") and row["budget_card_id"].strip():
                     try:
                         budget_card_id = int(row["budget_card_id"].strip())
-                        # Verify budget card exists
-                        card = await postgres_db.get_budget_card(budget_card_id)
-                        if not card:
-                            errors.append(f"Row {row_num}: Budget card ID {budget_card_id} not found")
-                            skipped += 1
-                            continue
+                        # Verify budget card exists (once per card)
+                        if budget_card_id not in known_card_ids:
+                            card = await postgres_db.get_budget_card(budget_card_id)
+                            if not card:
+                                errors.append(f"Row {row_num}: Budget card ID {budget_card_id} not found")
+                                skipped += 1
+                                continue
+                            known_card_ids.add(budget_card_id)
                     except ValueError:
                         errors.append(f"Row {row_num}: Invalid budget_card_id format (must be a number)")
                         skipped += 1
@@ -271,14 +280,26 @@ async def import_expenses(file: UploadFile = File(...)):
                     "budget_card_id": budget_card_id,
                 }
 
-                # Create expense
-                await postgres_db.create_expense(expense_data)
-                imported += 1
+                pending.append((row_num, expense_data))
 
             except Exception as e:
                 errors.append(f"Row {row_num}: {str(e)}")
                 skipped += 1
 
+        if pending:
+            try:
+                await postgres_db.create_expenses_bulk([expense_data for _, expense_data in pending])
+                imported += len(pending)
+            except Exception:
+                # One bad row fails the whole batch, so retry row by row to report it
+                for row_num, expense_data in pending:
+                    try:
+                        await postgres_db.create_expense(expense_data)
+                        imported += 1
+                    except Exception as e:
+                        errors.append(f"Row {row_num}: {str(e)}")
+                        skipped += 1
+
         return ImportResult(imported=imported, skipped=skipped, errors=errors)
 
     except Exception as e:
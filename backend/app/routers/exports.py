@@ -3,7 +3,8 @@
 import csv
 import io
 from datetime import date as date_type
-from typing import Optional
+from decimal import Decimal
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Optional
 
 from app.postgres_database import postgres_db
 from fastapi import APIRouter, HTTPException, Query
@@ -11,6 +12,9 @@ from fastapi.responses import StreamingResponse
 
 router = APIRouter(prefix="/api/user/exports", tags=["Exports"])
 
+# Flights are written to the response this many CSV rows at a time
+_CSV_BATCH_ROWS = 500
+
 
 @router.get("/flights/csv")
 async def export_flights_csv(
@@ -18,179 +22,180 @@ async def export_flights_csv(
     end_date: Optional[date_type] = Query(None, description="Filter by end date"),
 ):
     """Export flights to CSV format."""
+    flights = postgres_db.iter_flights(start_date=start_date, end_date=end_date)
     try:
-        async with postgres_db.acquire() as conn:
-            # Build query with optional date filters
-            query = "SELECT * FROM flights WHERE 1=1"
-            params: list = []
-
-            if start_date:
-                query += " AND date >= $" + str(len(params) + 1)
-                params.append(start_date)
-
-            if end_date:
-                query += " AND date <= $" + str(len(params) + 1)
-                params.append(end_date)
-
-            query += " ORDER BY date DESC"
-
-            flights = await conn.fetch(query, *params)
-
-            if not flights:
-                raise HTTPException(status_code=404, detail="No flights found")
+        first = await anext(flights)
+    except StopAsyncIteration:
+        raise HTTPException(status_code=404, detail="No flights found") from None
+    except Exception as e:
+        await flights.aclose()
+        raise HTTPException(status_code=500, detail=f"Failed to export flights: {str(e)}") from e
 
-            # Create CSV in memory
-            output = io.StringIO()
-            writer = csv.writer(output)
+    filename = f"truehour_flights_{date_type.today().isoformat()}.csv"
+
+    return StreamingResponse(
+        _flights_csv(first, flights),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+async def _flights_csv(first: Dict[str, Any], flights: AsyncGenerator[Dict[str, Any], None]) -> AsyncIterator[str]:
+    """Render streamed flights as CSV text, a batch of rows at a time, ending with a totals row."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+
+    # Write header
+    headers = [
+        "Date",
+        "Aircraft ID",
+        "Tail Number",
+        "From",
+        "To",
+        "Route",
+        "Total Time",
+        "PIC",
+        "SIC",
+        "Night",
+        "Solo",
+        "Cross Country",
+        "Actual Instrument",
+        "Simulated Instrument",
+        "Simulator",
+        "Dual Given",
+        "Dual Received",
+        "Complex",
+        "High Performance",
+        "Day Takeoffs",
+        "Day Landings",
+        "Night Takeoffs",
+        "Night Landings",
+        "All Landings",
+        "Holds",
+        "Approaches",
+        "Distance",
+        "Instructor",
+        "Comments",
+    ]
+    writer.writerow(headers)
+
+    # Initialize totals
+    totals = {
+        "total_time": 0,
+        "pic_time": 0,
+        "sic_time": 0,
+        "night_time": 0,
+        "solo_time": 0,
+        "cross_country_time": 0,
+        "actual_instrument_time": 0,
+        "simulated_instrument_time": 0,
+        "simulated_flight_time": 0,
+        "dual_given_time": 0,
+        "dual_received_time": 0,
+        "complex_time": 0,
+        "high_performance_time": 0,
+        "day_takeoffs": 0,
+        "day_landings_full_stop": 0,
+        "night_takeoffs": 0,
+        "night_landings_full_stop": 0,
+        "all_landings": 0,
+        "holds": 0,
+        "distance": 0,
+    }
+
+    async def all_flights() -> AsyncIterator[Dict[str, Any]]:
+        yield first
+        async for flight in flights:
+            yield flight
 
-            # Write header
-            headers = [
-                "Date",
-                "Aircraft ID",
-                "Tail Number",
-                "From",
-                "To",
-                "Route",
-                "Total Time",
-                "PIC",
-                "SIC",
-                "Night",
-                "Solo",
-                "Cross Country",
-                "Actual Instrument",
-                "Simulated Instrument",
-                "Simulator",
-                "Dual Given",
-                "Dual Received",
-                "Complex",
-                "High Performance",
-                "Day Takeoffs",
-                "Day Landings",
-                "Night Takeoffs",
-                "Night Landings",
-                "All Landings",
-                "Holds",
-                "Approaches",
-                "Distance",
-                "Instructor",
-                "Comments",
+    try:
+        # Write data rows and accumulate totals
+        rows_buffered = 0
+        async for flight in all_flights():
+            row = [
+                flight.get("date"),
+                flight.get("aircraft_id") or "",
+                flight.get("tail_number") or "",
+                flight.get("departure_airport") or "",
+                flight.get("arrival_airport") or "",
+                flight.get("route") or "",
+                flight.get("total_time") or 0,
+                flight.get("pic_time") or 0,
+                flight.get("sic_time") or 0,
+                flight.get("night_time") or 0,
+                flight.get("solo_time") or 0,
+                flight.get("cross_country_time") or 0,
+                flight.get("actual_instrument_time") or 0,
+                flight.get("simulated_instrument_time") or 0,
+                flight.get("simulated_flight_time") or 0,
+                flight.get("dual_given_time") or 0,
+                flight.get("dual_received_time") or 0,
+                flight.get("complex_time") or 0,
+                flight.get("high_performance_time") or 0,
+                flight.get("day_takeoffs") or 0,
+                flight.get("day_landings_full_stop") or 0,
+                flight.get("night_takeoffs") or 0,
+                flight.get("night_landings_full_stop") or 0,
+                flight.get("all_landings") or 0,
+                flight.get("holds") or 0,
+                flight.get("approaches") or "",
+                flight.get("distance") or 0,
+                flight.get("instructor_name") or "",
+                flight.get("pilot_comments") or "",
             ]
-            writer.writerow(headers)
-
-            # Initialize totals
-            totals = {
-                "total_time": 0,
-                "pic_time": 0,
-                "sic_time": 0,
-                "night_time": 0,
-                "solo_time": 0,
-                "cross_country_time": 0,
-                "actual_instrument_time": 0,
-                "simulated_instrument_time": 0,
-                "simulated_flight_time": 0,
-                "dual_given_time": 0,
-                "dual_received_time": 0,
-                "complex_time": 0,
-                "high_performance_time": 0,
-                "day_takeoffs": 0,
-                "day_landings_full_stop": 0,
-                "night_takeoffs": 0,
-                "night_landings_full_stop": 0,
-                "all_landings": 0,
-                "holds": 0,
-                "distance": 0,
-            }
-
-            # Write data rows and accumulate totals
-            for flight in flights:
-                row = [
-                    flight.get("date"),
-                    flight.get("aircraft_id") or "",
-                    flight.get("tail_number") or "",
-                    flight.get("departure_airport") or "",
-                    flight.get("arrival_airport") or "",
-                    flight.get("route") or "",
-                    flight.get("total_time") or 0,
-                    flight.get("pic_time") or 0,
-                    flight.get("sic_time") or 0,
-                    flight.get("night_time") or 0,
-                    flight.get("solo_time") or 0,
-                    flight.get("cross_country_time") or 0,
-                    flight.get("actual_instrument_time") or 0,
-                    flight.get("simulated_instrument_time") or 0,
-                    flight.get("simulated_flight_time") or 0,
-                    flight.get("dual_given_time") or 0,
-                    flight.get("dual_received_time") or 0,
-                    flight.get("complex_time") or 0,
-                    flight.get("high_performance_time") or 0,
-                    flight.get("day_takeoffs") or 0,
-                    flight.get("day_landings_full_stop") or 0,
-                    flight.get("night_takeoffs") or 0,
-                    flight.get("night_landings_full_stop") or 0,
-                    flight.get("all_landings") or 0,
-                    flight.get("holds") or 0,
-                    flight.get("approaches") or "",
-                    flight.get("distance") or 0,
-                    flight.get("instructor_name") or "",
-                    flight.get("pilot_comments") or "",
-                ]
-                writer.writerow(row)
-
-                # Accumulate totals (skip non-numeric fields)
-                for key in totals.keys():
-                    val = flight.get(key)
-                    if val is not None and isinstance(val, (int, float)):
-                        totals[key] += val
-
-            # Write totals row
-            writer.writerow(
-                [
-                    "",  # Date
-                    "",  # Aircraft ID
-                    "",  # Tail Number
-                    "",  # From
-                    "",  # To
-                    "TOTALS:",  # Route
-                    totals["total_time"],
-                    totals["pic_time"],
-                    totals["sic_time"],
-                    totals["night_time"],
-                    totals["solo_time"],
-                    totals["cross_country_time"],
-                    totals["actual_instrument_time"],
-                    totals["simulated_instrument_time"],
-                    totals["simulated_flight_time"],
-                    totals["dual_given_time"],
-                    totals["dual_received_time"],
-                    totals["complex_time"],
-                    totals["high_performance_time"],
-                    totals["day_takeoffs"],
-                    totals["day_landings_full_stop"],
-                    totals["night_takeoffs"],
-                    totals["night_landings_full_stop"],
-                    totals["all_landings"],
-                    totals["holds"],
-                    "",  # Approaches (text field)
-                    totals["distance"],
-                    "",  # Instructor
-                    "",  # Comments
-                ]
-            )
-
-            # Prepare response
-            output.seek(0)
-            filename = f"truehour_flights_{date_type.today().isoformat()}.csv"
-
-            return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename={filename}"},
-            )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to export flights: {str(e)}") from e
+            writer.writerow(row)
+
+            # Accumulate totals (skip non-numeric fields)
+            for key in totals.keys():
+                val = flight.get(key)
+                if val is not None and isinstance(val, (int, float, Decimal)):
+                    totals[key] += val
+
+            rows_buffered += 1
+            if rows_buffered == _CSV_BATCH_ROWS:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+                rows_buffered = 0
+    finally:
+        await flights.aclose()
+
+    # Write totals row
+    writer.writerow(
+        [
+            "",  # Date
+            "",  # Aircraft ID
+            "",  # Tail Number
+            "",  # From
+            "",  # To
+            "TOTALS:",  # Route
+            totals["total_time"],
+            totals["pic_time"],
+            totals["sic_time"],
+            totals["night_time"],
+            totals["solo_time"],
+            totals["cross_country_time"],
+            totals["actual_instrument_time"],
+            totals["simulated_instrument_time"],
+            totals["simulated_flight_time"],
+            totals["dual_given_time"],
+            totals["dual_received_time"],
+            totals["complex_time"],
+            totals["high_performance_time"],
+            totals["day_takeoffs"],
+            totals["day_landings_full_stop"],
+            totals["night_takeoffs"],
+            totals["night_landings_full_stop"],
+            totals["all_landings"],
+            totals["holds"],
+            "",  # Approaches (text field)
+            totals["distance"],
+            "",  # Instructor
+            "",  # Comments
+        ]
+    )
+
+    yield output.getvalue()
 
 
 @router.get("/budget-cards/csv")
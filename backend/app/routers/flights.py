@@ -6,7 +6,7 @@ import json
 from datetime import date as date_type
 from datetime import datetime
 from decimal import Decimal
-from typing import Annotated, List, Optional
+from typing import Annotated, Any, List, Optional, Tuple
 
 from app.postgres_database import postgres_db
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
@@ -14,6 +14,50 @@ from pydantic import BaseModel, Field, condecimal
 
 router = APIRouter(prefix="/api/user/flights", tags=["Flights"])
 
+# Columns written by the ForeFlight import, in record order
+_IMPORT_FLIGHT_COLUMNS = (
+    "aircraft_id",
+    "tail_number",
+    "date",
+    "departure_airport",
+    "arrival_airport",
+    "route",
+    "total_time",
+    "pic_time",
+    "sic_time",
+    "night_time",
+    "solo_time",
+    "cross_country_time",
+    "actual_instrument_time",
+    "simulated_instrument_time",
+    "simulated_flight_time",
+    "dual_given_time",
+    "dual_received_time",
+    "complex_time",
+    "high_performance_time",
+    "day_takeoffs",
+    "day_landings_full_stop",
+    "night_takeoffs",
+    "night_landings_full_stop",
+    "all_landings",
+    "holds",
+    "approaches",
+    "instructor_name",
+    "pilot_comments",
+    "is_simulator_session",
+    "distance",
+    "import_hash",
+)
+_IMPORT_COLUMN_LIST = ", ".join(_IMPORT_FLIGHT_COLUMNS)
+
+# Re-importing a flight (same import_hash) only refreshes its distance
+_IMPORT_FLIGHT_SQL = f"""
+    INSERT INTO flights ({_IMPORT_COLUMN_LIST})
+    VALUES ({", ".join(f"${position}" for position in range(1, len(_IMPORT_FLIGHT_COLUMNS) + 1))})
+    ON CONFLICT (import_hash) DO UPDATE SET
+        distance = EXCLUDED.distance
+"""  # nosec B608 - built from the constant column list above
+
 
 class FlightCreate(BaseModel):
     """Create flight."""
@@ -240,8 +284,7 @@ async def create_flight(flight: FlightCreate):
     """Create new flight."""
     # If aircraft_id is provided, verify it exists
     if flight.aircraft_id:
-        aircraft = await postgres_db.get_aircraft_by_id(flight.aircraft_id)
-        if not aircraft:
+        if not await postgres_db.aircraft_exists(flight.aircraft_id):
             raise HTTPException(status_code=404, detail=f"Aircraft with ID {flight.aircraft_id} not found")
 
     try:
@@ -261,8 +304,7 @@ async def update_flight(flight_id: int, flight: FlightUpdate):
 
     # If updating aircraft_id, verify it exists
     if flight.aircraft_id:
-        aircraft = await postgres_db.get_aircraft_by_id(flight.aircraft_id)
-        if not aircraft:
+        if not await postgres_db.aircraft_exists(flight.aircraft_id):
             raise HTTPException(status_code=404, detail=f"Aircraft with ID {flight.aircraft_id} not found")
 
     try:
@@ -315,6 +357,33 @@ def _safe_float(value) -> Optional[float]:
         return None
 
 
+async def _insert_flights(conn: Any, records: List[Tuple[Any, ...]]) -> None:
+    """
+    Insert imported flights with one COPY and one upsert.
+
+    COPY cannot resolve conflicts, so the records are staged in a temporary table
+    and merged into flights with the same ON CONFLICT rule as _IMPORT_FLIGHT_SQL.
+    Records must not repeat an import_hash.
+    """
+    if not records:
+        return
+
+    async with conn.transaction():
+        await conn.execute(
+            f"CREATE TEMP TABLE flight_import ON COMMIT DROP AS "
+            f"SELECT {_IMPORT_COLUMN_LIST} FROM flights WITH NO DATA"  # nosec B608 - constant column list
+        )
+        await conn.copy_records_to_table("flight_import", records=records, columns=_IMPORT_FLIGHT_COLUMNS)
+        await conn.execute(
+            f"""
+            INSERT INTO flights ({_IMPORT_COLUMN_LIST})
+            SELECT {_IMPORT_COLUMN_LIST} FROM flight_import
+            ON CONFLICT (import_hash) DO UPDATE SET
+                distance = EXCLUDED.distance
+            """  # nosec B608 - constant column list
+        )
+
+
 def _safe_int(value) -> int:
     """Convert value to int, return 0 if invalid."""
     if value is None or value == "":
@@ -407,6 +476,9 @@ async def import_flights(file: UploadFile = File(...)):
         # Track import hashes to detect duplicates within this import
         import_hashes = set()
 
+        # Validated rows as (row number, tail number, values after aircraft_id)
+        pending: List[Tuple[int, Optional[str], Tuple[Any, ...]]] = []
+
         async with postgres_db.acquire() as conn:
             # First, extract and import aircraft from the Aircraft Table data
             from app.routers.user_data import _extract_and_import_aircraft
@@ -467,77 +539,78 @@ async def import_flights(file: UploadFile = File(...)):
                     simulated_flight_time = _safe_float(row.get("SimulatedFlight"))
                     is_sim = simulated_flight_time is not None and simulated_flight_time > 0
 
-                    # Look up aircraft by tail number (now includes simulators)
-                    aircraft_id = None
                     tail_number = row.get("AircraftID")
-                    if tail_number:
-                        # Look up in user_aircraft table (created by aircraft extraction above)
-                        aircraft_row = await conn.fetchrow(
-                            "SELECT id FROM aircraft WHERE UPPER(tail_number) = UPPER($1)", tail_number
-                        )
-                        if aircraft_row:
-                            aircraft_id = aircraft_row["id"]
-
-                    # Insert flight (with ON CONFLICT to update distance on duplicates)
-                    await conn.execute(
-                        """
-                        INSERT INTO flights (
-                            aircraft_id, tail_number, date, departure_airport, arrival_airport, route,
-                            total_time, pic_time, sic_time, night_time, solo_time,
-                            cross_country_time, actual_instrument_time, simulated_instrument_time,
-                            simulated_flight_time, dual_given_time, dual_received_time,
-                            complex_time, high_performance_time,
-                            day_takeoffs, day_landings_full_stop,
-                            night_takeoffs, night_landings_full_stop,
-                            all_landings, holds, approaches,
-                            instructor_name, pilot_comments,
-                            is_simulator_session, distance, import_hash
+                    pending.append(
+                        (
+                            row_num,
+                            tail_number,
+                            (
+                                tail_number,
+                                flight_date,
+                                row.get("From"),
+                                row.get("To"),
+                                row.get("Route"),
+                                _safe_float(row.get("TotalTime")),
+                                _safe_float(row.get("PIC")),
+                                _safe_float(row.get("SIC")),
+                                _safe_float(row.get("Night")),
+                                _safe_float(row.get("Solo")),
+                                _safe_float(row.get("CrossCountry")),
+                                _safe_float(row.get("ActualInstrument")),
+                                _safe_float(row.get("SimulatedInstrument")),
+                                _safe_float(row.get("SimulatedFlight")),
+                                _safe_float(row.get("DualGiven")),
+                                _safe_float(row.get("DualReceived")),
+                                _safe_float(row.get("[Hours]Complex")),  # ForeFlight custom field!
+                                _safe_float(row.get("[Hours]High Performance")),  # ForeFlight custom field!
+                                _safe_int(row.get("DayTakeoffs")),
+                                _safe_int(row.get("DayLandingsFullStop")),
+                                _safe_int(row.get("NightTakeoffs")),
+                                _safe_int(row.get("NightLandingsFullStop")),
+                                _safe_int(row.get("AllLandings")),
+                                _safe_int(row.get("Holds")),
+                                json.dumps(row.get("Approaches")) if row.get("Approaches") else None,
+                                row.get("InstructorName"),
+                                row.get("PilotComments"),
+                                is_sim,
+                                _safe_float(row.get("Distance")),  # Add distance from ForeFlight CSV
+                                import_hash,
+                            ),
                         )
-                        VALUES (
-                            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15,
-                            $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27, $28, $29, $30, $31
-                        )
-                        ON CONFLICT (import_hash) DO UPDATE SET
-                            distance = EXCLUDED.distance
-                        """,
-                        aircraft_id,
-                        tail_number,
-                        flight_date,
-                        row.get("From"),
-                        row.get("To"),
-                        row.get("Route"),
-                        _safe_float(row.get("TotalTime")),
-                        _safe_float(row.get("PIC")),
-                        _safe_float(row.get("SIC")),
-                        _safe_float(row.get("Night")),
-                        _safe_float(row.get("Solo")),
-                        _safe_float(row.get("CrossCountry")),
-                        _safe_float(row.get("ActualInstrument")),
-                        _safe_float(row.get("SimulatedInstrument")),
-                        _safe_float(row.get("SimulatedFlight")),
-                        _safe_float(row.get("DualGiven")),
-                        _safe_float(row.get("DualReceived")),
-                        _safe_float(row.get("[Hours]Complex")),  # ForeFlight custom field!
-                        _safe_float(row.get("[Hours]High Performance")),  # ForeFlight custom field!
-                        _safe_int(row.get("DayTakeoffs")),
-                        _safe_int(row.get("DayLandingsFullStop")),
-                        _safe_int(row.get("NightTakeoffs")),
-                        _safe_int(row.get("NightLandingsFullStop")),
-                        _safe_int(row.get("AllLandings")),
-                        _safe_int(row.get("Holds")),
-                        json.dumps(row.get("Approaches")) if row.get("Approaches") else None,
-                        row.get("InstructorName"),
-                        row.get("PilotComments"),
-                        is_sim,
-                        _safe_float(row.get("Distance")),  # Add distance from ForeFlight CSV
-                        import_hash,
                     )
-                    imported += 1
 
                 except Exception as e:
                     errors.append(f"Row {row_num}: {str(e)}")
                     skipped += 1
 
+            # Aircraft extraction mapped every tail it saw; look up any it missed in one query
+            unmapped = list({tail for _, tail, _ in pending if tail and tail not in aircraft_map})
+            if unmapped:
+                rows = await conn.fetch(
+                    "SELECT tail_number, id FROM aircraft WHERE UPPER(tail_number) = ANY($1::text[])",
+                    [tail.upper() for tail in unmapped],
+                )
+                found = {row["tail_number"].upper(): row["id"] for row in rows}
+                for tail in unmapped:
+                    if tail.upper() in found:
+                        aircraft_map[tail] = found[tail.upper()]
+
+            records = [(aircraft_map.get(tail) if tail else None, *values) for _, tail, values in pending]
+            try:
+                await _insert_flights(conn, records)
+                imported += len(records)
+            except Exception:
+                # Fall back to row-by-row inserts so one bad row doesn't sink the rest
+                for (row_num, _, _), record in zip(pending, records):
+                    try:
+                        await conn.execute(_IMPORT_FLIGHT_SQL, *record)
+                        imported += 1
+                    except Exception as e:
+                        errors.append(f"Row {row_num}: {str(e)}")
+                        skipped += 1
+
+        postgres_db.invalidate_summaries()
+
         # After successful import, trigger hours recalculation
         if imported > 0:
             try:
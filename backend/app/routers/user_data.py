@@ -1,5 +1,6 @@
 """User data management endpoints (save/load/delete)."""
 
+import asyncio
 import json
 import uuid
 from datetime import date, datetime
@@ -142,23 +143,53 @@ def _extract_foreflight_aircraft_data(flights_data: List[Dict], tail_number: str
     }
 
 
-async def _lookup_faa_aircraft(tail_number: str, enable_faa_lookup: bool = True) -> Optional[Dict]:
-    """Lookup aircraft from FAA database."""
-    # Check if FAA lookup is disabled via settings or environment variable
+def _faa_lookup_enabled(enable_faa_lookup: bool) -> bool:
+    """Check the user setting and the DISABLE_FAA_LOOKUP env var."""
     import os
 
     if not enable_faa_lookup:
         print("[FAA Lookup] Disabled via user settings")
-        return None
+        return False
 
     if os.getenv("DISABLE_FAA_LOOKUP", "false").lower() == "true":
         print("[FAA Lookup] Disabled via DISABLE_FAA_LOOKUP env var")
+        return False
+
+    return True
+
+
+def _faa_aircraft_data(aircraft: Any) -> Dict:
+    """Build the aircraft record fields from an FAA lookup result."""
+    from app.utils.gear_inference import infer_gear_type, should_be_complex, should_be_high_performance
+
+    make = aircraft.manufacturer
+    model = aircraft.model
+
+    # Infer gear type and characteristics from make/model
+    gear_type = infer_gear_type(make, model)
+
+    return {
+        "make": make,
+        "model": model,
+        "year": int(aircraft.year_mfr) if aircraft.year_mfr and str(aircraft.year_mfr).isdigit() else None,
+        "type_code": aircraft.series,
+        "engine_type": aircraft.engine_type,
+        "aircraft_class": aircraft.aircraft_type,
+        "gear_type": gear_type,
+        "is_complex": should_be_complex(make, model, gear_type),
+        "is_high_performance": should_be_high_performance(make, model),
+    }
+
+
+async def _lookup_faa_aircraft(tail_number: str, enable_faa_lookup: bool = True) -> Optional[Dict]:
+    """Lookup aircraft from FAA database."""
+    # Check if FAA lookup is disabled via settings or environment variable
+    if not _faa_lookup_enabled(enable_faa_lookup):
         return None
 
     try:
         # Import db and normalize_tail from main
         from app.main import db, normalize_tail
-        from app.utils.gear_inference import infer_gear_type, should_be_complex, should_be_high_performance
 
         if db is None:
             return None
@@ -169,29 +200,43 @@ async def _lookup_faa_aircraft(tail_number: str, enable_faa_lookup: bool = True)
 
         aircraft = db.lookup(normalized)
         if aircraft:
-            make = aircraft.manufacturer
-            model = aircraft.model
-
-            # Infer gear type and characteristics from make/model
-            gear_type = infer_gear_type(make, model)
-
-            return {
-                "make": make,
-                "model": model,
-                "year": int(aircraft.year_mfr) if aircraft.year_mfr and str(aircraft.year_mfr).isdigit() else None,
-                "type_code": aircraft.series,
-                "engine_type": aircraft.engine_type,
-                "aircraft_class": aircraft.aircraft_type,
-                "gear_type": gear_type,
-                "is_complex": should_be_complex(make, model, gear_type),
-                "is_high_performance": should_be_high_performance(make, model),
-            }
+            return _faa_aircraft_data(aircraft)
     except Exception as e:
         print(f"[FAA Lookup] Error looking up {tail_number}: {e}")
 
     return None
 
 
+async def _lookup_faa_aircraft_bulk(tail_numbers: List[str], enable_faa_lookup: bool = True) -> Dict[str, Dict]:
+    """
+    Lookup several aircraft from the FAA database in one query.
+
+    Returns a dict mapping each tail number that was found to its aircraft data.
+    """
+    if not tail_numbers or not _faa_lookup_enabled(enable_faa_lookup):
+        return {}
+
+    try:
+        # Import db and normalize_tail from main
+        from app.main import db, normalize_tail
+
+        if db is None:
+            return {}
+
+        normalized_tails = {tail: normalize_tail(tail) for tail in tail_numbers}
+        found = db.bulk_lookup([normalized for normalized in normalized_tails.values() if normalized])
+
+        return {
+            tail: _faa_aircraft_data(found[normalized])
+            for tail, normalized in normalized_tails.items()
+            if normalized in found
+        }
+    except Exception as e:
+        print(f"[FAA Lookup] Error looking up {len(tail_numbers)} aircraft: {e}")
+
+    return {}
+
+
 async def _create_user_aircraft(conn: Any, tail_number: str, aircraft_data: Dict, data_source: str) -> int:
     """Create aircraft record and return ID."""
     result = await conn.fetchrow(
@@ -258,6 +303,11 @@ async def _extract_and_import_aircraft(
 
     print(f"[Aircraft Import] Found {len(unique_tails)} aircraft and {len(unique_simulators)} simulators in flights")
 
+    # Look up every US aircraft in the FAA registry at once rather than per tail
+    faa_aircraft = await _lookup_faa_aircraft_bulk(
+        [tail for tail in unique_tails if _is_us_aircraft(tail)], enable_faa_lookup
+    )
+
     # Phase 2: Process each aircraft
     for tail_number in unique_tails:
         # Check if already exists
@@ -293,7 +343,7 @@ async def _extract_and_import_aircraft(
         data_source = "foreflight"
 
         if _is_us_aircraft(tail_number) and enable_faa_lookup:
-            aircraft_data = await _lookup_faa_aircraft(tail_number, enable_faa_lookup)
+            aircraft_data = faa_aircraft.get(tail_number)
             if aircraft_data:
                 data_source = "faa"
                 print(f"[Aircraft Import] {tail_number}: Found FAA data")
@@ -477,12 +527,12 @@ async def _save_flights(conn: Any, flights_data: List[Dict[str, Any]]) -> int:
             _safe_float(flight.get("DualReceived")),
             complex_time,  # Calculated from aircraft characteristics, not cumulative column
             high_perf_time,  # Calculated from aircraft characteristics, not cumulative column
-            _safe_int(flight.get("DayTakeoffs")),
-            _safe_int(flight.get("DayLandingsFullStop")),
-            _safe_int(flight.get("NightTakeoffs")),
-            _safe_int(flight.get("NightLandingsFullStop")),
-            _safe_int(flight.get("AllLandings")),
-            _safe_int(flight.get("Holds")),
+            _safe_int(flight.get("DayTakeoffs")) or 0,
+            _safe_int(flight.get("DayLandingsFullStop")) or 0,
+            _safe_int(flight.get("NightTakeoffs")) or 0,
+            _safe_int(flight.get("NightLandingsFullStop")) or 0,
+            _safe_int(flight.get("AllLandings")) or 0,
+            _safe_int(flight.get("Holds")) or 0,
             json.dumps(flight.get("Approaches")) if flight.get("Approaches") else None,
             flight.get("InstructorName"),
             flight.get("PilotComments"),
@@ -523,6 +573,7 @@ async def save_user_data(
             flights_count = 0
             if data and data.flights:
                 flights_count = await _save_flights(conn, data.flights)
+                postgres_db.invalidate_summaries()
 
             if data and data.budget_state:
                 await _save_budget_state(conn, data.budget_state)
@@ -567,8 +618,13 @@ async def load_user_data(session_id: Optional[str] = Header(None, alias="X-Sessi
     """
 
     try:
-        # Get all aircraft from database
-        aircraft_rows = await postgres_db.get_user_aircraft(is_active=True)
+        # Aircraft, recent expenses and recent flights are independent reads, so fetch
+        # them concurrently on separate pool connections (last 1000 expenses/flights)
+        aircraft_rows, expenses_list, flights_list = await asyncio.gather(
+            postgres_db.get_user_aircraft(is_active=True),
+            postgres_db.get_expenses(limit=1000, offset=0, include_budget_link=True),
+            postgres_db.get_flights(limit=1000, offset=0),
+        )
 
         # Transform to frontend format (database snake_case -> frontend camelCase)
         aircraft_list = []
@@ -590,12 +646,6 @@ async def load_user_data(session_id: Optional[str] = Header(None, alias="X-Sessi
                 }
             )
 
-        # Get all expenses (last 1000)
-        expenses_list = await postgres_db.get_expenses(limit=1000, offset=0)
-
-        # Get all flights (last 1000)
-        flights_list = await postgres_db.get_flights(limit=1000, offset=0)
-
         # Get user settings
         async with postgres_db.acquire() as conn:
             settings_row = await conn.fetchrow("SELECT * FROM user_settings ORDER BY id DESC LIMIT 1")
@@ -744,6 +794,7 @@ async def delete_all_user_data(
             await conn.execute("DELETE FROM import_history")  # ForeFlight import tracking
             await conn.execute("DELETE FROM user_sessions")
             await conn.execute("DELETE FROM user_settings")
+            postgres_db.invalidate_summaries()
 
             # Log deletion event (timestamp only)
             print(f"[DELETE_ALL_DATA] All user data deleted at {datetime.now().isoformat()}")
@@ -6,6 +6,9 @@ from typing import Optional
 
 from app.postgres_database import postgres_db
 
+# Flight columns that count toward a budget's actual spend
+_FLIGHT_COST_FIELDS = ("fuel_cost", "landing_fees", "instructor_cost", "rental_cost", "other_costs")
+
 
 async def get_budget_status(budget_id: int, month: date) -> Optional[dict]:
     """
@@ -28,7 +31,8 @@ async def get_budget_status(budget_id: int, month: date) -> Optional[dict]:
     if not entry:
         return None
 
-    allocated = Decimal(str(entry["allocated_amount"]))
+    # asyncpg returns NUMERIC columns as Decimal, so amounts are summed as-is
+    allocated = entry["allocated_amount"]
 
     # Calculate month range: first day to last day of month
     month_start = month
@@ -44,18 +48,14 @@ async def get_budget_status(budget_id: int, month: date) -> Optional[dict]:
     if budget.get("categories"):
         expenses = [e for e in expenses if e["category"] in budget["categories"]]
 
-    actual_expenses = sum(Decimal(str(e["amount"])) for e in expenses)
+    actual_expenses = sum((e["amount"] for e in expenses), Decimal("0"))
 
     # Get actual flight costs for this month
     flights = await postgres_db.get_flights(start_date=month_start, end_date=month_end, limit=10000)
 
-    actual_flight_costs = Decimal("0")
-    for flight in flights:
-        actual_flight_costs += Decimal(str(flight.get("fuel_cost") or 0))
-        actual_flight_costs += Decimal(str(flight.get("landing_fees") or 0))
-        actual_flight_costs += Decimal(str(flight.get("instructor_cost") or 0))
-        actual_flight_costs += Decimal(str(flight.get("rental_cost") or 0))
-        actual_flight_costs += Decimal(str(flight.get("other_costs") or 0))
+    actual_flight_costs = sum(
+        (flight[field] for flight in flights for field in _FLIGHT_COST_FIELDS if flight.get(field)), Decimal("0")
+    )
 
     # Calculate totals
     total_actual = actual_expenses + actual_flight_costs
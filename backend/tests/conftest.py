@@ -6,6 +6,7 @@ Mocks PostgreSQL so tests run without a real database.
 
 import os
 import sys
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -39,4 +40,9 @@ def client(patch_pg_lifecycle):
     from fastapi.testclient import TestClient
 
     with TestClient(app) as c:
+        # Startup runs in the background; wait until the app is serving requests
+        for _ in range(200):
+            if c.get("/readyz").status_code == 200:
+                break
+            time.sleep(0.01)
         yield c
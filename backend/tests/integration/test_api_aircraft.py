@@ -68,7 +68,7 @@ def test_get_aircraft_by_id_not_found(client):
 def test_create_aircraft(client):
     """POST /api/user/aircraft creates and returns new aircraft."""
     with (
-        patch("app.postgres_database.postgres_db.get_aircraft_by_tail", AsyncMock(return_value=None)),
+        patch("app.postgres_database.postgres_db.get_aircraft_id_by_tail", AsyncMock(return_value=None)),
         patch("app.postgres_database.postgres_db.create_aircraft", AsyncMock(return_value=SAMPLE_AIRCRAFT)),
     ):
         response = client.post(
@@ -103,7 +103,7 @@ def test_create_aircraft_validation_error(client):
 
 def test_update_aircraft_not_found(client):
     """PUT /api/user/aircraft/{id} returns 404 when aircraft doesn't exist."""
-    with patch("app.postgres_database.postgres_db.get_aircraft_by_id", AsyncMock(return_value=None)):
+    with patch("app.postgres_database.postgres_db.aircraft_exists", AsyncMock(return_value=False)):
         response = client.put("/api/user/aircraft/999", json={"notes": "updated"})
     assert response.status_code == 404
 
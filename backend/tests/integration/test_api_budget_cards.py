@@ -0,0 +1,68 @@
+"""Integration tests for budget card endpoints."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+SAMPLE_CARD = {
+    "id": 1,
+    "name": "CIAS IFR Training",
+    "category": "Training",
+    "frequency": "monthly",
+    "when_date": date(2026, 1, 1),
+    "budgeted_amount": Decimal("2760.00"),
+    "actual_amount": Decimal("245.00"),
+    "notes": None,
+    "associated_hours": None,
+    "aircraft_id": None,
+    "hourly_rate_type": "wet",
+    "status": "active",
+    "created_at": datetime(2025, 12, 14),
+    "updated_at": datetime(2025, 12, 14),
+}
+
+
+def _annual_summary(include_cards):
+    month = {"month": date(2026, 1, 1), "total_budgeted": Decimal("2760.00"), "total_actual": Decimal("245.00")}
+    if include_cards:
+        month["cards"] = [SAMPLE_CARD]
+    return {
+        "year": 2026,
+        "total_budgeted": Decimal("2760.00"),
+        "total_actual": Decimal("245.00"),
+        "by_month": [month],
+        "by_category": [
+            {
+                "category": "Training",
+                "total_budgeted": Decimal("2760.00"),
+                "total_actual": Decimal("245.00"),
+                "card_count": 1,
+            }
+        ],
+    }
+
+
+def test_annual_summary_includes_cards_by_default(client):
+    """GET /summary/annual returns each month's budget cards."""
+    summary = AsyncMock(return_value=_annual_summary(include_cards=True))
+    with patch("app.postgres_database.postgres_db.get_annual_budget_summary", summary):
+        response = client.get("/api/user/budget-cards/summary/annual", params={"year": 2026})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_remaining"] == "2515.00"
+    assert data["by_month"][0]["cards"][0]["remaining_amount"] == "2515.00"
+    summary.assert_awaited_once_with(2026, include_cards=True)
+
+
+def test_annual_summary_without_detail_skips_cards(client):
+    """GET /summary/annual?detail=false returns totals only, without loading cards."""
+    summary = AsyncMock(return_value=_annual_summary(include_cards=False))
+    with patch("app.postgres_database.postgres_db.get_annual_budget_summary", summary):
+        response = client.get("/api/user/budget-cards/summary/annual", params={"year": 2026, "detail": "false"})
+
+    assert response.status_code == 200
+    month = response.json()["by_month"][0]
+    assert "cards" not in month
+    assert month["total_remaining"] == "2515.00"
+    summary.assert_awaited_once_with(2026, include_cards=False)
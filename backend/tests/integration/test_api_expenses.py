@@ -150,3 +150,42 @@ def test_get_expense_summary(client):
     with patch("app.postgres_database.postgres_db.get_expense_summary", AsyncMock(return_value=mock_summary)):
         response = client.get("/api/user/expenses/summary")
     assert response.status_code == 200
+
+
+IMPORT_CSV = b"""date,category,amount,budget_card_id
+2025-01-15,fuel,85.50,3
+2025-01-16,fuel,bad,
+2025-01-17,insurance,120.00,3
+"""
+
+
+def test_import_expenses_inserts_valid_rows_in_one_batch(client):
+    """CSV import inserts every valid row with a single bulk call and checks each card once."""
+    bulk = AsyncMock(return_value=[SAMPLE_EXPENSE, SAMPLE_EXPENSE])
+    card = AsyncMock(return_value={"id": 3})
+    with patch.multiple("app.postgres_database.postgres_db", create_expenses_bulk=bulk, get_budget_card=card):
+        response = client.post("/api/user/expenses/import", files={"file": ("expenses.csv", IMPORT_CSV, "text/csv")})
+
+    assert response.status_code == 200
+    assert response.json() == {"imported": 2, "skipped": 1, "errors": ["Row 3: Invalid amount format"]}
+    rows = bulk.await_args.args[0]
+    assert [row["category"] for row in rows] == ["fuel", "insurance"]
+    assert all(row["budget_card_id"] == 3 for row in rows)
+    card.assert_awaited_once_with(3)
+
+
+def test_import_expenses_reports_rows_when_batch_fails(client):
+    """A failed batch is retried row by row so the bad row is reported."""
+    single = AsyncMock(side_effect=[SAMPLE_EXPENSE, Exception("value too long")])
+    with patch.multiple(
+        "app.postgres_database.postgres_db",
+        create_expenses_bulk=AsyncMock(side_effect=Exception("batch failed")),
+        create_expense=single,
+        get_budget_card=AsyncMock(return_value={"id": 3}),
+    ):
+        response = client.post("/api/user/expenses/import", files={"file": ("expenses.csv", IMPORT_CSV, "text/csv")})
+
+    data = response.json()
+    assert data["imported"] == 1
+    assert data["skipped"] == 2
+    assert "Row 4: value too long" in data["errors"]
@@ -0,0 +1,39 @@
+"""Integration tests for CSV export endpoints."""
+
+import csv
+import io
+from decimal import Decimal
+from unittest.mock import patch
+
+
+def _flights(*flights):
+    async def iter_flights(**kwargs):
+        for flight in flights:
+            yield flight
+
+    return iter_flights
+
+
+def test_export_flights_csv_streams_rows_and_totals(client):
+    """GET /flights/csv writes every flight plus a totals row that includes NUMERIC times."""
+    flights = _flights(
+        {"date": "2026-01-04", "tail_number": "N12345", "total_time": Decimal("1.5"), "day_takeoffs": 1},
+        {"date": "2026-01-03", "tail_number": "N12345", "total_time": Decimal("0.7"), "day_takeoffs": 2},
+    )
+    with patch("app.postgres_database.postgres_db.iter_flights", flights):
+        response = client.get("/api/user/exports/flights/csv")
+
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert [row[0] for row in rows[1:3]] == ["2026-01-04", "2026-01-03"]
+    assert rows[-1][5] == "TOTALS:"
+    assert rows[-1][6] == "2.2"
+    assert rows[-1][19] == "3"
+
+
+def test_export_flights_csv_without_flights(client):
+    """GET /flights/csv returns 404 when there is nothing to export."""
+    with patch("app.postgres_database.postgres_db.iter_flights", _flights()):
+        response = client.get("/api/user/exports/flights/csv")
+
+    assert response.status_code == 404
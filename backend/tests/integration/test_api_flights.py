@@ -1,7 +1,8 @@
 """Integration tests for flight log CRUD endpoints."""
 
-from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
 SAMPLE_FLIGHT = {
     "id": 1,
@@ -121,7 +122,7 @@ def test_create_flight_minimal(client):
 
 def test_create_flight_with_invalid_aircraft(client):
     """POST /api/user/flights returns 404 if aircraft_id doesn't exist."""
-    with patch("app.postgres_database.postgres_db.get_aircraft_by_id", AsyncMock(return_value=None)):
+    with patch("app.postgres_database.postgres_db.aircraft_exists", AsyncMock(return_value=False)):
         response = client.post(
             "/api/user/flights",
             json={
@@ -187,3 +188,65 @@ def test_get_flight_summary(client):
     with patch("app.postgres_database.postgres_db.get_flight_summary", AsyncMock(return_value=mock_summary)):
         response = client.get("/api/user/flights/summary")
     assert response.status_code == 200
+
+
+FOREFLIGHT_CSV = (
+    "ForeFlight Logbook Import\n"
+    "Flights Table\n"
+    "Date,AircraftID,From,To,TotalTime,DayTakeoffs\n"
+    "2026-01-03,N12345,KPWK,KUGN,1.2,1\n"
+    "2026-01-04,N12345,KUGN,KPWK,0.9,\n"
+    ",N12345,KPWK,KPWK,0.5,1\n"
+)
+
+
+def _import_conn():
+    conn = MagicMock()
+    conn.fetchrow = AsyncMock(return_value=None)
+    conn.fetch = AsyncMock(return_value=[])
+    conn.execute = AsyncMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    return conn, acquire
+
+
+def test_import_flights_inserts_valid_rows_in_one_batch(client):
+    """ForeFlight import sends every valid row to one bulk insert, with aircraft ids resolved up front."""
+    conn, acquire = _import_conn()
+    insert = AsyncMock()
+    with (
+        patch("app.postgres_database.postgres_db.acquire", acquire),
+        patch("app.routers.user_data._extract_and_import_aircraft", AsyncMock(return_value={"N12345": 7})),
+        patch("app.routers.import_history.recalculate_hours_from_flights", AsyncMock()),
+        patch("app.routers.flights._insert_flights", insert),
+    ):
+        response = client.post("/api/user/flights/import", files={"file": ("logbook.csv", FOREFLIGHT_CSV, "text/csv")})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["imported"] == 2
+    assert data["errors"] == ["Row 6: Missing required field (Date)"]
+    records = insert.await_args.args[1]
+    assert [(record[0], record[2]) for record in records] == [(7, date(2026, 1, 3)), (7, date(2026, 1, 4))]
+    assert records[1][19] == 0
+    conn.fetch.assert_not_awaited()
+
+
+def test_import_flights_reports_rows_when_batch_fails(client):
+    """A failed bulk insert is retried row by row so the bad row is reported."""
+    conn, acquire = _import_conn()
+    conn.execute = AsyncMock(side_effect=[None, Exception("numeric field overflow")])
+    with (
+        patch("app.postgres_database.postgres_db.acquire", acquire),
+        patch("app.routers.user_data._extract_and_import_aircraft", AsyncMock(return_value={"N12345": 7})),
+        patch("app.routers.import_history.recalculate_hours_from_flights", AsyncMock()),
+        patch("app.routers.flights._insert_flights", AsyncMock(side_effect=Exception("batch failed"))),
+    ):
+        response = client.post("/api/user/flights/import", files={"file": ("logbook.csv", FOREFLIGHT_CSV, "text/csv")})
+
+    data = response.json()
+    assert data["imported"] == 1
+    assert "Row 5: numeric field overflow" in data["errors"]
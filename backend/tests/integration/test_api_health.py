@@ -43,3 +43,92 @@ def test_bulk_lookup_unavailable_without_faa_db(client):
     with patch("app.main.db", None):
         response = client.post("/api/v1/aircraft/bulk", json={"tail_numbers": ["N172SP"]})
     assert response.status_code == 503
+
+
+def test_docs_pages_include_footer(client):
+    """Swagger UI and ReDoc pages are served with the FliteAxis footer."""
+    for path in ("/docs", "/redoc"):
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert 'class="api-footer"' in response.text
+
+
+def test_bulk_lookup_uses_one_batched_query(client):
+    """Bulk lookup resolves every tail number through a single Database.bulk_lookup call."""
+    from unittest.mock import MagicMock
+
+    from app.models import AircraftResponse
+
+    faa_db = MagicMock()
+    faa_db.bulk_lookup.return_value = {
+        "172SP": AircraftResponse(
+            tail_number="N172SP",
+            manufacturer="CESSNA",
+            model="172S",
+            aircraft_type="Fixed Wing Single-Engine",
+            engine_type="Reciprocating",
+            year_mfr=2005,
+        )
+    }
+    with patch("app.main.db", faa_db):
+        response = client.post(
+            "/api/v1/aircraft/bulk", json={"tail_numbers": ["N172SP", "N-99999", "N", "N0123", "NHELLO"]}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 5
+    assert data["found"] == 1
+    assert data["results"][0]["manufacturer"] == "CESSNA"
+    assert "error" not in data["results"][0]
+    assert data["results"][1] == {"tail_number": "N99999", "error": "Not found"}
+    assert [result.get("error") for result in data["results"][2:]] == ["Invalid tail number"] * 3
+    faa_db.bulk_lookup.assert_called_once_with(["172SP", "99999"])
+
+
+def test_root_serves_ui_with_etag(client):
+    """The UI page carries an ETag and answers a matching If-None-Match with 304."""
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    etag = response.headers["etag"]
+
+    cached = client.get("/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
+def test_api_requests_wait_for_startup(client):
+    """API requests get a 503 until startup has finished; health reports 'starting'."""
+    from app import main
+
+    assert client.get("/readyz").status_code == 200
+    main.READY.clear()
+    try:
+        assert client.get("/readyz").status_code == 503
+        assert client.get("/api/v1/stats").status_code == 503
+        assert client.get("/api/v1/health").json()["status"] == "starting"
+    finally:
+        main.READY.set()
+
+
+def test_bulk_lookup_rejects_invalid_body(client):
+    """Bulk lookup answers malformed or oversized bodies with 422."""
+    response = client.post("/api/v1/aircraft/bulk", json={"tail_numbers": "N172SP"})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "tail_numbers"]
+
+    response = client.post("/api/v1/aircraft/bulk", json={"tail_numbers": [f"N{i}" for i in range(51)]})
+    assert response.status_code == 422
+
+    response = client.post("/api/v1/aircraft/bulk", content=b"{not json", headers={"Content-Type": "application/json"})
+    assert response.status_code == 422
+
+
+def test_openapi_schema_is_built_during_startup(client):
+    """The OpenAPI schema is generated before the app reports ready."""
+    from app import main
+
+    assert main.app.openapi_schema is not None
+    assert client.get("/openapi.json").json()["info"]["title"] == main.app.title
@@ -0,0 +1,33 @@
+"""Unit tests for the budget comparison service."""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+from app.services import budget_service
+
+
+async def test_budget_status_sums_expenses_and_flight_costs():
+    flights = [
+        {"fuel_cost": Decimal("85.50"), "landing_fees": None, "instructor_cost": Decimal("120.00")},
+        {"rental_cost": Decimal("180.00"), "other_costs": Decimal("0.25")},
+    ]
+    with patch.multiple(
+        budget_service.postgres_db,
+        get_budget_by_id=AsyncMock(return_value={"name": "Flying", "categories": ["fuel"]}),
+        get_budget_entry=AsyncMock(return_value={"allocated_amount": Decimal("500.00")}),
+        get_expenses=AsyncMock(
+            return_value=[
+                {"category": "fuel", "amount": Decimal("40.10")},
+                {"category": "insurance", "amount": Decimal("900.00")},
+            ]
+        ),
+        get_flights=AsyncMock(return_value=flights),
+    ):
+        status = await budget_service.get_budget_status(1, date(2026, 1, 1))
+
+    assert status["actual_expenses"] == Decimal("40.10")
+    assert status["actual_flight_costs"] == Decimal("385.75")
+    assert status["total_actual"] == Decimal("425.85")
+    assert status["difference"] == Decimal("74.15")
+    assert status["is_over_budget"] is False
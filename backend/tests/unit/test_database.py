@@ -0,0 +1,79 @@
+"""Unit tests for the FAA SQLite lookup database."""
+
+import pytest
+from app.database import Database
+
+
+@pytest.fixture
+def faa_db():
+    db = Database(":memory:")
+    db.conn.executescript(
+        """
+        CREATE TABLE master (
+            n_number TEXT PRIMARY KEY, mfr_mdl_code TEXT, type_aircraft TEXT,
+            type_engine TEXT, no_eng TEXT, no_seats TEXT, year_mfr TEXT
+        );
+        CREATE TABLE acftref (
+            code TEXT PRIMARY KEY, mfr TEXT, model TEXT, series TEXT, no_eng TEXT, no_seats TEXT
+        );
+        CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT);
+        INSERT INTO acftref VALUES ('2072738', 'CESSNA', '172S', 'S', '1', '4');
+        INSERT INTO master VALUES ('172SP', '2072738', '4', '1', '1', '4', '2005');
+        INSERT INTO master VALUES ('12345', NULL, '6', '3', NULL, NULL, NULL);
+        """
+    )
+    yield db
+    db.close()
+
+
+class TestBulkLookup:
+    def test_returns_found_aircraft_keyed_by_n_number(self, faa_db):
+        result = faa_db.bulk_lookup(["172SP", "12345", "99999"])
+
+        assert set(result) == {"172SP", "12345"}
+        assert result["172SP"].manufacturer == "CESSNA"
+        assert result["172SP"].year_mfr == 2005
+        assert result["12345"].aircraft_type == "Rotorcraft"
+        assert result["12345"].manufacturer == "Unknown"
+
+    def test_matches_single_lookup(self, faa_db):
+        assert faa_db.bulk_lookup(["172SP"])["172SP"] == faa_db.lookup("172SP")
+
+    def test_duplicates_and_empty_input(self, faa_db):
+        assert list(faa_db.bulk_lookup(["172SP", "172SP"])) == ["172SP"]
+        assert faa_db.bulk_lookup([]) == {}
+
+
+def _count_queries(db):
+    """Record every statement the connection runs; returns the list it appends to."""
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    return statements
+
+
+class TestCaching:
+    def test_repeat_lookup_is_served_from_cache(self, faa_db):
+        statements = _count_queries(faa_db)
+
+        first = faa_db.lookup("172SP")
+        assert faa_db.lookup("172SP") is first
+        assert faa_db.lookup("99999") is None
+        assert faa_db.lookup("99999") is None
+
+        assert len(statements) == 2
+
+    def test_lookup_cache_is_bounded(self, faa_db, monkeypatch):
+        monkeypatch.setattr("app.database.LOOKUP_CACHE_SIZE", 1)
+
+        faa_db.lookup("172SP")
+        faa_db.lookup("12345")
+
+        assert list(faa_db._lookup_cache) == ["12345"]
+
+    def test_stats_are_cached_briefly(self, faa_db):
+        statements = _count_queries(faa_db)
+
+        assert faa_db.get_stats().record_count == 2
+        faa_db.get_stats()
+
+        assert len(statements) == 2
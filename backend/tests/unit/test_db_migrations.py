@@ -0,0 +1,234 @@
+"""Unit tests for startup schema migrations."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app import db_migrations
+from app.db_migrations import (
+    CURRENT_SCHEMA_VERSION,
+    apply_migrations,
+    get_schema_status,
+    verify_and_migrate_schema,
+)
+
+EXISTING_COLUMNS = ["flights.tail_number", "aircraft.fuel_price_per_gallon", "aircraft.fuel_burn_rate"]
+
+EXISTING_INDEXES = [
+    "idx_expense_budget_links_expense",
+    "idx_expense_budget_links_card_amount",
+    "idx_budget_cards_when_date",
+    "idx_budget_cards_category",
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_status_cache():
+    db_migrations._status_cache.clear()
+    yield
+    db_migrations._status_cache.clear()
+
+
+def _fake_db(version=0):
+    conn = MagicMock()
+    conn.fetchval = AsyncMock(return_value=version)
+    conn.fetch = AsyncMock(return_value=[])
+    conn.execute = AsyncMock()
+
+    db = MagicMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    db.acquire = acquire
+    return db, conn
+
+
+def _ddl_batch(conn):
+    """The multi-statement DDL batch sent during a migration pass."""
+    return conn.execute.await_args_list[0].args[0]
+
+
+class TestVerifyAndMigrateSchema:
+    async def test_current_version_runs_no_ddl(self):
+        db, conn = _fake_db(version=CURRENT_SCHEMA_VERSION)
+
+        assert await verify_and_migrate_schema(db) == []
+        conn.fetchval.assert_awaited_once()
+        conn.execute.assert_not_awaited()
+
+    async def test_unversioned_database_applies_all_steps_in_one_batch(self):
+        db, conn = _fake_db(version=0)
+
+        applied = await verify_and_migrate_schema(db)
+
+        assert "Added distance column to flights table" in applied
+        assert "ADD COLUMN IF NOT EXISTS distance" in _ddl_batch(conn)
+        conn.transaction.assert_called_once()
+
+    async def test_all_ddl_is_idempotent(self):
+        db, conn = _fake_db(version=0)
+
+        await verify_and_migrate_schema(db)
+
+        ddl = " ".join(c.args[0] for c in conn.execute.await_args_list)
+        assert "ADD COLUMN " not in ddl.replace("ADD COLUMN IF NOT EXISTS", "")
+        assert "CREATE INDEX " not in ddl.replace("CREATE INDEX CONCURRENTLY IF NOT EXISTS", "")
+        assert "CREATE TABLE " not in ddl.replace("CREATE TABLE IF NOT EXISTS", "")
+
+    async def test_indexes_are_built_concurrently_outside_the_batch(self):
+        db, conn = _fake_db(version=0)
+
+        await verify_and_migrate_schema(db)
+
+        assert "CREATE INDEX" not in _ddl_batch(conn)
+        index_calls = [c.args[0] for c in conn.execute.await_args_list if "CREATE INDEX" in c.args[0]]
+        assert len(index_calls) == 8
+        assert all(sql.startswith("CREATE INDEX CONCURRENTLY") for sql in index_calls)
+
+    async def test_flight_totals_trigger_is_replaceable_and_backfilled(self):
+        db, conn = _fake_db()
+        conn.fetchval = AsyncMock(side_effect=lambda sql, *args: None if "array_agg" in sql else 2)
+
+        await verify_and_migrate_schema(db)
+
+        ddl = _ddl_batch(conn)
+        assert "ADD COLUMN IF NOT EXISTS distance" not in ddl
+        assert "CREATE OR REPLACE TRIGGER flights_aircraft_totals" in ddl
+        assert "ON CONFLICT (aircraft_id) DO UPDATE" in ddl
+
+    async def test_flight_counters_are_backfilled_before_not_null(self):
+        db, conn = _fake_db()
+        conn.fetchval = AsyncMock(side_effect=lambda sql, *args: None if "array_agg" in sql else 3)
+
+        await verify_and_migrate_schema(db)
+
+        ddl = _ddl_batch(conn)
+        assert "aircraft_flight_totals" not in ddl
+        assert ddl.index("holds = COALESCE(holds, 0)") < ddl.index("ALTER COLUMN holds SET NOT NULL")
+
+    async def test_records_current_version(self):
+        db, conn = _fake_db(version=0)
+
+        await verify_and_migrate_schema(db)
+
+        assert conn.execute.await_args.args[1] == CURRENT_SCHEMA_VERSION
+
+    async def test_logs_objects_created_by_the_pass(self, caplog):
+        db, conn = _fake_db()
+        snapshots = iter([["table flights"], ["table flights", "column flights.distance"]])
+        conn.fetchval = AsyncMock(side_effect=lambda sql, *args: next(snapshots) if "array_agg" in sql else 0)
+
+        with caplog.at_level("INFO", logger="app.db_migrations"):
+            await verify_and_migrate_schema(db)
+
+        assert "Created 1 schema objects: column flights.distance" in caplog.text
+
+    async def test_invalid_index_is_dropped_before_it_is_rebuilt(self):
+        db, conn = _fake_db()
+        conn.fetchval = AsyncMock(side_effect=lambda sql, *args: None if "array_agg" in sql else 4)
+        conn.fetch = AsyncMock(return_value=[{"relname": "idx_aircraft_tail_number_upper"}])
+
+        await verify_and_migrate_schema(db)
+
+        index_ddl = [c.args[0] for c in conn.execute.await_args_list if "INDEX" in c.args[0]]
+        drop = index_ddl.index('DROP INDEX CONCURRENTLY IF EXISTS "idx_aircraft_tail_number_upper"')
+        assert index_ddl[drop + 1].startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_aircraft_tail_number_upper")
+        assert sum(sql.startswith("DROP INDEX") for sql in index_ddl) == 3  # plus the v6 and v7 drops
+
+    async def test_apply_migrations_uses_the_given_connection(self):
+        _, conn = _fake_db(version=CURRENT_SCHEMA_VERSION)
+
+        assert await apply_migrations(conn) == []
+        conn.fetchval.assert_awaited_once()
+
+
+def _catalog(indexes=EXISTING_INDEXES, columns=EXISTING_COLUMNS):
+    """fetchval side effect answering the catalog name lookups."""
+
+    def fetchval(sql, *args):
+        if "i.indisvalid" in sql:
+            return indexes
+        if "information_schema.columns" in sql:
+            return columns
+        return list(args[0])
+
+    return fetchval
+
+
+def _status_db():
+    """Fake db whose catalog contains EXISTING_COLUMNS and EXISTING_INDEXES."""
+    db, conn = _fake_db()
+    conn.fetchval = AsyncMock(side_effect=_catalog())
+    return db, conn
+
+
+class TestGetSchemaStatus:
+    async def test_reports_counts_and_nothing_missing(self):
+        db, conn = _status_db()
+        conn.fetch = AsyncMock(return_value=[{"relname": "flights", "estimate": 42}])
+
+        status = await get_schema_status(db)
+
+        assert status["tables"]["flights"] == 42
+        assert status["tables"]["reminders"] == 0
+        assert status["missing_columns"] == []
+        assert status["missing_indexes"] == []
+
+    async def test_status_is_cached_between_calls(self):
+        db, conn = _status_db()
+
+        first = await get_schema_status(db)
+        first["missing_columns"].append("mutated")
+        second = await get_schema_status(db)
+
+        assert second["missing_columns"] == []
+        conn.fetch.assert_awaited_once()
+
+    async def test_applied_migrations_clear_status_cache(self):
+        db, conn = _status_db()
+        await get_schema_status(db)
+
+        conn.fetchval = AsyncMock(return_value=0)
+        await verify_and_migrate_schema(db)
+
+        assert db_migrations._status_cache == {}
+
+    async def test_reports_missing_index(self):
+        db, conn = _status_db()
+        conn.fetchval = AsyncMock(side_effect=_catalog(indexes=["idx_budget_cards_category"]))
+
+        status = await get_schema_status(db)
+
+        assert "idx_budget_cards_when_date" in status["missing_indexes"]
+        assert "idx_budget_cards_category" not in status["missing_indexes"]
+
+    async def test_invalid_index_counts_as_missing(self):
+        db, conn = _status_db()
+
+        await get_schema_status(db)
+
+        index_sql = next(c.args[0] for c in conn.fetchval.await_args_list if "pg_index" in c.args[0])
+        assert "AND i.indisvalid" in index_sql
+
+    async def test_reports_missing_column_from_one_catalog_query(self):
+        db, conn = _status_db()
+        conn.fetchval = AsyncMock(side_effect=_catalog(columns=["flights.tail_number"]))
+
+        status = await get_schema_status(db)
+
+        assert status["missing_columns"] == ["aircraft.fuel_price_per_gallon", "aircraft.fuel_burn_rate"]
+        column_queries = [c for c in conn.fetchval.await_args_list if "information_schema.columns" in c.args[0]]
+        assert len(column_queries) == 1
+
+    async def test_exact_counts_use_one_statement(self):
+        db, conn = _status_db()
+        conn.fetchrow = AsyncMock(return_value={"flights": 7, "aircraft": 2})
+
+        status = await get_schema_status(db, exact_counts=True)
+
+        assert status["tables"] == {"flights": 7, "aircraft": 2}
+        conn.fetchrow.assert_awaited_once()
+        conn.fetch.assert_not_awaited()
+        assert 'FROM "expense_budget_links"' in conn.fetchrow.await_args.args[0]
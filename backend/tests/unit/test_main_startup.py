@@ -0,0 +1,54 @@
+"""Unit tests for the background startup in app.main."""
+
+import signal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def startup(monkeypatch):
+    """Patch startup's collaborators; returns app.main and the mocks the tests inspect."""
+    # Imported here, not at collection time, so conftest's migration patch is in place first
+    from app import main
+    from app.database import Database
+
+    init = AsyncMock()
+    faa_db = MagicMock(spec=Database)
+    kill = MagicMock()
+    monkeypatch.setattr(main, "_init_postgres", init)
+    monkeypatch.setattr(main, "_open_faa_database", AsyncMock(return_value=faa_db))
+    monkeypatch.setattr(main, "_POSTGRES_INIT_BACKOFF", 0)
+    monkeypatch.setattr(main.postgres_db, "close", AsyncMock())
+    monkeypatch.setattr(main.os, "kill", kill)
+    monkeypatch.setattr(main, "db", None)
+    monkeypatch.setattr(main, "STARTUP_ERROR", None)
+    main.READY.clear()
+    yield main, init, faa_db, kill
+    main.READY.clear()
+
+
+async def test_postgres_init_is_retried_until_it_succeeds(startup):
+    main, init, faa_db, kill = startup
+    init.side_effect = [OSError("connection refused"), None]
+
+    await main._startup()
+
+    assert init.await_count == 2
+    assert main.READY.is_set()
+    assert main.db is faa_db
+    kill.assert_not_called()
+
+
+async def test_failed_startup_closes_faa_database_and_exits(startup):
+    main, init, faa_db, kill = startup
+    init.side_effect = OSError("connection refused")
+
+    await main._startup()
+
+    assert init.await_count == main._POSTGRES_INIT_ATTEMPTS
+    assert not main.READY.is_set()
+    assert isinstance(main.STARTUP_ERROR, OSError)
+    assert main.db is None
+    faa_db.close.assert_called_once()
+    kill.assert_called_once_with(main.os.getpid(), signal.SIGTERM)
@@ -46,3 +46,17 @@ class TestNormalizeTail:
 
     def test_strips_leading_trailing_whitespace(self):
         assert normalize_tail("  N172SP  ") == "172SP"
+
+
+class TestAppNormalizeTail:
+    """The normalize_tail that app.main actually uses for FAA lookups."""
+
+    def test_strips_prefix_and_separators(self):
+        from app.main import normalize_tail as app_normalize_tail
+
+        assert app_normalize_tail(" n-172 sp ") == "172SP"
+
+    def test_keeps_second_n(self):
+        from app.main import normalize_tail as app_normalize_tail
+
+        assert app_normalize_tail("NN123") == "N123"
@@ -0,0 +1,92 @@
+"""Unit tests for API models."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from app import models
+from app.models import BudgetCardCreate, BudgetCardResponse, BudgetCardUpdate, CategoryBudgetSummary, from_row
+from pydantic import ValidationError
+
+
+def test_budget_card_remaining_amount_is_computed():
+    card = BudgetCardResponse(
+        id=1,
+        name="CIAS IFR Training",
+        category="Training",
+        frequency="monthly",
+        when_date=date(2026, 1, 1),
+        budgeted_amount=Decimal("2760.00"),
+        actual_amount=Decimal("245.00"),
+        created_at=datetime(2025, 12, 14),
+        updated_at=datetime(2025, 12, 14),
+    )
+
+    assert card.remaining_amount == Decimal("2515.00")
+    assert card.model_dump()["remaining_amount"] == Decimal("2515.00")
+
+
+def test_summary_total_remaining_is_computed():
+    summary = CategoryBudgetSummary(
+        category="Training", total_budgeted=Decimal("500"), total_actual=Decimal("620.50"), card_count=2
+    )
+
+    assert summary.model_dump()["total_remaining"] == Decimal("-120.50")
+
+
+CARD_REQUEST = {
+    "name": "Club dues",
+    "category": "Administrative",
+    "frequency": "monthly",
+    "when_date": "2026-01-01",
+    "budgeted_amount": "120.00",
+}
+
+
+def test_budget_card_requests_reject_unknown_enum_values():
+    assert BudgetCardCreate(**CARD_REQUEST, status="inactive").status == "inactive"
+    with pytest.raises(ValidationError):
+        BudgetCardCreate(**{**CARD_REQUEST, "frequency": "weekly"})
+    with pytest.raises(ValidationError):
+        BudgetCardUpdate(hourly_rate_type="damp")
+
+
+def test_budget_card_requests_bound_free_text():
+    with pytest.raises(ValidationError):
+        BudgetCardCreate(**CARD_REQUEST, notes="x" * 2001)
+    with pytest.raises(ValidationError):
+        BudgetCardUpdate(name="x" * 201)
+
+
+def test_budget_card_response_reads_long_stored_notes():
+    card = BudgetCardResponse(
+        **CARD_REQUEST,
+        notes="x" * 5000,
+        id=1,
+        actual_amount=Decimal("0"),
+        created_at=datetime(2025, 12, 14),
+        updated_at=datetime(2025, 12, 14),
+    )
+
+    assert len(card.notes) == 5000
+
+
+CATEGORY_ROW = {
+    "category": "Training",
+    "total_budgeted": Decimal("500"),
+    "total_actual": Decimal("20"),
+    "card_count": 2,
+}
+
+
+def test_from_row_validates_by_default():
+    with pytest.raises(ValidationError):
+        from_row(CategoryBudgetSummary, {**CATEGORY_ROW, "card_count": "many"})
+
+
+def test_from_row_can_skip_validation(monkeypatch):
+    monkeypatch.setattr(models, "SKIP_RESPONSE_VALIDATION", True)
+
+    summary = from_row(CategoryBudgetSummary, {**CATEGORY_ROW, "id": 9})
+
+    assert summary.model_dump() == {**CATEGORY_ROW, "total_remaining": Decimal("480")}
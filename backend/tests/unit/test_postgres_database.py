@@ -0,0 +1,303 @@
+"""Unit tests for PostgreSQL row handling that doesn't need a live database."""
+
+from contextlib import asynccontextmanager
+from datetime import date, datetime, time
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from app.postgres_database import PostgresDatabase, _serialize_flight
+
+
+def _fake_db():
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[])
+    conn.fetchrow = AsyncMock(return_value=None)
+    conn.execute = AsyncMock()
+
+    db = PostgresDatabase()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    db.acquire = acquire
+    return db, conn
+
+
+def test_serialize_flight_formats_dates_and_times():
+    row = {
+        "id": 7,
+        "date": date(2026, 1, 3),
+        "time_out": time(14, 5),
+        "time_in": None,
+        "created_at": datetime(2026, 1, 3, 18, 0),
+        "holds": 2,
+    }
+
+    flight = _serialize_flight(row)
+
+    assert flight["date"] == "2026-01-03"
+    assert flight["time_out"] == "14:05:00"
+    assert flight["time_in"] is None
+    assert flight["created_at"] == "2026-01-03T18:00:00"
+    assert flight["holds"] == 2
+    assert row["date"] == date(2026, 1, 3)
+
+
+async def test_create_expenses_bulk_uses_one_statement():
+    db, conn = _fake_db()
+    items = [
+        {"category": "fuel", "amount": Decimal("85.50"), "date": date(2025, 1, 15), "budget_card_id": 3},
+        {"category": "insurance", "amount": Decimal("120.00"), "date": date(2025, 1, 17)},
+    ]
+
+    await db.create_expenses_bulk(items)
+
+    conn.fetch.assert_awaited_once()
+    conn.execute.assert_not_awaited()
+    args = conn.fetch.await_args.args
+    assert "INSERT INTO expense_budget_links" in args[0]
+    assert args[2] == ["fuel", "insurance"]
+    assert args[13] == [3, None]
+
+
+async def test_create_expenses_bulk_skips_empty_input():
+    db, conn = _fake_db()
+
+    assert await db.create_expenses_bulk([]) == []
+    conn.fetch.assert_not_awaited()
+
+
+async def test_update_flight_reuses_sql_for_the_same_columns():
+    db, conn = _fake_db()
+
+    await db.update_flight(5, {"route": "KPWK KUGN", "total_time": Decimal("1.2"), "not_a_column": 1})
+    await db.update_flight(6, {"total_time": Decimal("0.8"), "route": "KUGN KPWK"})
+
+    first, second = conn.fetchrow.await_args_list
+    assert first.args[0] is second.args[0]
+    assert "not_a_column" not in first.args[0]
+    assert first.args[1:] == ("KPWK KUGN", Decimal("1.2"), 5)
+    assert second.args[1:] == ("KUGN KPWK", Decimal("0.8"), 6)
+
+
+async def test_update_aircraft_binds_only_provided_columns():
+    db, conn = _fake_db()
+
+    await db.update_aircraft(3, {"is_active": False, "notes": None})
+
+    sql, *params = conn.fetchrow.await_args.args
+    assert "is_active = $1" in sql
+    assert "notes" not in sql
+    assert params == [False, 3]
+
+
+async def test_update_expense_without_changes_reads_current_row():
+    db, conn = _fake_db()
+    db.get_expense_by_id = AsyncMock(return_value={"id": 4})
+
+    assert await db.update_expense(4, {"vendor": None}) == {"id": 4}
+    conn.fetchrow.assert_not_awaited()
+
+
+async def test_acquire_read_uses_primary_without_replica(monkeypatch):
+    monkeypatch.delenv("DATABASE_URL_REPLICA", raising=False)
+    db, conn = _fake_db()
+
+    async with db.acquire_read() as read_conn:
+        assert read_conn is conn
+    assert db.read_pool is None
+
+
+async def test_flight_summary_is_cached_until_a_flight_changes():
+    db, conn = _fake_db()
+    conn.fetchrow = AsyncMock(return_value={"total_flights": 3})
+
+    first = await db.get_flight_summary(start_date=date(2026, 1, 1))
+    first["total_flights"] = 99
+    assert await db.get_flight_summary(start_date=date(2026, 1, 1)) == {"total_flights": 3}
+    assert conn.fetchrow.await_count == 1
+
+    await db.delete_flight(4)
+    await db.get_flight_summary(start_date=date(2026, 1, 1))
+    assert conn.fetchrow.await_count == 2
+
+
+async def test_summary_read_from_replica_is_not_cached():
+    db, conn = _fake_db()
+    db.replica_url = "postgresql://replica/truehour"
+    db.acquire_read = db.acquire
+    conn.fetchrow = AsyncMock(return_value={"total_flights": 3})
+
+    await db.get_flight_summary()
+    await db.get_flight_summary()
+    await db.get_expense_summary()
+    await db.get_expense_summary()
+
+    assert conn.fetchrow.await_count == 2
+    assert conn.fetch.await_count == 2
+    assert db._summary_cache == {}
+
+
+async def test_summary_computed_across_a_write_is_not_cached():
+    db, conn = _fake_db()
+
+    async def fetch(*args):
+        db.invalidate_summaries()
+        return [{"group_name": "Fuel", "count": 1}]
+
+    conn.fetch = AsyncMock(side_effect=fetch)
+
+    await db.get_expense_summary()
+    await db.get_expense_summary()
+    assert conn.fetch.await_count == 2
+
+
+async def test_pool_release_skips_reset_query(monkeypatch):
+    create_pool = AsyncMock()
+    monkeypatch.setattr("app.postgres_database.asyncpg.create_pool", create_pool)
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+
+    await PostgresDatabase().connect()
+    await create_pool.await_args.kwargs["reset"](conn)
+
+    conn.execute.assert_not_awaited()
+
+
+async def test_get_expenses_joins_budget_links_only_when_asked():
+    db, conn = _fake_db()
+
+    await db.get_expenses()
+    await db.get_expenses(include_budget_link=True)
+
+    plain, linked = (c.args[0] for c in conn.fetch.await_args_list)
+    assert "expense_budget_links" not in plain
+    assert "LEFT JOIN expense_budget_links" in linked
+
+
+async def test_budget_categories_bind_as_a_text_array():
+    db, conn = _fake_db()
+    conn.fetchrow = AsyncMock(return_value={"id": 1, "categories": ["fuel", "rental"]})
+
+    budget = await db.create_budget(
+        {"name": "Flying", "budget_type": "monthly", "amount": Decimal("500"), "categories": ["fuel", "rental"]}
+    )
+
+    sql, *params = conn.fetchrow.await_args.args
+    assert "to_jsonb($6::text[])" in sql
+    assert params[5] == ["fuel", "rental"]
+    assert budget["categories"] == ["fuel", "rental"]
+
+
+async def test_budget_card_sums_links_without_grouping():
+    db, conn = _fake_db()
+    conn.fetchrow = AsyncMock(return_value=None)
+
+    await db.get_budget_card(7)
+
+    sql = conn.fetchrow.await_args.args[0]
+    assert "bc.*" not in sql
+    assert "bc.actual_amount" not in sql
+    assert "COALESCE((SELECT SUM(amount) FROM expense_budget_links WHERE budget_card_id = bc.id), 0)" in sql
+    assert "GROUP BY" not in sql
+
+
+async def test_annual_summary_loads_cards_in_one_query():
+    db, _ = _fake_db()
+    db.get_monthly_budget_summary = AsyncMock(
+        return_value=[
+            {"month": date(2026, 1, 1), "total_budgeted": Decimal("100"), "total_actual": Decimal("0")},
+            {"month": date(2026, 3, 1), "total_budgeted": Decimal("50"), "total_actual": Decimal("20")},
+        ]
+    )
+    db.get_category_budget_summary = AsyncMock(return_value=[])
+    db.get_budget_cards = AsyncMock(
+        return_value=[
+            {"id": 2, "when_date": date(2026, 3, 15)},
+            {"id": 1, "when_date": date(2026, 1, 1)},
+        ]
+    )
+
+    summary = await db.get_annual_budget_summary(2026)
+
+    db.get_budget_cards.assert_awaited_once_with(year=2026)
+    assert [[c["id"] for c in m["cards"]] for m in summary["by_month"]] == [[1], [2]]
+    assert summary["total_budgeted"] == Decimal("150")
+
+
+async def test_annual_summary_without_cards_skips_card_query():
+    db, _ = _fake_db()
+    db.get_monthly_budget_summary = AsyncMock(return_value=[])
+    db.get_category_budget_summary = AsyncMock(return_value=[{"category": "Training"}])
+    db.get_budget_cards = AsyncMock()
+
+    summary = await db.get_annual_budget_summary(2026, include_cards=False)
+
+    db.get_budget_cards.assert_not_awaited()
+    assert summary["by_category"] == [{"category": "Training"}]
+
+
+async def test_budget_card_filters_bind_in_order():
+    db, conn = _fake_db()
+
+    await db.get_budget_cards(category="Training", year=2026)
+    await db.get_budget_cards(category="Family", year=2025)
+
+    first, second = conn.fetch.await_args_list
+    assert "bc.category = $1" in first.args[0]
+    assert "EXTRACT(YEAR FROM bc.when_date) = $2" in first.args[0]
+    assert "bc.status =" not in first.args[0]
+    assert first.args[1:] == ("Training", 2026)
+    assert second.args[0] is first.args[0]
+
+
+async def test_update_budget_sets_only_provided_columns():
+    db, conn = _fake_db()
+    conn.fetchrow = AsyncMock(return_value={"id": 5})
+
+    await db.update_budget(5, {"categories": ["fuel"], "notes": None, "is_active": False})
+
+    sql, *params = conn.fetchrow.await_args.args
+    assert "categories = to_jsonb($1::text[]), is_active = $2" in sql
+    assert "notes" not in sql.split("RETURNING")[0]
+    assert "jsonb_array_elements_text" in sql
+    assert params == [["fuel"], False, 5]
+
+
+async def test_update_budget_card_can_clear_a_column():
+    db, conn = _fake_db()
+    conn.execute = AsyncMock(return_value="UPDATE 1")
+
+    assert await db.update_budget_card(9, {"aircraft_id": None, "name": "Checkride", "ignored": 1})
+
+    sql, *params = conn.execute.await_args.args
+    assert "SET aircraft_id = $1, name = $2, updated_at = NOW()" in sql
+    assert "WHERE id = $3" in sql
+    assert params == [None, "Checkride", 9]
+
+
+async def test_pool_keeps_idle_connections_and_their_statements(monkeypatch):
+    create_pool = AsyncMock()
+    monkeypatch.setattr("app.postgres_database.asyncpg.create_pool", create_pool)
+
+    await PostgresDatabase().connect()
+
+    kwargs = create_pool.await_args.kwargs
+    assert kwargs["max_inactive_connection_lifetime"] == 0
+    assert kwargs["max_cached_statement_lifetime"] == 0
+
+
+async def test_budget_summary_is_cached_until_a_link_changes():
+    db, conn = _fake_db()
+    conn.fetch = AsyncMock(return_value=[{"category": "Training", "total_actual": Decimal("10")}])
+    conn.fetchval = AsyncMock(return_value=3)
+
+    first = await db.get_category_budget_summary(2026)
+    first[0]["total_actual"] = Decimal("0")
+    second = await db.get_category_budget_summary(2026)
+    await db.create_expense_budget_link({"expense_id": 1, "budget_card_id": 2, "amount": Decimal("5")})
+    await db.get_category_budget_summary(2026)
+
+    assert second == [{"category": "Training", "total_actual": Decimal("10")}]
+    assert conn.fetch.await_count == 2
@@ -246,6 +246,12 @@ CREATE TABLE training_goals (
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Schema version applied by backend/app/db_migrations.py
+CREATE TABLE schema_migrations (
+    version INTEGER PRIMARY KEY,
+    applied_at TIMESTAMPTZ DEFAULT NOW()
+);
+
 -- Indexes for performance
 CREATE INDEX idx_flights_date ON flights(date DESC);
 CREATE INDEX idx_flights_aircraft ON flights(aircraft_id);